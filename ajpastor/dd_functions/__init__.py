@@ -4,10 +4,25 @@ Package dd_functions
 In this package the user may find the following subpackages:
 * ddFunctions: ddFunctions and ddRings
 * ddExamples: examples of DDFunctions
+* exampleCache: bounded and persistent cache for the examples of DDFunctions
 * symbolic: code for treating with Symbolic Expressions
 * toDiffAlgebraic: include methods for treat with algebraic properties of DDFunctions
 * lazyDDRing: and implementation of a DDRing with lazy elements
 
+The subpackages are not loaded when importing this package: each one is imported the first time
+one of its objects is requested. In the same way, the pre-defined rings ``DFinite``, ``DDFinite``,
+``DFiniteP`` and ``DFiniteI`` are built the first time they are used. A "star" import loads
+everything.
+
+EXAMPLES::
+
+    sage: import sys
+    sage: import ajpastor.dd_functions as dd_functions
+    sage: dd_functions.DFinite
+    DD-Ring over (Univariate Polynomial Ring in x over Rational Field)
+    sage: 'ajpastor.dd_functions.ddExamples' in sys.modules
+    False
+
 AUTHORS:
 
     - Antonio Jimenez-Pastor (2016-10-01): initial version
@@ -24,26 +39,60 @@ AUTHORS:
 #                  https://www.gnu.org/licenses/
 # ****************************************************************************
 
-try:
-    from .ddFunction import *
-except Exception:
-    print("Error loading module dd_functions.ddFunction")
-try:
-    from .ddExamples import *
-except Exception:
-    print("Error loading module dd_functions.ddExamples")
-try:
-    from .symbolic import *
-except Exception:
-    print("Error loading module dd_functions.symbolic")
-try:
-    from .toDiffAlgebraic import *
-except Exception:
-    print("Error loading module dd_functions.toDiffAlgebraic")
-try:
-    from .lazyDDRing import *
-except Exception:
-    print("Error loading module dd_functions.lazyDDRing")
+from importlib import import_module
+
+# Subpackages in the order they are searched for a name
+_SUBMODULES = ["ddFunction", "ddExamples", "symbolic", "toDiffAlgebraic", "lazyDDRing"]
+_LOADED = {} # name of subpackage -> module (or None if it could not be loaded)
+
+def __load(submodule):
+    r'''
+        Method that imports a subpackage, returning ``None`` if it can not be loaded.
+    '''
+    if(not submodule in _LOADED):
+        try:
+            _LOADED[submodule] = import_module("%s.%s" %(__name__, submodule))
+        except Exception:
+            print("Error loading module dd_functions.%s" %submodule)
+            _LOADED[submodule] = None
+    return _LOADED[submodule]
+
+def __exported(module):
+    r'''
+        Method that returns the names a "star" import of a subpackage provides.
+    '''
+    names = getattr(module, "__all__", None)
+    if(names is None):
+        names = [name for name in vars(module) if not name.startswith('_')]
+    else:
+        names = list(names) + list(getattr(module, "_STANDARD_RINGS", []))
+    return names
+
+def __getattr__(name):
+    r'''
+        Module attribute hook (see :pep:`562`): the subpackages are loaded when one of their objects is requested.
+    '''
+    if(name == "__all__"): # "star" import: all the subpackages are loaded
+        result = []
+        for submodule in _SUBMODULES:
+            module = __load(submodule)
+            if(not module is None):
+                result += [el for el in __exported(module) if not el in result]
+        globals()["__all__"] = result
+        return result
+    elif(name.startswith('_') or name in _SUBMODULES):
+        raise AttributeError("module %s has no attribute %s" %(__name__, name))
+
+    for submodule in _SUBMODULES:
+        module = __load(submodule)
+        if((not module is None) and name in __exported(module)):
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+    raise AttributeError("module %s has no attribute %s" %(__name__, name))
+
+def __dir__():
+    return sorted(set(globals()) | set(__getattr__("__all__")))
 
 from pkgutil import extend_path
 __path__ = extend_path(__path__, __name__)
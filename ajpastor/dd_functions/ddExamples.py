@@ -13,6 +13,9 @@ When possible, the functions returned by this module are associated with
 the usual implementation of those functions in Sage, (see the module :mod:`~ajpastor.dd_functions.symbolic`
 for further information).
 
+The functions built in this module are kept in a bounded cache that can also be stored on disk (see the
+module :mod:`~ajpastor.dd_functions.exampleCache`).
+
 This module includes lots of examples and test that should be always checked to run completely. The identities
 checked in these tests can all be found in the literature of `here <https://fungrim.org/>`_.
         
@@ -102,8 +105,8 @@ AUTHORS:
 # ****************************************************************************
 
 # Sage imports
-from sage.all import (cached_function, factorial, bell_polynomial, NumberField, QQ, ZZ, pi,
-                        sqrt, sin, cos, gamma, prod, PolynomialRing, Matrix, vector, lcm, SR,
+from sage.all import (factorial, bell_polynomial, NumberField, QQ, ZZ, pi,
+                        sqrt, sin, cos, gamma, prod, PolynomialRing, PowerSeriesRing, Matrix, vector, lcm, SR,
                         ideal)
 from sage.all_cmdline import x
 
@@ -114,9 +117,11 @@ from sage.categories.pushout import pushout, FractionField
 # ajpastor imports
 from ajpastor.dd_functions import (is_DDFunction, is_DDRing, DDRing, ParametrizedDDRing, DFinite, DDFinite)
 from ajpastor.dd_functions.exceptions import ZeroValueRequired
+from ajpastor.dd_functions.exampleCache import EXAMPLES_CACHE, example_cache
 from ajpastor.dd_functions.lazyDDRing import LazyDDRing
 from ajpastor.misc.dynamic_string import DynamicString
 from ajpastor.misc.matrix import matrix_of_dMovement as move
+from ajpastor.misc.sequence_manipulation import HypergeometricSequence
 
 ##################################################################################
 ##################################################################################
@@ -125,7 +130,7 @@ from ajpastor.misc.matrix import matrix_of_dMovement as move
 ###
 ##################################################################################
 ##################################################################################
-@cached_function
+@example_cache
 def Sin(input, ddR = None):
     r'''
         D-finite implementation of the Sine function (`\sin(x)`).
@@ -227,6 +232,14 @@ def Sin(input, ddR = None):
             sage: Sin(x^4).init(20, True) == [sin(x^4).derivative(i)(x=0) for i in range(20)]
             True
 
+        When the input is a :class:`~ajpastor.dd_functions.ddFunction.DDFunction`, the equation
+        is obtained directly with the chain rule (no composition of operators is computed)::
+
+            sage: Sin(Sin(x)).init(10, True) == [sin(sin(x)).derivative(i)(x=0) for i in range(10)]
+            True
+            sage: Sin(Exp(x)-1) == Sin(x)(Exp(x)-1)
+            True
+
         This method can throw some error when the input evaluates to something different than zero::
 
             sage: Sin(x+1)
@@ -239,7 +252,7 @@ def Sin(input, ddR = None):
             ZeroValueRequired: required a zero value for exp(x)
     '''
     if(is_DDFunction(input)):
-        return Sin(x)(input)
+        return __chain_rule(Sin(x), input, name="sin(_1)")
     f,dR = __decide_parent(input, ddR)
     
     evaluate = lambda p : dR.sequence(p,0)
@@ -255,10 +268,10 @@ def Sin(input, ddR = None):
     
     sol = dR.element([df**3 ,-df2,df],[0,evaluate(df),evaluate(df2)], name=DynamicString("sin(_1)", newName))
     if(not sol.is_fully_defined):
-        return Sin(x)(input)
+        return __chain_rule(Sin(x), f, dR, name="sin(_1)")
     return sol
 
-@cached_function    
+@example_cache
 def Cos(input, ddR = None):
     r'''
         D-finite implementation of the Cosine function (`\cos(x)`).
@@ -357,7 +370,7 @@ def Cos(input, ddR = None):
             ZeroValueRequired: required a zero value for exp(x)
     '''
     if(is_DDFunction(input)):
-        return Cos(x)(input)
+        return __chain_rule(Cos(x), input, name="cos(_1)")
     f,dR = __decide_parent(input, ddR)
     
     evaluate = lambda p : dR.sequence(p,0)
@@ -373,10 +386,10 @@ def Cos(input, ddR = None):
     
     sol = dR.element([df**3 ,-df2,df], [1,0,-evaluate(df)**2 ], name=DynamicString("cos(_1)",newName))
     if(not sol.is_fully_defined):
-        return Cos(x)(input)
+        return __chain_rule(Cos(x), f, dR, name="cos(_1)")
     return sol
     
-@cached_function
+@example_cache
 def Tan(input, ddR = None):
     '''
         DD-finite implementation of the Tangent function (`tan(x)`).
@@ -447,7 +460,7 @@ def Tan(input, ddR = None):
             ....:         print(p)
     '''
     if(is_DDFunction(input)):
-        return Tan(x)(input)
+        return __chain_rule(Tan(x), input, coefficients=lambda g : [-2, 0, Cos(g)**2], name="tan(_1)")
     g, dR = __decide_parent(input, ddR,2 )
     
     
@@ -481,7 +494,7 @@ def Tan(input, ddR = None):
     result._DDFunction__name = DynamicString("tan(_1)",newName)
     return result
 
-@cached_function    
+@example_cache
 def Sinh(input, ddR = None):
     r'''
         D-finite implementation of the Hyperbolic Sine function (`\sinh(x)`).
@@ -555,7 +568,7 @@ def Sinh(input, ddR = None):
             True
     '''
     if(is_DDFunction(input)):
-        return Sinh(x)(input)
+        return __chain_rule(Sinh(x), input, name="sinh(_1)")
     f,dR = __decide_parent(input, ddR)
     
     evaluate = lambda p : dR.sequence(p,0)
@@ -571,7 +584,7 @@ def Sinh(input, ddR = None):
     
     return dR.element([-df**3 ,-df2,df],[0,evaluate(df),evaluate(df2)], name=DynamicString("sinh(_1)",newName))
 
-@cached_function    
+@example_cache
 def Cosh(input, ddR = None):
     r'''
         D-finite implementation of the Hyperbolic Cosine function (`\cosh(x)`).
@@ -645,7 +658,7 @@ def Cosh(input, ddR = None):
             True
     '''
     if(is_DDFunction(input)):
-        return Cosh(x)(input)
+        return __chain_rule(Cosh(x), input, name="cosh(_1)")
     f,dR = __decide_parent(input, ddR)
     
     evaluate = lambda p : dR.sequence(p,0)
@@ -661,7 +674,7 @@ def Cosh(input, ddR = None):
     
     return dR.element([-df**3 ,-df2,df],[1,0,evaluate(df)**2 ], name=DynamicString("cosh(_1)", newName))
 
-@cached_function
+@example_cache
 def Tanh(input, ddR = None):
     r'''
         DD-finite implementation of the Hyperbolic Tangent function (`\tanh(x)`).
@@ -724,7 +737,7 @@ def Tanh(input, ddR = None):
             True
     '''
     if(is_DDFunction(input)):
-        return Tanh(x)(input)
+        return __chain_rule(Tanh(x), input, coefficients=lambda g : [2, 0, Cosh(g)**2], name="tanh(_1)")
     g, dR = __decide_parent(input, ddR,2 )
     
     
@@ -758,7 +771,7 @@ def Tanh(input, ddR = None):
     result._DDFunction__name = DynamicString("tanh(_1)",newName)
     return result
 
-@cached_function
+@example_cache
 def Arcsin(input, ddR = None):
     r'''
         D-finite implementation of the inverse sine function (`\arcsin(x)`).
@@ -817,7 +830,7 @@ def Arcsin(input, ddR = None):
             True
     '''
     if(is_DDFunction(input)):
-        return Arcsin(x)(input)
+        return __chain_rule(Arcsin(x), input, name="arcsin(_1)")
     g, dR = __decide_parent(input, ddR)
         
     evaluate = lambda p : dR.sequence(p,0)
@@ -850,7 +863,7 @@ def Arcsin(input, ddR = None):
     
     return result
 
-@cached_function
+@example_cache
 def Arccos(input, ddR = None):
     r'''
         D-finite implementation of the inverse cosine function (`\arccos(x)`).
@@ -919,7 +932,7 @@ def Arccos(input, ddR = None):
             True
     '''
     if(is_DDFunction(input)):
-        return Arccos(x)(input)
+        return __chain_rule(Arccos(x), input, name="arccos(_1)")
     g, dR = __decide_parent(input, ddR)
     dR = ParametrizedDDRing(dR, 'pi'); pi = dR.parameter('pi')
         
@@ -953,7 +966,7 @@ def Arccos(input, ddR = None):
     
     return result
 
-@cached_function
+@example_cache
 def Arctan(input, ddR = None):
     r'''
         D-finite implementation of the inverse tangent function (`\arctan(x)`).
@@ -1013,7 +1026,7 @@ def Arctan(input, ddR = None):
             True
     '''
     if(is_DDFunction(input)):
-        return Arctan(x)(input)
+        return __chain_rule(Arctan(x), input, name="arctan(_1)")
     g, dR = __decide_parent(input, ddR)
         
     evaluate = lambda p : dR.sequence(p,0)
@@ -1046,7 +1059,7 @@ def Arctan(input, ddR = None):
     result._DDFunction__name = DynamicString("arctan(_1)",newName)
     return result
 
-@cached_function 
+@example_cache
 def Arcsinh(input, ddR = None):
     '''
         TODO: GO on here
@@ -1064,7 +1077,7 @@ def Arcsinh(input, ddR = None):
         This function can be converted into symbolic expressions.
     '''
     if(is_DDFunction(input)):
-        return Arcsinh(x)(input)
+        return __chain_rule(Arcsinh(x), input, name="arcsinh(_1)")
     g, dR = __decide_parent(input, ddR)
         
     evaluate = lambda p : dR.sequence(p,0)
@@ -1096,7 +1109,7 @@ def Arcsinh(input, ddR = None):
     
     return result
 
-@cached_function
+@example_cache
 def Arccosh(input, ddR = None):
     '''
         DD-finite implementation of the hyperbolic Arccosine function (arccosh(x)).
@@ -1113,7 +1126,7 @@ def Arccosh(input, ddR = None):
         This function can be converted into symbolic expressions.
     '''
     if(is_DDFunction(input)):
-        return Arccosh(x)(input)
+        return __chain_rule(Arccosh(x), input, name="arccosh(_1)")
     g, dR = __decide_parent(input, ddR)
     dR = dR.extend_base_field(NumberField(x**2+1, name='I')); I = dR.coeff_field.gens()[0]
     dR = ParametrizedDDRing(dR, 'pi'); pi = dR.parameter('pi')
@@ -1147,7 +1160,7 @@ def Arccosh(input, ddR = None):
     
     return result
 
-@cached_function 
+@example_cache
 def Arctanh(input, ddR = None):
     '''
         DD-finite implementation of the hyperbolic Arctangent function (arctanh(x)).
@@ -1164,7 +1177,7 @@ def Arctanh(input, ddR = None):
         This function can be converted into symbolic expressions.
     '''
     if(is_DDFunction(input)):
-        return Arctanh(x)(input)
+        return __chain_rule(Arctanh(x), input, name="arctanh(_1)")
     g, dR = __decide_parent(input, ddR)
         
     evaluate = lambda p : dR.sequence(p,0)
@@ -1203,7 +1216,7 @@ def Arctanh(input, ddR = None):
 ###
 ##################################################################################
 ##################################################################################   
-@cached_function  
+@example_cache
 def Log(input, ddR = None):
     '''
         DD-finite implementation of the Logarithm function (ln(x)).
@@ -1220,7 +1233,7 @@ def Log(input, ddR = None):
         This function can be converted into symbolic expressions.
     '''
     if(is_DDFunction(input)):
-        return Log(x+1)(input-1)
+        return __chain_rule(Log1(x), input-1, name="log(_1+1)")
     f,dR = __decide_parent(input, ddR)
     
     evaluate = lambda p : dR.sequence(p,0)
@@ -1236,7 +1249,7 @@ def Log(input, ddR = None):
     
     return dR.element([0,df**2 -df2*f,df*f],[0,evaluate(df), evaluate(df2)-evaluate(df)**2 ], name=DynamicString("log(_1)",newName))
     
-@cached_function 
+@example_cache
 def Log1(input, ddR = None):
     '''
         DD-finite implementation of the shifted Logarithm function (ln(x+1)). It is equivalent to Log(input+1).
@@ -1253,7 +1266,7 @@ def Log1(input, ddR = None):
         This function can be converted into symbolic expressions.
     '''
     if(is_DDFunction(input)):
-        return Log1(x)(input)
+        return __chain_rule(Log1(x), input, name="log(_1+1)")
     f,dR = __decide_parent(input, ddR)
     
     evaluate = lambda p : dR.sequence(p,0)
@@ -1271,7 +1284,7 @@ def Log1(input, ddR = None):
     
     return dR.element([0,df**2 -df2*f1,df*f1],[0,evaluate(df), evaluate(df2)-evaluate(df)**2 ], name=DynamicString("log(_1+1)", newName))
     
-@cached_function 
+@example_cache
 def Exp(input, ddR = None):
     '''
         DD-finite implementation of the Exponential function (exp(x)).
@@ -1288,7 +1301,7 @@ def Exp(input, ddR = None):
         This function can be converted into symbolic expressions.
     '''
     if(is_DDFunction(input)):
-        return Exp(x)(input)
+        return __chain_rule(Exp(x), input, name="exp(_1)")
     f,dR = __decide_parent(input, ddR)
     
     evaluate = lambda p : dR.sequence(p,0)
@@ -1310,7 +1323,7 @@ def Exp(input, ddR = None):
 ##################################################################################    
 ##### BESSEL TYPE FUNCTIONS
 ### Bessel Functions
-@cached_function 
+@example_cache
 def BesselD(input = 'P', kind = 1):
     '''
         DD-finite implementation of the Bessel functions (J_n(x), Y_n(x)).
@@ -1348,6 +1361,8 @@ def BesselD(input = 'P', kind = 1):
         if(par in ZZ):
             alpha = ZZ(par)
             func = func.change_init_values([0 for i in range(alpha)] + [ZZ(1)/ZZ(2) **alpha, 0, -((alpha+ZZ(2))/(ZZ(2) **(alpha+2)))], name = func._DDFunction__name)
+            if(alpha >= 0): # closed formula: (-1)^k/(k!(k+alpha)!2^(2k+alpha))
+                func.set_sequence_oracle(HypergeometricSequence([1/(ZZ(2)**alpha*factorial(alpha)), 0], [], [2-alpha, 2+alpha], -1, alpha))
     elif(kind == 2 ):
         func = parent.element([x**2-par**2, x, x**2], name=DynamicString("bessel_Y(_1,_2)", [repr(par),"x"]))
     else:
@@ -1356,7 +1371,7 @@ def BesselD(input = 'P', kind = 1):
     return func
     
 ### Struve's functions
-@cached_function
+@example_cache
 def StruveD(mu='P',kind=1):
     '''
         DD-finite implementation of the Struve functions (J_n(x), Y_n(x)).
@@ -1435,7 +1450,7 @@ def __first_derivative_associated_legendre(n,m,kind):
 
     return res
 
-@cached_function 
+@example_cache
 def LegendreD(nu='n', mu = 0, kind=1):
     r'''
         D-finite implementation of the Legendre functions (P_n(x) and Q_n(x))
@@ -1523,10 +1538,13 @@ def LegendreD(nu='n', mu = 0, kind=1):
         coeffs = [n*(n+1)*(1-x**2) - m**2, -2*x*(1-x**2), (1-x**2)**2]
      
     ## Returning the final element
-    return parent.element(coeffs, init, name=name)
+    result = parent.element(coeffs, init, name=name)
+    if(m == 0 and len(init) == 2): # closed formula: c_{k+2} = (k-n)(k+n+1)/((k+1)(k+2)) c_k
+        result.set_sequence_oracle(HypergeometricSequence(init, [-n, n+1], [1, 2]))
+    return result
    
 ### Chebyshev Polynomials        
-@cached_function    
+@example_cache
 def ChebyshevD(input='n', kind = 1, poly=True):
     r'''
         D-finite implementation of the Chebyshev polynomials (T_n(x), U_n(x))
@@ -1600,6 +1618,9 @@ def ChebyshevD(input='n', kind = 1, poly=True):
     else:
         raise ValueError("Only Chebyshev polynomials of first, second, third and fourth kind are implemented. Got %s" %kind)
     
+    ## Closed formula for the coefficients: c_{k+2} = (k-n)(k+n+2(kind-1))/((k+1)(k+2)) c_k
+    numerator = [-n, n + 2*(kind-1)]
+    
     ## Building the initial values
     init = []
     if(n in ZZ):
@@ -1619,12 +1640,14 @@ def ChebyshevD(input='n', kind = 1, poly=True):
                 init = [-1/init[1], 0]
      
     ## Returning the final element
-    return parent.element(coeffs, init, name=name)
+    result = parent.element(coeffs, init, name=name)
+    if(kind in (1,2) and len(init) == 2):
+        result.set_sequence_oracle(HypergeometricSequence(init, numerator, [1, 2]))
+    return result
 
 ###### HYPERGEOMETRIC FUNCTIONS
 ### Hypergeometric Functions
-__CACHED_HYPERGEOMETRIC = {}
-@cached_function
+@example_cache
 def HypergeometricFunction(a='a',b='b',c='c', init = 1):
     '''
         D-finite implementation of the Gauss Hypergeometric function
@@ -1713,8 +1736,9 @@ def GenericHypergeometricFunction(num=[],den=[],init=1):
     numerator = tuple(numerator); denominator = tuple(denominator)
     
     ## Checking the function is cached
-    global __CACHED_HYPERGEOMETRIC
-    if(not((numerator,denominator,initial) in __CACHED_HYPERGEOMETRIC)):
+    key = ("GenericHypergeometricFunction", (numerator,denominator,initial))
+    result = EXAMPLES_CACHE.get(key)
+    if(result is None):
         ## Building differential operator
         # Lambda method to get the operator in the appropriate operator ring
         get_op = lambda p : destiny_ring.operator_class(destiny_ring.base(),p,destiny_ring.base_derivation)
@@ -1728,34 +1752,37 @@ def GenericHypergeometricFunction(num=[],den=[],init=1):
         f = destiny_ring.element(op)
         
         if(initial == 1):
-            __CACHED_HYPERGEOMETRIC[(numerator,denominator,initial)] = f.change_init_values([1],name=DynamicString("hypergeometric(_1,_2,_3)", [str(numerator),str(denominator),"x"]))
+            result = f.change_init_values([1],name=DynamicString("hypergeometric(_1,_2,_3)", [str(numerator),str(denominator),"x"]))
         else:
-            __CACHED_HYPERGEOMETRIC[(numerator,denominator,initial)] = f.change_init_values([initial],name=DynamicString("(_1)*(hypergeometric(_2,_3,_4))", [str(initial),str(numerator),str(denominator),"x"]))
+            result = f.change_init_values([initial],name=DynamicString("(_1)*(hypergeometric(_2,_3,_4))", [str(initial),str(numerator),str(denominator),"x"]))
+        ## Closed formula for the coefficients: initial*(a_1)_n...(a_p)_n/(n!(b_1)_n...(b_q)_n)
+        result.set_sequence_oracle(HypergeometricSequence([initial], list(numerator), list(denominator)+[1]))
+        EXAMPLES_CACHE.put(key, result)
         
     ## Return the cached element
-    return __CACHED_HYPERGEOMETRIC[(numerator,denominator,initial)]
+    return result
 
-@cached_function
+@example_cache
 def F00():
     return GenericHypergeometricFunction((),())
 
-@cached_function
+@example_cache
 def F10(a='a'):
     return GenericHypergeometricFunction((a),())
 
-@cached_function
+@example_cache
 def F01(b='b'):
     return GenericHypergeometricFunction((),(b))
 
-@cached_function
+@example_cache
 def F11(a='a',b='b'):
     return GenericHypergeometricFunction((a),(b))
 
-@cached_function
+@example_cache
 def F21(a='a',b='b',c='c'):
     return HypergeometricFunction(a,b,c)
     
-@cached_function
+@example_cache
 def PolylogarithmD(s=1):
     '''
         Implementation using DDFunctions of the Polylogarithms
@@ -1784,11 +1811,12 @@ def PolylogarithmD(s=1):
     Li_x = DFinite.element(final_eq, [ZZ(1)/(n**s) *factorial(n-1) for n in range(1,s+1)])
     result = Li_x*x
     result._DDFunction__name = DynamicString("Li(_1;_2)", [str(s), "x"])
+    result.set_sequence_oracle(HypergeometricSequence([1], s*[0], s*[1], 1, 1)) # closed formula: 1/n^s
     return result
     
 ###### RICCATI DIFFERENTIAL EQUATION
 ### Basic Riccati differential equation
-@cached_function
+@example_cache
 def RiccatiD(a,b,c,init=None, ddR = None, full = False, name="w"):
     '''
         Implementation using DDFunctions of the solutions for the Riccati differential equation.
@@ -1846,7 +1874,7 @@ def RiccatiD(a,b,c,init=None, ddR = None, full = False, name="w"):
     
 ###### MATHIEU TYPE FUNCTIONS
 ### Mathieu's Functions
-@cached_function
+@example_cache
 def MathieuD(a='a',q='q',init=()):
     '''
         DD-finite implementation of the Mathieu function
@@ -1881,7 +1909,7 @@ def MathieuD(a='a',q='q',init=()):
     
     return destiny_ring.element([ra-2 *rq*Cos(2 *x), 0, 1], rinit, name=DynamicString("Mathieu(_1,_2;_3)(_4)", [repr(ra),repr(rq),str(rinit[:2 ]),repr(x)]))
 
-@cached_function
+@example_cache
 def MathieuSin(a='a',q='q'):
     '''
         DD-finite implementation of the Mathieu Sine function.
@@ -1896,7 +1924,7 @@ def MathieuSin(a='a',q='q'):
     '''
     return MathieuD(a,q,(0,1))
     
-@cached_function
+@example_cache
 def MathieuCos(a='a',q='q'):
     '''
         DD-finite implementation of the Mathieu Cosine function.
@@ -1912,7 +1940,7 @@ def MathieuCos(a='a',q='q'):
     return MathieuD(a,q,(1,0))
 
 ### Modified Mathieu's Functions
-@cached_function
+@example_cache
 def MathieuH(a='a',q='q',init=()):
     '''
         DD-finite implementation of the Modified Mathieu functions.
@@ -1946,7 +1974,7 @@ def MathieuH(a='a',q='q',init=()):
     
     return destiny_ring.element([-ra-2 *rq*Cosh(2 *x), 0, 1], rinit, name=DynamicString("MathieuH(_1,_2;_3)(_4)", [repr(ra),repr(rq),str(rinit[:2 ]),repr(x)]))
 
-@cached_function
+@example_cache
 def MathieuSinh(a='a',q='q'):
     '''
         DD-finite implementation of the Modified Mathieu functions.
@@ -1960,7 +1988,7 @@ def MathieuSinh(a='a',q='q'):
     '''
     return MathieuH(a,q,(0,1))
     
-@cached_function
+@example_cache
 def MathieuCosh(a='a',q='q'):
     '''
         DD-finite implementation of the Modified Mathieu functions.
@@ -1975,7 +2003,7 @@ def MathieuCosh(a='a',q='q'):
     return MathieuH(a,q,(1,0))
 
 ### Hill's equation
-@cached_function
+@example_cache
 def HillD(a='a',q='q',init=()):
     '''
         DD-finite implementation of the Hill equation.
@@ -2028,7 +2056,7 @@ def HillD(a='a',q='q',init=()):
 
 ###### AIRY TYPE FUNCTIONS
 ### Airy's functions
-@cached_function
+@example_cache
 def AiryD(init=('a','b')):
     r'''
         D-finite implementation of the Airy's functions (Ai(x), Bi(x)).
@@ -2132,7 +2160,7 @@ def AiryD(init=('a','b')):
 
 ###### PARABOLIC-CYLINDER TYPE FUNCTIONS
 ### Parabolic Cylinder Functions
-@cached_function
+@example_cache
 def ParabolicCylinderD(a='a',b='b',c='c', init=()):
     '''
         D-finite implementation of Parabolic Cylinder functions.
@@ -2227,7 +2255,7 @@ def EllipticLegendreD(kind,var='phi'):
         
 ###### SPHEROIDAL WAVE FUNCTIONS
 ## Generalized (or Coulomb) Spheroidal Differential Equation
-@cached_function
+@example_cache
 def CoulombSpheroidalFunctionD(a='a', b='b', c='c', d='d', kind = 1, init=()):
     '''
         D-finite implementation of the Coulomb spheroidal function 
@@ -2273,7 +2301,7 @@ def CoulombSpheroidalFunctionD(a='a', b='b', c='c', d='d', kind = 1, init=()):
         coeffs[0] -= rd*(rd+1)*(1-x**2)
     return destiny_ring.element(coeffs, init, name=DynamicString("CoulombSpheroidal(_1,_2,_3,_4;%d;%s)(_5)" %(kind,init), [repr(ra), repr(rb), repr(rc), repr(rd), "x"]))
 
-@cached_function
+@example_cache
 def SpheroidalWaveFunctionD(a='a', b='b', c='c', init=()):
     '''
         D-finite implementation of the spheroidal wave function.
@@ -2312,7 +2340,7 @@ def SpheroidalWaveFunctionD(a='a', b='b', c='c', init=()):
 
 ###### HEUN FUNCTIONS
 ### Fuchsian equation
-@cached_function
+@example_cache
 def FuchsianD(a = (), q = (), init=(), parent=QQ):
     r'''
         Representation of Fuchsian differential equations.
@@ -2570,7 +2598,7 @@ def FCoulombD(m='m', l='l'):
 ###
 ##################################################################################
 ################################################################################## 
-@cached_function
+@example_cache
 def FactorialD():
     r'''
         DDFunction of the generating function for the factorial sequence.
@@ -2604,9 +2632,9 @@ def FactorialD():
             sage: fa.init(10, True) == [factorial(i)^2 for i in range(10)]
             True
     '''
-    return DFinite.element([1,3*x-1,x**2],[1], name=DynamicString("Fa(_1)", ["x"]))
+    return DFinite.element([1,3*x-1,x**2],[1], name=DynamicString("Fa(_1)", ["x"])).set_sequence_oracle(HypergeometricSequence([1], [1]))
 
-@cached_function
+@example_cache
 def CatalanD():
     r'''
         DDFunction of the generating function for the Catalan numbers.
@@ -2656,9 +2684,9 @@ def CatalanD():
             sage: x*C^2 + 1 == C # algebraic relation
             True
     '''
-    return DFinite.element([2, 10*x-2, 4*x**2-x], [1,1], name=DynamicString("C(_1)", ["x"]))
+    return DFinite.element([2, 10*x-2, 4*x**2-x], [1,1], name=DynamicString("C(_1)", ["x"])).set_sequence_oracle(HypergeometricSequence([1], [ZZ(1)/ZZ(2)], [2], 4))
 
-@cached_function
+@example_cache
 def FibonacciD(init=('a','b')):
     r'''
         A :class:`~ajpastor.dd_functions.ddFunction.DDFunction` for the generating function of a Fibonacci-type sequence.
@@ -2748,7 +2776,7 @@ def FibonacciD(init=('a','b')):
     f.name = DynamicString("F(_1,_2;_3)", [str(rinit[0]),str(rinit[1]),"x"])
     return f
     
-@cached_function
+@example_cache
 def BellD():
     r'''
         DDFunction of the exponential generating function for the Bell numbers.
@@ -2789,7 +2817,7 @@ def BellD():
     f = DFinite.element([-1,1],[-1], name = DynamicString("-exp(_1)", ["x"])) # -exp(x)
     return DDFinite.element([f, 1], [1], name=DynamicString("B(_1)", ["x"]))
     
-@cached_function
+@example_cache
 def BernoulliD():
     r'''
         DDFunction of the exponential generating function for the Bernoulli numbers.
@@ -3101,6 +3129,84 @@ def polynomial_inverse(polynomial):
 ###
 ##################################################################################
 ##################################################################################    
+def __chain_rule(f, g, ddR = None, coefficients = None, name = None):
+    '''
+        This method computes the composition f(g) when f satisfies a linear differential equation
+        of order 1 or 2, without using the closure property of composition.
+        
+        If f satisfies the equation a_2(x)f'' + a_1(x)f' + a_0(x)f = 0, the chain rule shows that
+        h = f(g) satisfies the equation
+        
+            a_2(g)g' h'' + (a_1(g)g'^2 - a_2(g)g'')h' + a_0(g)g'^3 h = 0,
+            
+        and for order 1 (a_1(x)f' + a_0(x)f = 0) the equation a_1(g)h' + a_0(g)g' h = 0. The initial
+        values are obtained composing the power series of f and g (see __compose_series).
+        
+        INPUT:
+    - f: a DDFunction whose equation has order 1 or 2.
+    - g: a DDFunction or an element of the base of 'ddR' with g(0) = 0.
+    - ddR: the DDRing of the result. If None, it is computed as in DDFunction.compose (only valid when 
+            'g' is a DDFunction).
+    - coefficients: a method that receives g and returns the coefficients a_i(g) (for example, when 
+            the coefficients of f are not polynomials). By default, the coefficients of f are evaluated at g.
+    - name: a template for the name of the result where '_1' will be the name of g.
+    '''
+    equation = f.equation
+    if(equation.order() > 2):
+        raise TypeError("The chain rule is only implemented for equations of order 1 or 2")
+    
+    ## Computing the destiny ring
+    dR = ddR
+    if(dR is None):
+        if(not is_DDFunction(g)):
+            raise TypeError("A DDRing is required for the composition with %s" %repr(g))
+        dR = pushout(f.parent(), g.parent()).to_depth(f.parent().depth()+g.parent().depth())
+    newName = repr(g)
+    if(hasattr(g, "_DDFunction__name") and (not(g._DDFunction__name is None))):
+        newName = g._DDFunction__name
+    if(dR.sequence(dR.base()(g),0) != 0):
+        raise ZeroValueRequired(repr(g))
+    g = dR.base()(g)
+    
+    ## Computing the new linear differential operator
+    if(coefficients is None):
+        variable = str(f.parent().variables(True)[0])
+        coefficients = lambda g : [coeff(**{variable : g}) for coeff in equation.coefficients()]
+    a = [dR.base()(coeff) for coeff in coefficients(g)]
+    dg = dR.base_derivation(g)
+    if(len(a) == 2):
+        newOperator = dR.element([a[0]*dg, a[1]]).equation
+    else:
+        ddg = dR.base_derivation(dg)
+        newOperator = dR.element([a[0]*dg**3, a[1]*dg**2 - a[2]*ddg, a[2]*dg]).equation
+        
+    ## Computing the initial values required
+    required = newOperator.get_jp_fo()+1
+    if(is_DDFunction(g)):
+        sequence_g = g.sequence(required, True)
+    else:
+        sequence_g = [dR.sequence(g,i) for i in range(required)]
+    newInit = __compose_series(f.sequence(required, True), sequence_g, required, dR.base_ring())
+    
+    if(not name is None):
+        name = DynamicString(name, newName)
+    return dR.element(newOperator, newInit, name=name)
+    
+def __compose_series(f, g, n, field):
+    '''
+        This method computes the first n initial values of the composition f(g) given the first n 
+        coefficients of the power series f and g (where g(0) = 0).
+        
+        The composition is computed with Horner's scheme over power series truncated at order n, 
+        which avoids the Bell polynomials in Faa di Bruno's formula.
+    '''
+    S = PowerSeriesRing(field, 't', default_prec=n)
+    g = S(list(g[:n]), prec=n)
+    result = S.zero().add_bigoh(n)
+    for i in range(n-1, -1, -1):
+        result = (result*g + f[i]).add_bigoh(n)
+    return [factorial(i)*result[i] for i in range(n)]
+
 def __decide_parent(input, parent = None, depth = 1):
     '''            
         This method is an auxiliary method that decides the parent associated
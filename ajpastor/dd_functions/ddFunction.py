@@ -34,6 +34,8 @@ AUTHORS:
 # Python imports
 import warnings
 import logging
+import weakref
+from contextlib import contextmanager
 from functools import reduce
 
 #SAGE imports 
@@ -138,6 +140,8 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
             * ``invertibility``: method. This method checks if an element of ``base`` is invertible or not.
             * ``derivation``: method. This method computes the derivative of elements in ``base``.
             * ``default_operator``: class. Class inheriting from :class:`~ajpastor.operator.Operator` for the differential equations.
+              The class :class:`~ajpastor.operator.adaptiveOperator.AdaptiveOperator` chooses the implementation for each
+              closure property depending on the size of the equations.
 
         More formally, ``(base,derivation)`` is a differential integral domain and ``(self, self.derivative)`` a differential extension.
 
@@ -175,8 +179,19 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
         ("default_operator", _Default_Operator)]
     
     _CACHED_DD_RINGS = {} # Variable for cached DDRings (Unique Representation idea)
+    __resolved = None # Cache for coercions and pushouts with other parents (see _cached_resolution)
+    _Resolved_Bound = 128 # Maximal number of parents stored in the cache of each DDRing
     
     _Default_variable = 'x' # Static name for the default variable
+
+    _Validation_Policies = ("eager", "deferred", "sampled", "off") # Valid policies for checking initial values
+    _Default_Validation = "eager" # Default policy for checking initial values (see DDRing.set_validation)
+    _Validation_Override = None # Policy set with the context manager validation_policy
+    _Validation_Sample = 10 # with the "sampled" policy, one out of these constructions is checked
+    __validation = None # policy of each ring (see DDRing.set_validation)
+    __pending = None # weak references to functions with a deferred check of the initial values
+    __pending_bound = 64 # size of the list of pending functions that triggers the removal of dead references
+    __sampled = 0 # number of constructions with the "sampled" policy
     
     #################################################
     ### Static methods
@@ -441,6 +456,28 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
     #################################################
     ### Coercion methods
     #################################################
+    def _cached_resolution(self, kind, S, method):
+        r'''
+            Method that memoizes the coercion and pushout computations between ``self`` and other parents.
+
+            The result of ``method(S)`` is stored with the identity of `S`. The cache keeps `S` alive, so 
+            its identity can not be reused by a different parent. At most ``_Resolved_Bound`` results are
+            kept: the oldest ones are removed first.
+
+            INPUT:
+                * ``kind``: a string identifying the computation (e.g., ``"coerce"`` or ``"pushout"``).
+                * ``S``: a parent structure of Sage.
+                * ``method``: the method that computes the result for `S`.
+        '''
+        if(self.__resolved is None):
+            self.__resolved = {}
+        key = (kind, id(S))
+        if(not key in self.__resolved):
+            result = method(S)
+            _bounded_insert(self.__resolved, key, (S, result), self._Resolved_Bound)
+            return result
+        return self.__resolved[key][1]
+
     def _coerce_map_from_(self, S):
         r'''
             Method to get the coerce map from the Sage structure `S` (if possible).
@@ -448,7 +485,14 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
             To allow the algebraic numbers, we use the method :func:`DDRing.__get_gens__` to compare how the ring `S` and
             the ring ``self`` where built. If at some point we can not use the behavior of the generators, we 
             will rely on the usual function :func:`DDRing._coerce_map_from_` with ``self.base()``.
+
+            The result is cached for each `S` (see :func:`_cached_resolution`).
         '''
+        if(S is self):
+            return True
+        return self._cached_resolution("coerce", S, self.__coerce_map_from)
+
+    def __coerce_map_from(self, S):
         ## Checking the easy cases
         coer = None
         if(isinstance(S, DDRing)):
@@ -517,6 +561,7 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
             OUTPUT:
 
             A :class:`DDRing` or :class:`ParametrizedDDRing` such that contains all the elements in ``self`` and `S`.
+            The result is cached for each `S` (see :func:`_cached_resolution`).
                 
             WARNINGS:
                 * A warning will pop up if we merge rings with the same parameter names.
@@ -538,6 +583,11 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
         '''        
         if(S is SR):
             return None
+        elif(S is self):
+            return self
+        return self._cached_resolution("pushout", S, self.__pushout)
+
+    def __pushout(self, S):
             
         ## We get a list of the generators of self and S with their types
         gens_self, pself = DDRing.__get_gens__(self)
@@ -555,7 +605,7 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
         ## Computing the original field
         F = None
         try:
-            F = pushout(pself, pS)
+            F = _pushout(pself, pS)
         except:
             pass
         if(F is None):
@@ -1178,9 +1228,9 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
                 sage: DFiniteP.extend_base_field(Qi)
                 DD-Ring over (Univariate Polynomial Ring in x over Number Field in I with defining polynomial x^2 + 1) with parameter (P)
         '''
-        return DDRing(pushout(self.original_ring(), new_field), 
+        return DDRing(_pushout(self.original_ring(), new_field), 
         depth = self.depth(), 
-        base_field = pushout(self.coeff_field, new_field), 
+        base_field = _pushout(self.coeff_field, new_field), 
         invertibility = self.__base_invertibility, 
         derivation = self.base_derivation, 
         default_operator = self.operator_class)
@@ -1256,6 +1306,145 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
         return self.__default_operator
 
     operator_class = property(default_operator, None) #: alias for method :func:`~DDRing.default_operator`
+
+    def validation(self):
+        r'''
+            Getter for the policy used to check the initial values of the new elements of ``self``.
+
+            The policy is decided as follows: the policy set by :func:`validation_policy` (if we are inside 
+            such context), the policy of ``self`` (see :func:`set_validation`) or the default policy for all
+            the :class:`DDRing` (``"eager"``).
+
+            EXAMPLES::
+
+                sage: from ajpastor.dd_functions import *
+                sage: from ajpastor.dd_functions.ddFunction import validation_policy
+                sage: DFinite.validation()
+                'eager'
+                sage: with validation_policy("off"):
+                ....:     DFinite.validation()
+                'off'
+        '''
+        if(not DDRing._Validation_Override is None):
+            return DDRing._Validation_Override
+        if(not self.__validation is None):
+            return self.__validation
+        return DDRing._Default_Validation
+
+    def set_validation(self, policy):
+        r'''
+            Method to set the policy for checking the initial values of new elements of ``self``.
+
+            When a :class:`DDFunction` is built with :func:`element`, the initial values are checked to be
+            compatible with the differential equation. This requires computing several coefficients of the 
+            function and the recursion matrix of the equation, which is expensive when many functions are built
+            from trusted data (for example, data stored on disk or computed from other functions). The valid
+            policies are:
+
+            * ``"eager"``: the initial values are checked when the function is built.
+            * ``"deferred"``: the initial values are checked the first time the coefficients of the function are
+              used. The pending checks can be run together with :func:`validate_pending`.
+            * ``"sampled"``: only one out of ``DDRing._Validation_Sample`` functions is checked when built.
+            * ``"off"``: the initial values are never checked.
+
+            INPUT:
+
+            * ``policy``: one of the valid policies or ``None`` to use the default policy.
+
+            EXAMPLES::
+
+                sage: from ajpastor.dd_functions import *
+                sage: R = DDRing(PolynomialRing(QQ, 'y'))
+                sage: R.set_validation("deferred")
+                sage: f = R.element([1,0,1],[1,0,1]) # the initial values are not valid
+                sage: f.sequence(3)
+                Traceback (most recent call last):
+                ...
+                InitValueError: There is no such function satisfying ...
+                sage: f.sequence(3)
+                Traceback (most recent call last):
+                ...
+                InitValueError: There is no such function satisfying ...
+                sage: R.set_validation(None)
+        '''
+        if(not policy is None and not policy in DDRing._Validation_Policies):
+            raise ValueError("The validation policy must be one of %s" %(DDRing._Validation_Policies,))
+        self.__validation = policy
+
+    def _register_pending(self, function):
+        r'''
+            Method to remember a function with a deferred check for its initial values (see :func:`validate_pending`).
+        '''
+        if(self.__pending is None):
+            self.__pending = []
+        elif(len(self.__pending) >= self.__pending_bound): # removing collected and already checked functions
+            self.__pending = [ref for ref in self.__pending if (not ref() is None) and ref()._is_pending()]
+            self.__pending_bound = max(DDRing.__pending_bound, 2*len(self.__pending))
+        self.__pending.append(weakref.ref(function))
+
+    def validate_pending(self):
+        r'''
+            Method that checks all the pending initial values of the elements of ``self``.
+
+            The functions built with the policy ``"deferred"`` (see :func:`set_validation`) check their initial 
+            values the first time their coefficients are required. This method runs all these checks at once, 
+            sharing the recursion matrices among the functions with the same differential equation.
+
+            OUTPUT:
+
+            The number of functions that were checked. If some initial values are not valid, an 
+            :class:`~ajpastor.dd_functions.exceptions.InitValueError` is raised.
+
+            EXAMPLES::
+
+                sage: from ajpastor.dd_functions import *
+                sage: from ajpastor.dd_functions.ddFunction import validation_policy
+                sage: with validation_policy("deferred"):
+                ....:     functions = [DFinite.element([-1,1],[i]) for i in range(10)]
+                sage: DFinite.validate_pending()
+                10
+                sage: DFinite.validate_pending()
+                0
+        '''
+        pending = [ref() for ref in (self.__pending or [])]
+        self.__pending = None
+        groups = {}
+        for function in pending:
+            if(function is None or not function._is_pending()):
+                continue
+            try:
+                key = tuple(function.equation.coefficients())
+                hash(key)
+            except TypeError: # not hashable coefficients: no sharing
+                key = id(function)
+            groups[key] = groups.get(key, []) + [function]
+
+        for functions in groups.values():
+            matrices = {}
+            for function in functions:
+                function._check_init(matrices)
+        return sum(len(functions) for functions in groups.values())
+
+    def _validation_for_element(self, check_init):
+        r'''
+            Method that decides the policy for checking the initial values of a new element.
+
+            The argument ``check_init`` of :func:`element` can be a boolean (``True`` for using the policy of
+            ``self`` and ``False`` to avoid the checking) or a valid policy.
+        '''
+        if(check_init is True):
+            policy = self.validation()
+        elif(check_init is False or check_init is None):
+            return "off"
+        elif(check_init in DDRing._Validation_Policies):
+            policy = check_init
+        else:
+            raise ValueError("The validation policy must be one of %s" %(DDRing._Validation_Policies,))
+
+        if(policy == "sampled"):
+            self.__sampled += 1
+            return "eager" if (self.__sampled % DDRing._Validation_Sample == 1) else "off"
+        return policy
     
     def is_invertible(self,x):
         r'''
@@ -1299,7 +1488,9 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
                   in the field given by :func:`~DDRing.base_ring`.
                 * ``inhomogeneous``: element on ``self`` that will denote the inhomogeneous term in the differential
                   equation.
-                * ``check_init``: boolean value to check that initial conditions are valid or not.
+                * ``check_init``: boolean value to check that initial conditions are valid or not. If ``True``,
+                  the policy of ``self`` is used (see :func:`set_validation`). It can also be one of the
+                  valid policies for checking the initial values.
                 * ``name``: optional argument for providing a name to the new built function.
 
             OUTPUT:
@@ -1484,7 +1675,80 @@ class DDRing (Ring_w_Sequence, IntegralDomain, SerializableObject):
         
         ## Returning the resulting function
         return sum(x**i*functions[i] for i in range(m))
-        
+
+    def linear_combination(self, functions, coefficients=None):
+        r'''
+            Method to compute a linear combination of several functions in ``self``.
+
+            Given `f_1(x),\ldots,f_k(x)` in ``self`` and constants `c_1,\ldots,c_k`, this method
+            computes the function
+
+            .. MATH::
+
+                c_1f_1(x) + \ldots + c_kf_k(x).
+
+            Instead of adding the functions one by one (where each addition requires a new
+            computation of a differential equation), this method computes the differential equation
+            for the final function at once (see method :func:`~ajpastor.operator.operator.Operator.add_many_solution`)
+            and the initial values with one linear combination of the initial values of the input.
+
+            INPUT:
+                * ``functions``: list of the functions `f_1(x),\ldots,f_k(x)`.
+                * ``coefficients``: list of constants `c_1,\ldots,c_k` in :func:`~DDRing.coeff_field`.
+                  If not given, we consider all of them to be `1`.
+
+            OUTPUT:
+
+            The :class:`DDFunction` for `c_1f_1(x) + \ldots + c_kf_k(x)`.
+
+            ERRORS:
+                * :class:`TypeError` is raised if any of the functions can not be casted to ``self``.
+                * :class:`ValueError` is raised if the number of coefficients and functions do not match.
+
+            EXAMPLES::
+
+                sage: from ajpastor.dd_functions import *
+                sage: f = DFinite.element([-1,1],[1])
+                sage: g = DFinite(1/(1-x))
+                sage: h = DFinite.element([1,0,1],[0,1])
+                sage: DFinite.linear_combination([f,g,h], [1,2,-3]) == f + 2*g - 3*h
+                True
+                sage: DFinite.linear_combination([f,g,f]) == 2*f + g
+                True
+                sage: DFinite.linear_combination([f,g], [0,0])
+                0
+        '''
+        functions = [self(el) for el in functions]
+        if(coefficients is None):
+            coefficients = len(functions)*[1]
+        if(len(coefficients) != len(functions)):
+            raise ValueError("The number of coefficients (%d) and functions (%d) must match" %(len(coefficients), len(functions)))
+        coefficients = [self.coeff_field(el) for el in coefficients]
+
+        ## Removing the trivial summands
+        summands = [(coefficients[i], functions[i]) for i in range(len(functions)) if (coefficients[i] != 0 and not functions[i].is_null)]
+        if(len(summands) == 0):
+            return self.zero()
+        elif(len(summands) == 1):
+            return summands[0][1].scalar(summands[0][0])
+        coefficients = [el[0] for el in summands]; functions = [el[1] for el in summands]
+
+        ## Computing the operator for all the functions at once
+        equations = [f.equation for f in functions]
+        newOperator = equations[0].add_many_solution(*equations[1:])
+
+        ## Getting the needed initial values for the solution
+        needed_initial = newOperator.get_jp_fo()+1
+        inits = [f.init(needed_initial, True, True) for f in functions]
+        n = min(len(el) for el in inits)
+        newInit = vector(self.coeff_field, coefficients)*Matrix(self.coeff_field, [el[:n] for el in inits])
+
+        result = self.element(newOperator, list(newInit), check_init=False)
+        names = ['x%d' %(i+1) for i in range(len(functions))]
+        result.built = ("polynomial", (sum(coefficients[i]*gen for i,gen in enumerate(PolynomialRing(self.coeff_field, names).gens())),
+                                        {names[i] : functions[i] for i in range(len(functions))}))
+        return result
+
     def variables(self, as_symbolic=False):
         r'''
             Method that returns all the variables for ``self``.
@@ -1691,6 +1955,8 @@ class ParametrizedDDRing(DDRing):
             sage: R is DFiniteP
             True
     '''
+    _CACHED_PARAMETRIZED = {} # Variable for cached ParametrizedDDRings (by base ring and names of parameters)
+
     @staticmethod
     def __classcall__(cls, *args, **kwds):
         r'''
@@ -1701,6 +1967,9 @@ class ParametrizedDDRing(DDRing):
             exact differentially definable rings.
 
             This implemention mimics the behavior of the class :class:`UniqueRepresentation`.
+
+            The rings are also cached by the identity of the base ring and the names of the 
+            parameters, so building again the same ring does not normalize the arguments.
         '''
         ## In order to call the __classcall__ of DDRing we treat the arguments received
         base_ddRing = args[0]
@@ -1709,6 +1978,11 @@ class ParametrizedDDRing(DDRing):
         else:
             parameters = kwds.get('parameters',None)
         names = kwds.get('names',None)
+
+        ## Checking if we already built this ring
+        key = ParametrizedDDRing.__key(base_ddRing, parameters if names is None else (names if parameters is None else None))
+        if(not key is None and key in ParametrizedDDRing._CACHED_PARAMETRIZED):
+            return ParametrizedDDRing._CACHED_PARAMETRIZED[key][1]
         
         ## Using the "names" approach of SAGE
         if(parameters is None and names is None):
@@ -1760,7 +2034,22 @@ class ParametrizedDDRing(DDRing):
             
         ring.__init__(base_ddRing, parameters)
         ring.set_sargs(*args, **kwds)
+        if(not key is None):
+            ParametrizedDDRing._CACHED_PARAMETRIZED[key] = (args[0], ring) # keeping alive the base ring
         return ring
+
+    @staticmethod
+    def __key(base_ddRing, parameters):
+        r'''
+            Method that computes the key for the cache of :class:`ParametrizedDDRing` (``None`` if the arguments are not valid).
+        '''
+        if(parameters is None):
+            return None
+        if(not type(parameters) in (tuple, list, set)):
+            parameters = [parameters]
+        if(len(parameters) == 0 or any(not (type(el) == str or type(el) == Expression) for el in parameters)):
+            return None
+        return (id(base_ddRing), tuple(sorted(set(str(el) for el in parameters))))
         
     def __init__(self, base_ddRing, parameters):
         '''
@@ -1786,6 +2075,11 @@ class ParametrizedDDRing(DDRing):
             the ring ``self`` where built. If at some point we can not use the behavior of the generators, we 
             will rely on the function in the base :class:`DDRing`.
         '''
+        if(S is self):
+            return True
+        return self._cached_resolution("parametrized coerce", S, self.__coerce_map_from)
+
+    def __coerce_map_from(self, S):
         coer = super(ParametrizedDDRing, self)._coerce_map_from_(S)
         if(not(coer)):
             coer = self.__baseDDRing._coerce_map_from_(S)
@@ -2078,7 +2372,8 @@ class DDFunction (IntegralDomainElement, SerializableObject):
         * ``check_init``: optional boolean argument to determine whether to check in the building
           the initial values provided. This is recommended to be used, but in some instances, 
           where we know that there is a solution with the initial values given by ``init_values``,
-          such as when applying closure properties.
+          such as when applying closure properties. It can also be a policy for checking the initial
+          values (see :func:`DDRing.set_validation`). If ``True``, the policy of ``parent`` is used.
         * ``name``: in order to make objects easier to print and read, we can set a fixed name
           for a function that will be used when the method :func:`repr` is called.
 
@@ -2110,6 +2405,59 @@ class DDFunction (IntegralDomainElement, SerializableObject):
         * Add examples where we use the dict input for ``init``
         * Add examples with inhomogeneous term
     '''
+    ### Default values for the caches of the functions. They are only stored in the 
+    ### instance when they are computed, so each function only allocates what it uses.
+    __pows = None # Powers-cache
+    __derivative = None # The derivative of a function
+    __simple_derivative = None # The simple derivative of a function
+    __name = None
+    __built = None
+    __zeros = None
+    __singularities = None
+    __computed = None
+    __chyzak = None
+    __oracle = None
+    __pending_check = None # number of initial values to check when the check was deferred
+    __invalid_init = None # error found when checking the initial values (see _check_init)
+
+    _Weak_References = False # if True, provenance and caches do not keep other functions alive
+
+    @staticmethod
+    def set_weak_references(weak=True):
+        r'''
+            Method to decide whether the functions keep weak references to other functions.
+
+            Each :class:`DDFunction` remembers how it was built (see :func:`built`) and caches its
+            derivative and its powers. By default, these are strong references, so a long chain of
+            computations keeps alive all the intermediate functions (with all their computed sequences).
+            With weak references, the memory follows the functions that are actually used: when a
+            referenced function has been collected, the provenance is forgotten (:func:`built` returns ``None``)
+            and the derivatives and powers are computed again when requested.
+
+            This only affects the functions built after calling this method.
+
+            INPUT:
+
+            * ``weak``: boolean value (``True`` by default) to use weak references.
+
+            EXAMPLES::
+
+                sage: from ajpastor.dd_functions import *
+                sage: from ajpastor.dd_functions.ddFunction import DDFunction
+                sage: import gc
+                sage: DDFunction.set_weak_references()
+                sage: f = DFinite.element([-1,1],[1]); g = DFinite.element([1,0,1],[0,1])
+                sage: h = f + g; h.built[0]
+                'polynomial'
+                sage: del f, g; _ = gc.collect()
+                sage: h.built is None
+                True
+                sage: h.derivative() == h.derivative()
+                True
+                sage: DDFunction.set_weak_references(False)
+        '''
+        DDFunction._Weak_References = weak
+
     @staticmethod
     def __chyzak_dac(A, s, p, v, K=QQ, x='x'):
         r'''
@@ -2221,11 +2569,6 @@ class DDFunction (IntegralDomainElement, SerializableObject):
         if(not inhomogeneous in parent):
             raise TypeError("The inhomogeneous term must be an element of parent (%s)" %inhomogeneous)
 
-        ## Initializing the serializable structure
-        SerializableObject.__init__(self, parent, equation, init=init, inhomogeneous=inhomogeneous, name=name)
-        ##     input -> equation (list)
-        ##     init -> inits (dictionary)
-        ##     inhomogeneous -> inhom (element in self.parent())
 
         ## Checking the equation: if the equation is the zero equation --> error
         zero = False
@@ -2245,16 +2588,9 @@ class DDFunction (IntegralDomainElement, SerializableObject):
                 if(any(inits[n] != 0 for n in inits)):
                     raise InitValueError("Incompatible equation (%s) and initial values (%s)" %(input, inits))
         
-        ### Definition for Cached elements
-        self.__pows = {0 :1 , 1 :self} # Powers-cache
-        self.__derivative = None # The derivative of a function
-        self.__simple_derivative = None # The simple derivative of a function
-        self.__name = name
-        self.__built = None
-        self.__zeros = None
-        self.__singularities = None
-        self.__computed = None
-        self.__chyzak = {}
+        ### Definition for Cached elements (see the default values in the class)
+        if(not name is None):
+            self.__name = name
         
         ### Assigning the differential operator
         ### We will save the leading coefficient of the equation (lc) to future uses.
@@ -2279,7 +2615,7 @@ class DDFunction (IntegralDomainElement, SerializableObject):
             to_check = max(n_init, len(inits))
             
             ## Getting the matrix of the current equation
-            M = Matrix(field, self.equation.get_recursion_matrix(to_check-1 -self.equation.forward_order))
+            M = self.equation.get_recursion_matrix(to_check-1 -self.equation.forward_order).change_ring(field)
             v = vector(field, inhom.sequence(M.nrows(), True))
             
             ## Solving the system MX = v
@@ -2320,16 +2656,55 @@ class DDFunction (IntegralDomainElement, SerializableObject):
         #################################################################################
         ### Managing the initial values
         self.__sequence = {n : self.parent().coeff_field(str(inits[n]))/factorial(n) for n in inits}
-        if(check_init):
-            m = max([n for n in inits], default=0)+1
-            if(m >= self.equation.get_recursion_matrix(0).ncols()): # if we have enough data to check
-                try:
-                    initSequence = self.sequence(m, True)
-                except TypeError as exception: # Catching the impossibility to compute initial values
-                    raise InitValueError("Error getting initial values").with_traceback(exception.__traceback__)
-                M = self.equation.get_recursion_matrix(len(initSequence)-self.equation.forward_order-1)
-                if(M*vector(initSequence) != 0 ):
-                    raise InitValueError("There is no such function satisfying %s with initial values %s"%(self.equation,inits))     
+        policy = parent._validation_for_element(check_init)
+        if(policy != "off"):
+            self.__pending_check = max([n for n in inits], default=0)+1
+            if(policy == "eager"):
+                self._check_init()
+            else:
+                parent._register_pending(self)
+
+    def _is_pending(self):
+        r'''
+            Method that checks whether the initial values of ``self`` have not been checked yet.
+        '''
+        return not self.__pending_check is None
+
+    def _check_init(self, matrices=None):
+        r'''
+            Method that checks the initial values of ``self`` with its differential equation.
+
+            INPUT:
+
+            * ``matrices``: optional dictionary to share the recursion matrices among functions with 
+              the same differential equation (see :func:`DDRing.validate_pending`).
+        '''
+        m = self.__pending_check
+        if(m is None): # nothing to check
+            return
+        self.__pending_check = None # avoiding the check while computing the sequence
+        try:
+            self.__check_init(m, matrices)
+        except InitValueError as error: # the function is marked as invalid
+            self.__invalid_init = error
+            raise
+
+    def __check_init(self, m, matrices):
+        inits = {n : self.__sequence[n]*factorial(n) for n in self.__sequence if n < m}
+        if(m >= self.equation.get_recursion_matrix(0).ncols()): # if we have enough data to check
+            try:
+                initSequence = self.sequence(m, True)
+            except TypeError as exception: # Catching the impossibility to compute initial values
+                raise InitValueError("Error getting initial values").with_traceback(exception.__traceback__)
+            size = len(initSequence)-self.equation.forward_order-1
+            if(matrices is None or not size in matrices):
+                M = self.equation.get_recursion_matrix(size)
+                if(not matrices is None):
+                    matrices[size] = M
+            else:
+                M = matrices[size]
+            if(M*vector(initSequence) != 0 ):
+                raise InitValueError("There is no such function satisfying %s with initial values %s"%(self.equation,inits))
             
     def __buildOperator(self, coeffs):
         r'''
@@ -2497,7 +2872,13 @@ class DDFunction (IntegralDomainElement, SerializableObject):
                 []
 
         '''
+        if(not self.__invalid_init is None): # the initial values were not valid
+            raise self.__invalid_init
+        if(not self.__pending_check is None): # deferred check of the initial values
+            self._check_init()
         if(list):
+            if(not self.__oracle is None):
+                self.__sequence_from_oracle(0, n)
             if(incomplete):
                 result = []
                 for i in range(n):
@@ -2511,11 +2892,69 @@ class DDFunction (IntegralDomainElement, SerializableObject):
         if(n < 0):
             return 0 # only considering formal power series
 
+        if(not self.__oracle is None):
+            self.__sequence_from_oracle(n, n+1)
         while(not n in self.__sequence):
             self.extend_sequence()
         
         return self.__sequence[n]
 
+    def set_sequence_oracle(self, oracle):
+        r'''
+            Method to set a closed form for the coefficients of ``self``.
+
+            Some functions (like the hypergeometric functions) have a known formula for their
+            coefficients. This method allows to use it instead of unrolling the recurrence given 
+            by the differential equation (see :func:`extend_sequence`). The oracle is only used 
+            by ``self``: the functions built from ``self`` use again the recurrence.
+
+            INPUT:
+
+            * ``oracle``: a callable that receives `n` and returns the `n`-th coefficient of ``self``
+              or ``None`` to remove the oracle. If it has a method ``block``, then ``oracle.block(start, stop)``
+              is used to compute several consecutive coefficients at once (see 
+              :class:`~ajpastor.misc.sequence_manipulation.HypergeometricSequence`).
+
+            OUTPUT:
+
+            The function ``self``.
+
+            EXAMPLES::
+
+                sage: from ajpastor.dd_functions import *
+                sage: from ajpastor.misc.sequence_manipulation import HypergeometricSequence
+                sage: f = DFinite.element([-1,1],[1]).set_sequence_oracle(HypergeometricSequence([1],[],[1]))
+                sage: f.sequence(1000) == 1/factorial(1000)
+                True
+                sage: f.sequence_oracle() is None
+                False
+        '''
+        self.__oracle = oracle
+        return self
+
+    def sequence_oracle(self):
+        r'''
+            Method that returns the closed form for the coefficients of ``self`` (see :func:`set_sequence_oracle`).
+        '''
+        return self.__oracle
+
+    def __sequence_from_oracle(self, start, stop):
+        r'''
+            Method that fills the coefficients from ``start`` to ``stop`` using the oracle of ``self``.
+        '''
+        missing = [i for i in range(start, stop) if not i in self.__sequence]
+        if(len(missing) == 0):
+            return
+        start = missing[0]; stop = missing[-1]+1
+        if(hasattr(self.__oracle, "block")):
+            values = self.__oracle.block(start, stop)
+        else:
+            values = [self.__oracle(i) for i in range(start, stop)]
+        field = self.parent().coeff_field
+        for i in range(start, stop):
+            if(not i in self.__sequence):
+                self.__sequence[i] = field(values[i-start])
+
     def isequence(self, n, list=False, incomplete=False):
         r'''
             Method to get the `n`-th coefficient of the inverse for a power series.
@@ -2648,6 +3087,8 @@ class DDFunction (IntegralDomainElement, SerializableObject):
             A = [Matrix(K, ([[kronecker_delta(i+1,j) if(k == 0) else 0 for j in range(r)] for i in range(r-1)] + 
                                 [[last_row[j][k] for j in range(r)]])) for k in range(m)]
 
+            if(self.__chyzak is None):
+                self.__chyzak = {}
             if("last" in self.__chyzak and self.__chyzak["last"][1] == n): # we can use previous initial values results
                 y0 = self.__chyzak["last"][0]
                 AA = sum((A[i].change_ring(Kx))*x**(i) for i in range(m))
@@ -2845,9 +3286,15 @@ class DDFunction (IntegralDomainElement, SerializableObject):
               ``self.parent().to_depth(self.parent().depth()-1)`` (i.e., from an element 
               in the previous layer) that can be found in ``data[0]``.
 
-            If this was not known, the attribute will take the (default) value ``None``.
+            If this was not known, the attribute will take the (default) value ``None``. This is also 
+            the case when weak references are used (see :func:`set_weak_references`) and some of the 
+            functions in ``data`` have been collected.
         '''
-        return self.__built
+        try:
+            return _strengthen(self.__built)
+        except ReferenceError: # some function was collected
+            self.__built = None
+            return None
         
     @built.setter
     def built(self, input):
@@ -2878,6 +3325,8 @@ class DDFunction (IntegralDomainElement, SerializableObject):
         else:
             raise ValueError("Built format not recognized.")
                             
+        if(DDFunction._Weak_References):
+            data = _weaken(data)
         self.__built = tuple([type,data])
 
     @property 
@@ -3582,7 +4031,7 @@ class DDFunction (IntegralDomainElement, SerializableObject):
         if(self.parent().depth() > 1):
             raise NotImplementedError("This method is not implemented")
 
-        if(self.__simple_derivative is None):
+        if(_dereference(self.__simple_derivative) is None):
             if(self.is_constant()):
                 ### Special case: is a constant
                 self.__simple_derivative = self.parent()(0)
@@ -3606,8 +4055,10 @@ class DDFunction (IntegralDomainElement, SerializableObject):
                 self.__simple_derivative = self.parent().element(newOperator, newInit, check_init=False, name=newName)
                 self.__simple_derivative.built = ("derivative",tuple([self]))
                 
-            
-        return self.__simple_derivative
+        result = _dereference(self.__simple_derivative)
+        if(DDFunction._Weak_References):
+            self.__simple_derivative = _weaken(result)
+        return result
 
     #####################################
     ### Sequence methods
@@ -3666,7 +4117,7 @@ class DDFunction (IntegralDomainElement, SerializableObject):
         ## Computing the common parent for all elements
         po = self.parent()
         for el in others:
-            po = pushout(po, el.parent())
+            po = _pushout(po, el.parent())
             
         ## Calling the method in the DDRing level
         return po.interlace_sequences([self]+list(others))
@@ -3697,7 +4148,7 @@ class DDFunction (IntegralDomainElement, SerializableObject):
             elif(times > 1):
                 return self.derivative(times=times-1).derivative()
                 
-        if(self.__derivative is None):
+        if(_dereference(self.__derivative) is None):
             if(self.is_constant()):
                 ### Special case: is a constant
                 self.__derivative = self.parent()(0 )
@@ -3721,8 +4172,10 @@ class DDFunction (IntegralDomainElement, SerializableObject):
                 self.__derivative = self.parent().element(newOperator, newInit, check_init=False, name=newName)
                 self.__derivative.built = ("derivative",tuple([self]))
                 
-            
-        return self.__derivative
+        result = _dereference(self.__derivative)
+        if(DDFunction._Weak_References):
+            self.__derivative = _weaken(result)
+        return result
         
     def integrate(self, constant=0 ):
         '''
@@ -3807,7 +4260,7 @@ class DDFunction (IntegralDomainElement, SerializableObject):
         ## First, compute the pushout fo the parents
         sp = self.parent()
         op = other.parent()
-        push = pushout(sp, op)
+        push = _pushout(sp, op)
         
         ## Second, compute the final depth of the DDRing
         if(not isinstance(push, DDRing)):
@@ -3895,7 +4348,7 @@ class DDFunction (IntegralDomainElement, SerializableObject):
             if(is_DDRing(R)):
                 raise NotImplementedError("'compose_algebraic': composition with algebraic over DDFunction not implemented")
             else:
-                F = DFinite.base().fraction_field()
+                F = _standard_ring("DFinite").base().fraction_field()
                 Q = PolynomialRing(F, 'y')
                 poly = Q(poly)
                 destiny_ring = self.parent()
@@ -4282,7 +4735,7 @@ class DDFunction (IntegralDomainElement, SerializableObject):
             elif(is_DDRing(R)):
                 coeffs = [el.to_simpler() for el in self.equation.coefficients()]
                 parents = [el.parent() for el in coeffs]
-                final_base = reduce(lambda p,q : pushout(p,q), parents, parents[0])
+                final_base = reduce(lambda p,q : _pushout(p,q), parents, parents[0])
                 
                 dR = None
                 if(is_DDRing(final_base)):
@@ -4483,6 +4936,10 @@ class DDFunction (IntegralDomainElement, SerializableObject):
             sage: f.init(10, True) == [((exp(x))^(sin(x))).derivative(i)(x=0) for i in range(10)]
             True
         '''
+        if(self.__pows is None):
+            self.__pows = {0 :1 , 1 :_weaken(self) if DDFunction._Weak_References else self}
+        if(other in self.__pows and _dereference(self.__pows[other]) is None): # the power was collected
+            del self.__pows[other]
         if(other not in self.__pows):
             f = self 
             g = other
@@ -4555,11 +5012,14 @@ class DDFunction (IntegralDomainElement, SerializableObject):
                 if(g0 != 0):
                     raise ValueError("The exponent has to satisfy g(0) = 0. Got %s" %g0)
                 R = f.parent(); S = g.parent()
-                FR = pushout(R,S).to_depth(1+max(R.depth()+1, S.depth()))
+                FR = _pushout(R,S).to_depth(1+max(R.depth()+1, S.depth()))
                 from ajpastor.dd_functions.ddExamples import Log
                 self.__pows[other] = FR.element([-((lf0+Log(f/f0)*g)).derivative(), 1],[1],name=name)
 
-        return self.__pows[other]
+        result = _dereference(self.__pows[other])
+        if(DDFunction._Weak_References):
+            self.__pows[other] = _weaken(result)
+        return result
            
     ### Magic equality
     def __eq__(self,other):
@@ -4818,20 +5278,26 @@ class DDFunction (IntegralDomainElement, SerializableObject):
                 res += ["%s^{(%d)}(0) = %s" %(name, i,latex(self.init(i)))]
         return ", ".join(res)
 
-    ## Overriding the serializable method with an extra parameter
-    def serialize(self, file, full=False):
-        ## If asked for the full information
-        if(full):
-            ## We put the current list as argument for the initial conditions
-            max_index = max(el for el in self.__sequence)
-            aux = self.skwds()["init_values"]
-            self.skwds()["init_values"] = self.init(max_index+1,True)
+    ## Overriding the serializable methods: the arguments are derived from the function
+    def sargs(self):
+        r'''
+            Method that returns the arguments for building ``self``: the parent and the coefficients of the equation.
+        '''
+        return (self.parent(), list(self.equation.coefficients()))
 
-        SerializableObject.serialize(self, file)
+    def skwds(self, full=False):
+        r'''
+            Method that returns the named arguments for building ``self``: the initial values and the name.
 
-        ## Putting back the original argument (if needed)
+            If ``full`` is ``True``, all the computed initial values are included.
+        '''
+        bound = self.equation.get_jp_fo()+1
         if(full):
-            self.skwds()["init_values"] = aux
+            bound = max(bound, max(self.__sequence, default=-1)+1)
+        return {"init" : self.init(bound, True, True), "name" : self.__name}
+
+    def serialize(self, file, full=False):
+        SerializableObject(*self.sargs(), **self.skwds(full)).serialize(file)
 
     def save_init(self, file, init=True, bin=True, bound=None):
         r'''
@@ -4960,7 +5426,7 @@ class DDRingFunctor (ConstructionFunctor):
             two of these functors.
         '''
         if(other.__class__ == self.__class__):
-            return DDRingFunctor(max(self.depth(), other.depth()), pushout(self.__base_field, other.__base_field))
+            return DDRingFunctor(max(self.depth(), other.depth()), _pushout(self.__base_field, other.__base_field))
 
         return None
         
@@ -4999,7 +5465,7 @@ class ParametrizedDDRingFunctor (DDRingFunctor):
         if(isinstance(other, DDRingFunctor)):
             depth = max(self.depth(), other.depth())
             vars = self.__vars
-            base_field = pushout(self.coeff_field(), other.coeff_field())
+            base_field = _pushout(self.coeff_field(), other.coeff_field())
             if(isinstance(other, ParametrizedDDRingFunctor)):
                 vars = vars.union(other.__vars)
 
@@ -5051,9 +5517,123 @@ def zero_extraction(el):
     except AttributeError:
         return (0,el)
 
+###################################################################################################
+### VALIDATION OF INITIAL VALUES
+###################################################################################################
+@contextmanager
+def validation_policy(policy, ring=None):
+    r'''
+        Context manager to change the policy for checking initial values (see :func:`DDRing.set_validation`).
+
+        INPUT:
+
+        * ``policy``: a valid policy for checking the initial values.
+        * ``ring``: if given, only the policy of this :class:`DDRing` is changed. Otherwise, the policy 
+          is changed for all the :class:`DDRing`.
+
+        EXAMPLES::
+
+            sage: from ajpastor.dd_functions import *
+            sage: from ajpastor.dd_functions.ddFunction import validation_policy
+            sage: with validation_policy("off"):
+            ....:     f = DFinite.element([1,0,1],[1,0,1]) # not checked
+            sage: with validation_policy("deferred", DFinite):
+            ....:     g = DFinite.element([-1,1],[1])
+            sage: g.sequence(5)
+            1/120
+    '''
+    if(not policy in DDRing._Validation_Policies):
+        raise ValueError("The validation policy must be one of %s" %(DDRing._Validation_Policies,))
+    if(ring is None):
+        previous = DDRing._Validation_Override
+        DDRing._Validation_Override = policy
+        try:
+            yield
+        finally:
+            DDRing._Validation_Override = previous
+    else:
+        previous = ring._DDRing__validation
+        ring.set_validation(policy)
+        try:
+            yield
+        finally:
+            ring.set_validation(previous)
+
 ###################################################################################################
 ### PRIVATE MODULE METHODS
 ###################################################################################################
+_CACHED_PUSHOUTS = {} # Cache for the pushouts computed with _pushout
+_PUSHOUTS_BOUND = 256 # Maximal number of pushouts stored in _CACHED_PUSHOUTS
+
+def _pushout(R, S):
+    r'''
+        Method that computes (and caches) the pushout of two parents.
+
+        The pushouts are stored by the identity of the parents (which are kept alive by the cache while
+        the pushout is stored). At most ``_PUSHOUTS_BOUND`` pushouts are kept: the oldest ones are
+        removed first. If the pushout does not exist, the type and arguments of the error are cached
+        and a new error is raised each time, so no traceback is kept by the cache.
+    '''
+    if(R is S):
+        return R
+    key = (id(R), id(S))
+    if(not key in _CACHED_PUSHOUTS):
+        try:
+            value = (R, S, pushout(R, S), None)
+        except Exception as error:
+            value = (R, S, None, (type(error), error.args))
+        _bounded_insert(_CACHED_PUSHOUTS, key, value, _PUSHOUTS_BOUND)
+    _, _, result, error = _CACHED_PUSHOUTS[key]
+    if(not error is None):
+        raise error[0](*error[1])
+    return result
+
+def _bounded_insert(cache, key, value, bound):
+    r'''
+        Method that inserts ``value`` in the dictionary ``cache`` removing the oldest entries so the 
+        dictionary has at most ``bound`` entries.
+    '''
+    while(len(cache) >= bound):
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+def _weaken(data):
+    r'''
+        Method that replaces the :class:`DDFunction` in ``data`` (lists, tuples and values of dictionaries 
+        are explored) by weak references.
+    '''
+    if(isinstance(data, DDFunction)):
+        return weakref.ref(data)
+    elif(isinstance(data, (list, tuple))):
+        return type(data)(_weaken(el) for el in data)
+    elif(isinstance(data, dict)):
+        return {key : _weaken(data[key]) for key in data}
+    return data
+
+def _strengthen(data):
+    r'''
+        Method that reverts :func:`_weaken`. It raises a ``ReferenceError`` if some function was collected.
+    '''
+    if(isinstance(data, weakref.ref)):
+        result = data()
+        if(result is None):
+            raise ReferenceError("The referenced function does not exist anymore")
+        return result
+    elif(isinstance(data, (list, tuple))):
+        return type(data)(_strengthen(el) for el in data)
+    elif(isinstance(data, dict)):
+        return {key : _strengthen(data[key]) for key in data}
+    return data
+
+def _dereference(value):
+    r'''
+        Method that returns the object referenced by ``value`` if it is a weak reference (``None`` if it was 
+        collected) or ``value`` itself otherwise.
+    '''
+    if(isinstance(value, weakref.ref)):
+        return value()
+    return value
+
 def _is_polynomial_ring(ring, univariate=True, multivariate=True):
     '''
         Method that checks whether an object is a polynomial ring or not.
@@ -5182,13 +5762,51 @@ def __printProgressBar (iteration, total, prefix = '', suffix = '', decimals = 1
 ### STANDARD PACKAGES VARIABLES & GETTERS
 ###################################################################################################
 
-# Some global pre-defined DD-Rings
-DFinite = DDRing(PolynomialRing(QQ,x), default_operator=w_OreOperator)
-DDFinite = DDRing(DFinite)
-DFiniteP = ParametrizedDDRing(DFinite, [var('P')])
-DFiniteI = DDRing(PolynomialRing(NumberField(x**2+1, 'I'), ['x']),base_field=NumberField(x**2+1, 'I'))
+# Some global pre-defined DD-Rings. They are built the first time they are requested 
+# (see the function __getattr__ of this module)
+def __build_DFinite():
+    ring = DDRing(PolynomialRing(QQ,x), default_operator=w_OreOperator)
+    ring._DDRing__get_recurrence = __get_recurrence
+    return ring
+
+def __build_DFiniteI():
+    F = NumberField(x**2+1, 'I')
+    return DDRing(PolynomialRing(F, ['x']),base_field=F)
+
+_STANDARD_RINGS = {
+    "DFinite" : __build_DFinite,
+    "DDFinite" : lambda : DDRing(_standard_ring("DFinite")),
+    "DFiniteP" : lambda : ParametrizedDDRing(_standard_ring("DFinite"), [var('P')]),
+    "DFiniteI" : __build_DFiniteI
+}
+
+def _standard_ring(name):
+    r'''
+        Method that returns one of the pre-defined DD-Rings of this module, building it if necessary.
+
+        INPUT:
+            * ``name``: one of ``"DFinite"``, ``"DDFinite"``, ``"DFiniteP"`` or ``"DFiniteI"``.
+    '''
+    if(not name in globals()):
+        globals()[name] = _STANDARD_RINGS[name]()
+    return globals()[name]
+
+def __getattr__(name):
+    r'''
+        Module attribute hook (see :pep:`562`): the pre-defined DD-Rings are built on the first access.
+
+        EXAMPLES::
+
+            sage: import ajpastor.dd_functions.ddFunction as ddFunction
+            sage: ddFunction.DDFinite.base() is ddFunction.DFinite
+            True
+    '''
+    if(name in _STANDARD_RINGS):
+        return _standard_ring(name)
+    raise AttributeError("module %s has no attribute %s" %(__name__, name))
 
 def __get_recurrence(f):
+    DFinite = _standard_ring("DFinite")
     if(not f in DFinite):
         raise TypeError("The function must be holonomic")
     
@@ -5218,23 +5836,20 @@ def __get_recurrence(f):
     rec = [el/rec_gcd for el in rec]
     
     return (rec, f.sequence(op.forward_order-m, True))
-DFinite._DDRing__get_recurrence = __get_recurrence
 
 ###################################################################################################
 ### PACKAGE ENVIRONMENT VARIABLES
 ###################################################################################################
+# The pre-defined DD-Rings (see _STANDARD_RINGS) are not included: a "star" import would build them
 __all__ = [
     "is_DDRing", 
     "is_ParametrizedDDRing", 
     "is_DDFunction", 
     "DDRing", 
     "DDFunction",
-    "DFinite", 
-    "DDFinite", 
     "command", 
     "zero_extraction", 
-    "ParametrizedDDRing", 
-    "DFiniteP", 
-    "DFiniteI"]
+    "ParametrizedDDRing",
+    "validation_policy"]
   
 
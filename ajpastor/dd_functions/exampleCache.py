@@ -0,0 +1,363 @@
+r"""
+Python file for the cache of examples of DDFunctions
+
+This module provides the cache used by the constructors in :mod:`~ajpastor.dd_functions.ddExamples`.
+The cache has a maximal number of entries: when it is full, the least recently used example is removed
+from memory, so long-lived processes do not keep every example (and all its computed coefficients) forever.
+
+Optionally, the cache can be stored in a local directory (see :func:`ExampleCache.set_store`). Then
+the differential equation, the initial values and the computed prefix of the sequence of each example are
+saved to disk, so other processes (for example, the workers of a pool) can load them instead of building
+them again. The directory can also be set with the environment variable ``DD_EXAMPLES_CACHE``.
+The stored files depend on the version of the package and of the storage format, so the examples 
+stored by other versions are never loaded.
+
+.. WARNING::
+
+    The stored examples are loaded with :mod:`pickle`, so loading a file from the directory of the cache
+    may execute arbitrary code. Anyone who can write in that directory can run code in every process that
+    uses the cache. Only directories owned by the current user and not writable by the group or by other 
+    users are accepted (see :func:`ExampleCache.set_store`). Never point ``DD_EXAMPLES_CACHE`` to a directory
+    shared with other users.
+
+EXAMPLES::
+
+    sage: from ajpastor.dd_functions import *
+    sage: from ajpastor.dd_functions.exampleCache import EXAMPLES_CACHE
+    sage: EXAMPLES_CACHE.resize(2)
+    sage: f = Sin(x); g = Cos(x); h = Exp(x)
+    sage: len(EXAMPLES_CACHE)
+    2
+    sage: Exp(x) is h
+    True
+    sage: import tempfile
+    sage: EXAMPLES_CACHE.set_store(tempfile.mkdtemp())
+    sage: EXAMPLES_CACHE.flush()
+    sage: EXAMPLES_CACHE.clear()
+    sage: loads = EXAMPLES_CACHE.info()["loads"]
+    sage: Exp(x) == h
+    True
+    sage: EXAMPLES_CACHE.info()["loads"] == loads + 1
+    True
+    sage: type(Exp(x).name) == type(h.name)
+    True
+    sage: EXAMPLES_CACHE.set_store(None); EXAMPLES_CACHE.resize(128)
+
+Directories that other users can modify are refused::
+
+    sage: import os
+    sage: shared = tempfile.mkdtemp(); os.chmod(shared, 0o777)
+    sage: EXAMPLES_CACHE.set_store(shared)
+    Traceback (most recent call last):
+    ...
+    PermissionError: ...
+    sage: EXAMPLES_CACHE.store() is None
+    True
+
+AUTHORS:
+
+    - Antonio Jimenez-Pastor (2021-02-09): initial version
+
+"""
+
+# ****************************************************************************
+#  Copyright (C) 2021 Antonio Jimenez-Pastor <ajpastor@risc.uni-linz.ac.at>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#                  https://www.gnu.org/licenses/
+# ****************************************************************************
+
+# Python imports
+import atexit
+import logging
+import os
+import stat
+from collections import OrderedDict
+from functools import wraps
+from hashlib import sha1
+from inspect import signature
+
+#ajpastor imports
+from ajpastor.misc.serializable import SerializableObject
+
+logger = logging.getLogger(__name__)
+
+_FORMAT_VERSION = 1 # version of the format of the stored examples
+
+def _package_version():
+    r'''
+        Method that returns the installed version of the package (``None`` if it is not installed).
+    '''
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            return version("dd_functions")
+        except PackageNotFoundError:
+            return None
+    except ImportError:
+        return None
+
+class _ExampleRecord(SerializableObject):
+    r'''
+        Auxiliary class with the data stored on disk for one example.
+
+        INPUT:
+            * ``parent``: the :class:`~ajpastor.dd_functions.ddFunction.DDRing` of the example.
+            * ``equation``: the coefficients of the differential equation.
+            * ``init``: the initial values required to define the function.
+            * ``sequence``: a prefix of the sequence of the function (as strings).
+            * ``name``: the name of the function.
+            * ``oracle``: the closed form for the sequence (see
+              :func:`~ajpastor.dd_functions.ddFunction.DDFunction.set_sequence_oracle`).
+    '''
+    def __init__(self, parent, equation, init, sequence, name=None, oracle=None):
+        SerializableObject.__init__(self, parent, equation, init, sequence, name=name, oracle=oracle)
+        self.__data = (parent, equation, init, sequence, name, oracle)
+
+    @staticmethod
+    def from_function(function):
+        r'''
+            Method that builds the record for a :class:`~ajpastor.dd_functions.ddFunction.DDFunction`.
+        '''
+        sequence = function._DDFunction__sequence
+        prefix = []
+        while(len(prefix) in sequence):
+            prefix += [str(sequence[len(prefix)])]
+        init = function.init(function.equation.get_jp_fo()+1, True, True)
+        return _ExampleRecord(function.parent(), list(function.equation.coefficients()), init, prefix,
+                              name=function.name, oracle=function.sequence_oracle())
+
+    def build(self):
+        r'''
+            Method that builds the :class:`~ajpastor.dd_functions.ddFunction.DDFunction` of the record.
+        '''
+        parent, equation, init, sequence, name, oracle = self.__data
+        function = parent.element(equation, init, name=name)
+        field = parent.coeff_field
+        function._DDFunction__sequence.update({i : field(sequence[i]) for i in range(len(sequence))})
+        if(not oracle is None):
+            function.set_sequence_oracle(oracle)
+        return function
+
+class ExampleCache(object):
+    r'''
+        Class for a bounded cache of examples with least recently used eviction.
+
+        INPUT:
+            * ``max_size``: maximal number of examples kept in memory.
+            * ``path``: directory where the examples are stored. If ``None``, nothing is stored on disk.
+    '''
+    def __init__(self, max_size=128, path=None):
+        self.__entries = OrderedDict()
+        self.__max_size = max_size
+        self.__path = None
+        self.__hits = 0
+        self.__misses = 0
+        self.__loads = 0
+        self.__version = (_FORMAT_VERSION, _package_version())
+
+        self.set_store(path)
+        atexit.register(self.flush)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return key in self.__entries
+
+    def resize(self, max_size):
+        r'''
+            Method to change the maximal number of examples in memory.
+        '''
+        self.__max_size = max_size
+        self.__shrink()
+
+    def set_store(self, path):
+        r'''
+            Method to set the directory where the examples are stored (``None`` to disable the storage).
+
+            The directory is created (only accessible by the current user) if it does not exist. Since
+            the stored examples are loaded with :mod:`pickle`, a ``PermissionError`` is raised if the
+            directory is not owned by the current user or if the group or other users can write on it.
+        '''
+        if(not path is None):
+            os.makedirs(path, mode=0o700, exist_ok=True)
+            _check_store(path)
+        self.__path = path
+
+    def store(self):
+        r'''
+            Method that returns the directory where the examples are stored.
+        '''
+        return self.__path
+
+    def info(self):
+        r'''
+            Method that returns a dictionary with the statistics of the cache.
+        '''
+        return {"size" : len(self.__entries), "max_size" : self.__max_size, "hits" : self.__hits,
+                "misses" : self.__misses, "loads" : self.__loads, "store" : self.__path}
+
+    def get(self, key):
+        r'''
+            Method to get an example from the cache.
+
+            The example is looked first in memory and then in the directory of the cache (if any).
+
+            OUTPUT:
+
+            The cached example or ``None`` if it is not in the cache.
+        '''
+        if(key in self.__entries):
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+            return self.__entries[key]
+
+        value = self.__load(key)
+        if(value is None):
+            self.__misses += 1
+        else:
+            self.__loads += 1
+            self.__insert(key, value)
+        return value
+
+    def put(self, key, value):
+        r'''
+            Method to add an example to the cache.
+        '''
+        self.__insert(key, value)
+        self.__save(key, value)
+
+    def clear(self, name=None, disk=False):
+        r'''
+            Method to remove examples from memory.
+
+            INPUT:
+                * ``name``: if given, only the examples of the constructor with this name are removed.
+                * ``disk``: if ``True``, the stored files are also removed (only when ``name`` is ``None``).
+        '''
+        if(name is None):
+            self.__entries.clear()
+            if(disk and not self.__path is None):
+                for file in os.listdir(self.__path):
+                    if(file.endswith(".dd")):
+                        os.remove(os.path.join(self.__path, file))
+        else:
+            for key in [key for key in self.__entries if key[0] == name]:
+                del self.__entries[key]
+
+    def flush(self):
+        r'''
+            Method to store on disk all the examples in memory (with their current computed sequences).
+        '''
+        for key in list(self.__entries):
+            self.__save(key, self.__entries[key])
+
+    #################################################
+    ### Private methods
+    #################################################
+    def __insert(self, key, value):
+        self.__entries[key] = value
+        self.__entries.move_to_end(key)
+        self.__shrink()
+
+    def __shrink(self):
+        while(len(self.__entries) > self.__max_size):
+            key, value = self.__entries.popitem(last=False)
+            self.__save(key, value) # keeping the computed sequence
+
+    def __file(self, key):
+        if(self.__path is None or not self.__persistent(key)):
+            return None
+        return os.path.join(self.__path, "%s.dd" %sha1(repr((self.__version, key)).encode()).hexdigest())
+
+    def __persistent(self, key):
+        r'''
+            Only examples built from explicit data (no other DDFunction) are stored: their
+            representation identifies them.
+        '''
+        from ajpastor.dd_functions.ddFunction import is_DDFunction
+        return not any(is_DDFunction(el) for el in _flatten(key))
+
+    def __save(self, key, value):
+        from ajpastor.dd_functions.ddFunction import is_DDFunction
+        file = self.__file(key)
+        if(file is None or not is_DDFunction(value)):
+            return
+        try:
+            with open(file + ".tmp", "wb") as output:
+                from pickle import dump as pdump
+                pdump((self.__version, repr(key)), output)
+                _ExampleRecord.from_function(value).serialize(output)
+            os.replace(file + ".tmp", file)
+        except Exception as error:
+            logger.debug("Impossible to store the example %s: %s" %(repr(key), error))
+            if(os.path.exists(file + ".tmp")):
+                os.remove(file + ".tmp")
+
+    def __load(self, key):
+        file = self.__file(key)
+        if(file is None or not os.path.exists(file)):
+            return None
+        try:
+            with open(file, "rb") as input:
+                from pickle import load as pload
+                if(pload(input) != (self.__version, repr(key))): # collision of the hash or other version
+                    return None
+                return _ExampleRecord.unserialize(input).build()
+        except Exception as error:
+            logger.debug("Impossible to load the example %s: %s" %(repr(key), error))
+            return None
+
+def _check_store(path):
+    r'''
+        Method that raises a ``PermissionError`` if ``path`` may be modified by other users.
+    '''
+    status = os.stat(path)
+    if(hasattr(os, "getuid") and status.st_uid != os.getuid()):
+        raise PermissionError("The directory %s for the examples is not owned by the current user" %path)
+    if(status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+        raise PermissionError("The directory %s for the examples is writable by other users" %path)
+
+def _flatten(key):
+    if(isinstance(key, (list, tuple))):
+        return sum((_flatten(el) for el in key), [])
+    return [key]
+
+EXAMPLES_CACHE = ExampleCache()
+try:
+    EXAMPLES_CACHE.set_store(os.environ.get("DD_EXAMPLES_CACHE", None))
+except PermissionError as error:
+    logger.warning("The examples will not be stored: %s" %error)
+
+def example_cache(func):
+    r'''
+        Decorator for the constructors of examples that uses :data:`EXAMPLES_CACHE`.
+
+        The key of each call is the name of the constructor with all its arguments (including the
+        default values). If the arguments are not hashable, the example is built without cache.
+    '''
+    parameters = signature(func)
+
+    @wraps(func)
+    def wrapped(*args, **kwds):
+        bound = parameters.bind(*args, **kwds)
+        bound.apply_defaults()
+        key = (func.__name__, tuple(bound.arguments.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwds)
+
+        result = EXAMPLES_CACHE.get(key)
+        if(result is None):
+            result = func(*args, **kwds)
+            EXAMPLES_CACHE.put(key, result)
+        return result
+    wrapped.clear_cache = lambda : EXAMPLES_CACHE.clear(func.__name__)
+    return wrapped
+
+__all__ = ["ExampleCache", "EXAMPLES_CACHE", "example_cache"]
@@ -216,30 +216,14 @@ class _LazyDDFunction(IntegralDomainElement):
     @cached_method
     def is_zero(self):
         result = (self.poly() == 0 );
-        map_to_values = {repr(var) : self.parent().to_real(var)(0) for var in self.poly().variables()};
-        if((not result) and (self.poly()(**map_to_values) == 0)):
-            if(not (self.__raw is None)):
-                result = (self.raw() == 0);
+        if(not result):
+            pol = None;
+            if(self.poly() in self.parent().poly_ring()):
+                pol = self.parent().poly_ring()(self.poly());
             else:
-                pol = None;
-                if(self.poly() in self.parent().poly_ring()):
-                    pol = self.parent().poly_ring()(self.poly());
-                else:
-                    pol = self.parent().poly_ring()(self.poly().numerator());
-                
-                factors = None;
-                try:
-                    try:
-                        factors = pol.factor(proof=True);
-                    except NotImplementedError:
-                        factors = pol.factor(proof=False);
-                except:
-                    factors = [(pol,1 )];
-                for factor in factors:
-                    result = (self.parent().to_real(factor[0 ]) == 0 );
-                    if(result):
-                        self.parent().add_relations(factor[0 ]);
-                        break;
+                pol = self.parent().poly_ring()(self.poly().numerator());
+            
+            result = self.parent().zero_oracle().is_zero(pol, self.__raw);
                         
         if(result):
             self.__poly = self.parent().poly_ring().zero();          
@@ -301,25 +285,44 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         ## Initializing the attributes
         self.__constants = constants;
         
+        self.__var_name = var_name;
         self.__poly_ring = InfinitePolynomialRing(constants, names=[var_name]);
         self.__poly_field = self.__poly_ring.fraction_field();
         self.__gen = self.__poly_ring.gens()[0];
         self.__used = 0;
         
-        ## Initializing the map of variables
-        self.__map_of_vars = {}; # Map where each variable is associated with a 'base' object
-        self.__map_to_vars = {}; # Map where each variable is associated with a 'base' object
+        ## Initializing the tables of variables (indexed by the integer index of the generator)
+        self.__functions = []; # index -> 'base' object represented by the variable
+        self.__derivative_ids = []; # index -> index of its derivative (None if it is not a variable)
+        self.__last_derivatives = {}; # index -> derivative (as a polynomial) when it is not a variable
+        self.__inits = []; # index -> known initial values of the 'base' object
+        self.__ids = {}; # Cache for the indices of the generators
+        self.__parent_ids = {}; # Cache for the indices of the generators of finite polynomial rings
+        self.__map_of_vars = None; # Map where each variable name is associated with a 'base' object (only for display)
+        self.__map_to_vars = {}; # Map where each 'base' object is associated with its variable
         self.__r_graph = DiGraph(); # Graph of relations between the already casted elements
         self.__trans = dict(); # Dictionary with the transformation to get into a node in 'r_graph'
         
         self.__gens = [];
         
-        self.__map_of_derivatives = {}; # Map for each variable to its derivative (as a polynomial)
+        self.__gen_derivatives = {}; # Cache for the derivatives of the generators (by index)
+        self.__monomial_derivatives = {}; # Cache for the derivatives of monomials
+        
+        self.__index = {}; # Index of the derivatives of the nodes in 'r_graph' by their fingerprint
+        self.__indexed = {}; # Nodes already included in the index (by id)
+        self.__fingerprints = {}; # Cache for the fingerprints (by id)
+        self.__no_relation = {}; # Cache of pairs of functions without linear relation (by id)
+        
+        self.__ambient = None; # Finite polynomial ring where the relations are computed
+        self.__ambient_names = [];
+        self.__ambient_capacity = 0; # Number of generators 'z_i' in the ambient ring
+        self.__basis = None; # Basis of relations in the ambient ring (with the ring and version used)
             
         ## Casting and Coercion system
         self.base().register_conversion(LDRSimpleMorphism(self, self.base()));
         
         ## Adding the 'x' as a basic variable in the ring
+        from ajpastor.dd_functions.ddFunction import DFinite;
         self(DFinite.element([0,0,1],[0,1],name="x"));                 
     
     ################################################################################################
@@ -332,10 +335,31 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         return self.__poly_field;
                 
     def map_of_vars(self):
+        if(self.__map_of_vars is None):
+            self.__map_of_vars = {str(self.__gen[i]) : self.__functions[i] for i in range(len(self.__functions))};
         return self.__map_of_vars;
         
     def variables(self):
-        return tuple(self.poly_ring()(key) for key in self.map_of_vars().keys());
+        return tuple(self.__gen[i] for i in range(len(self.__functions)));
+        
+    def variable_key(self, variable):
+        '''
+            Returns the integer index of a generator of ``self.poly_ring()`` (i.e., ``i`` for ``z_i``).
+        '''
+        try:
+            return self.__ids[variable];
+        except KeyError:
+            key = int(str(variable).split("_")[-1]);
+            self.__ids[variable] = key;
+            return key;
+        
+    def real_of_variable(self, key):
+        return self.__functions[key];
+        
+    def variable_sequence(self, key, n):
+        if(len(self.__inits[key]) < n):
+            self.__inits[key] = self.__functions[key].sequence(n, True);
+        return self.__inits[key][:n];
     
     def _to_poly_element(self, element):
         if(element.parent() is self):
@@ -372,15 +396,20 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         roots = [el for el in self.__r_graph if self.__r_graph.in_degree(el) == 0];# Getting roots
         from collections import deque;
         to_search = deque(roots); # Initializing the queue
+        order = []; 
         while(len(to_search) > 0):
             # Updating the queue
             current = to_search.popleft();
             for edge in self.__r_graph.outgoing_edges(current):
                 to_search.append(edge[1]);
+            order += [current];
             
+        ## We only visit the nodes that may have a relation with element (see method __candidates)
+        for (current, k) in self.__candidates(element, order):
             # Visiting the current node
-            relation = self.__find_relation(element, current, self.__trans[current][1].nrows());
+            relation = self.__find_relation(element, self.__derivatives(current)[k:k+1]);
             if(not (relation is None)):
+                relation = (k, relation[1]);
                 ## If it is not just the function, create a new node for future relations
                 if(relation[0] != 0):
                     self.__add_function(element);
@@ -399,7 +428,7 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
             
         ## At this point, no direct relation was found. We look for relation between element and the roots
         for root in roots:
-            relation = self.__find_relation(root, element);
+            relation = self.__find_relation(root, element, filter=True);
             if(not (relation is None)):
                 # Adding the element to the graph
                 self.__add_function(element, gen=True);
@@ -431,25 +460,57 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         return self._ConversionSystem__relations;
     
     def _groebner_basis(self):
-        if(len(self._ConversionSystem__relations) >= 1):
-            gens_in_relations = list(set(sum([[str(v) for v in el.variables()] for el in self._ConversionSystem__relations], [])));
-            Poly = PolynomialRing(self.poly_ring().base_ring(), gens_in_relations, order='deglex');
-            rels = [Poly(el) for el in self._ConversionSystem__relations];
+        relations = [el for el in self._ConversionSystem__relations if el != 0];
+        if(len(relations) >= 1):
+            Poly = self.__ambient_ring(sum([[str(v) for v in el.variables()] for el in relations], []));
+            rels = [Poly(el) for el in relations];
             self._ConversionSystem__rel_ideal = ideal(Poly, rels);
             return self._ConversionSystem__rel_ideal.groebner_basis();
         return [self.poly_ring().base_ring().zero()];
     
     def _simplify(self, poly):
-        gens = list(set([str(g) for g in self._ConversionSystem__rel_ideal.parent().ring().gens() if g != 1] + [str(g) for g in poly.variables()]));
-        Poly = PolynomialRing(self.poly_ring().base_ring(), gens);
+        Poly = self.__ambient_ring([str(g) for g in poly.variables()]);
         try:
             poly = Poly(poly);
         except TypeError:
             return poly;
         try:
-            return self.poly_ring()(poly.reduce([Poly(el) for el in self._ConversionSystem__relations]));
+            return self.poly_ring()(poly.reduce(self.__ambient_basis()));
         except AttributeError:
             return self.poly_ring()(poly);
+            
+    def _to_real_element(self, polynomial):
+        '''
+            Method that plugs the real values of the variables into a polynomial using the exponents of its monomials.
+            
+            EXAMPLES::
+            
+                sage: from ajpastor.dd_functions import *
+                sage: from ajpastor.dd_functions.lazyDDRing import LazyDDRing
+                sage: R = LazyDDRing(DFinite)
+                sage: s = R(Sin(x)); c = R(Cos(x)); e = R(Exp(x))
+                sage: R.to_real((s*e + c^2*e + 3*s).poly()) == Sin(x)*Exp(x) + Cos(x)^2*Exp(x) + 3*Sin(x)
+                True
+                sage: (s*c*e).raw() == Sin(x)*Cos(x)*Exp(x)
+                True
+        '''
+        polynomial = self.poly_ring()(polynomial);
+        if(len(polynomial.variables()) == 0):
+            return self.base()(polynomial);
+        
+        finite = polynomial.polynomial();
+        ids = self.__finite_ids(finite.parent());
+        univariate = isUniPolynomial(finite.parent()); # the keys of dict() are integers instead of ETuples
+        result = self.base().zero();
+        for (exponents, coeff) in finite.dict().items():
+            if(univariate):
+                exponents = (exponents,);
+            term = self.base()(coeff);
+            for i in range(len(ids)):
+                if(exponents[i] != 0):
+                    term *= self.__functions[ids[i]]**exponents[i];
+            result += term;
+        return result;
         
     ################################################################################################
     ### Other Methods for LazyRing
@@ -466,55 +527,55 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         
         ## Cleaning all the variables for the laziness
         self.__used = 0;
-        self.__map_of_vars = {}; 
+        self.__functions = [];
+        self.__derivative_ids = [];
+        self.__last_derivatives = {};
+        self.__inits = [];
+        self.__map_of_vars = None; 
         self.__map_to_vars = {}; 
         self.__r_graph = DiGraph(); 
         self.__trans = dict(); 
         self.__gens = [];
-        self.__map_of_derivatives = {};
+        self.__index = {}; 
+        self.__indexed = {};
+        self.__gen_derivatives = {};
+        self.__monomial_derivatives = {};
+        self.__fingerprints = {};
+        self.__no_relation = {};
+        self.zero_oracle().clear();
     
     def derivative(self, el, times=1):
         '''
             Method that computes the derivative of an element in the LazyDDRing. It performs a casting to 'self' before starting the algorithm.
+            
+            The derivatives are computed over the sparse representation of the polynomials (see method __derivative_poly)
+            and higher derivatives are computed iteratively.
+            
+            EXAMPLES::
+            
+                sage: from ajpastor.dd_functions import *
+                sage: from ajpastor.dd_functions.lazyDDRing import LazyDDRing
+                sage: R = LazyDDRing(DFinite)
+                sage: s = R(Sin(x)); e = R(Exp(x))
+                sage: len((s*e).variables()) >= 2
+                True
+                sage: R.derivative(s*e + s^2).raw() == (Sin(x)*Exp(x) + Sin(x)^2).derivative()
+                True
+                sage: R.derivative(s*e, 2).raw() == (Sin(x)*Exp(x)).derivative(times=2)
+                True
         '''
         el = self(el);
         
         if(times == 0):
             return el;
-        elif(times > 1):
-            return self.derivative(self.derivative(el, times-1));
         
-        ## COmputing the derivative of the polynomial associated
         poly = el.poly();
-        ## Rational function case
-        try:
-            if(poly.denominator() != 1):
-                n = self(poly.numerator()); dn = self.derivative(n);
-                d = self(poly.denominator()); dd = self.derivative(d);
-                
-                return (dn*d - dd*n)/d**2;
-        except AttributeError:
-            pass;
-        
-        ## Splitting the derivative into the monomials
-        if(poly == 0):
-            return self.zero();
-        coeffs = poly.coefficients();
-        monomials = poly.monomials();
-        
-        ## Base case (monomial case)
-        if(len(monomials) == 1):
-            gens = poly.variables();
-            degrees = [poly.degree(g) for g in gens];
-            
-            res = sum(prod(gens[j]**(degrees[j]-kronecker_delta(i,j)) for j in range(len(gens)))*degrees[i]*self.get_derivative(gens[i]) for i in range(len(gens)));
-        
-            return self(coeffs[0]*res);
-        else: ## Generic case (polynomial)
-            return self(sum(coeffs[i]*self.derivative(monomials[i]) for i in range(len(coeffs))));
+        for _ in range(times):
+            poly = self.__derivative_poly(poly);
+        return self(poly);
     
     def get_derivative(self, el):
-        return self(self.__map_of_derivatives[el]).poly();
+        return self.__derivative_gen(self.variable_key(el));
         
     ################################################################################################
     ### Other Integral Domain methods 
@@ -572,8 +633,8 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         # Getting the variables
         coeffs = [self.to_poly(el) for el in a.coefficients() + b.coefficients()];
         gens = list(set(sum([[str(g) for g in poly.variables()] for poly in coeffs], [])));
-        # Building the rational functions
-        F = PolynomialRing(self.base_ring(), gens).fraction_field();
+        # Building the rational functions (using the pooled ambient ring)
+        F = self.__ambient_ring(gens).fraction_field();
         # Building the polynomial ring
         y = a.parent().gens_dict().items()[0][0];
         R = PolynomialRing(F, y);
@@ -632,7 +693,7 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
                 ## For each variable in X.poly(), we get the new polynomial            
                 translate = {}
                 for var in X.variables():
-                    translate[var] = self.to_poly(other.map_of_vars()[str(var)]);
+                    translate[var] = self.to_poly(other.real_of_variable(other.variable_key(var)));
                     
                 ## We now plugin the expressions
                 return _LazyDDFunction(self, pol(**translate));
@@ -661,13 +722,112 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
     def __str__(self):
         final = "%s with %d variables\n{\n" %(repr(self),len(self.__gens));
         for g in self.__gens:
-            final += "\t%s : %s,\n" %(g, repr(self.__map_of_vars[str(g)]));
+            final += "\t%s : %s,\n" %(g, repr(self.__functions[self.variable_key(g)]));
         final += "}";
         return final
         
     ################################################################################################
     ### Private methods
     ################################################################################################
+    def __ambient_ring(self, names):
+        '''
+            Method that returns a finite polynomial ring where all the variables in ``names`` are included.
+            
+            The generators of this ring are allocated in a pool whose size is doubled every time a new
+            variable does not fit, so the ring (and the conversions of the polynomials into it) only changes
+            a logarithmic number of times. Hence, the Groebner basis of the relations and the simplified 
+            polynomials are almost always computed in the same ring. The variables are sorted with the same 
+            order as in ``self.poly_ring()`` and the monomial order is 'deglex', so the Groebner basis is 
+            still a basis after adding new variables.
+        '''
+        names = set(names);
+        if((self.__ambient is None) or (not names.issubset(self.__ambient_names))):
+            def index(name):
+                try:
+                    return int(name.split("_")[-1]);
+                except ValueError:
+                    return -1;
+            needed = max([index(name)+1 for name in names] + [1]);
+            capacity = max(self.__ambient_capacity, 8);
+            while(capacity < needed):
+                capacity *= 2;
+            others = [name for name in names.union(self.__ambient_names) if index(name) < 0];
+            self.__ambient_names = ["%s_%d" %(self.__var_name, i) for i in range(capacity-1, -1, -1)] + sorted(others);
+            self.__ambient_capacity = capacity;
+            self.__ambient = PolynomialRing(self.poly_ring().base_ring(), self.__ambient_names, order='deglex');
+        return self.__ambient;
+        
+    def __ambient_basis(self):
+        '''
+            Method that returns the Groebner basis of the relations as elements of the current ambient ring.
+        '''
+        version = self.relations_version();
+        if((self.__basis is None) or (not (self.__basis[0] is self.__ambient)) or self.__basis[1] != version):
+            self.__basis = (self.__ambient, version, [self.__ambient(el) for el in self._ConversionSystem__relations]);
+        return self.__basis[2];
+        
+    def __derivative_poly(self, poly):
+        '''
+            Method that computes the derivative of a polynomial (or a quotient of polynomials) in the variables of self.
+        '''
+        ## Rational function case
+        try:
+            if(poly.denominator() != 1):
+                n = self.poly_ring()(poly.numerator()); d = self.poly_ring()(poly.denominator());
+                return (self.__derivative_poly(n)*d - n*self.__derivative_poly(d))/d**2;
+        except AttributeError:
+            pass;
+        
+        poly = self.poly_ring()(poly);
+        if(poly == 0):
+            return poly;
+            
+        ## We work with the exponent dictionary of the polynomial
+        finite = poly.polynomial();
+        ids = self.__finite_ids(finite.parent());
+        univariate = isUniPolynomial(finite.parent()); # the keys of dict() are integers instead of ETuples
+        result = self.poly_ring().zero();
+        for (exponents, coeff) in finite.dict().items():
+            if(univariate):
+                exponents = (exponents,);
+            monomial = tuple((ids[i], exponents[i]) for i in range(len(ids)) if exponents[i] != 0);
+            if(len(monomial) > 0):
+                result += coeff*self.__derivative_monomial(monomial);
+        return result;
+        
+    def __derivative_monomial(self, monomial):
+        '''
+            Method that computes (with a cache) the derivative of a monomial given as a tuple of pairs (index, exponent).
+        '''
+        if(not monomial in self.__monomial_derivatives):
+            gens = [self.__gen[index] for (index,_) in monomial];
+            result = self.poly_ring().zero();
+            for i in range(len(monomial)):
+                factor = prod([gens[j]**(monomial[j][1]-kronecker_delta(i,j)) for j in range(len(gens))], self.poly_ring().one());
+                result += monomial[i][1]*factor*self.__derivative_gen(monomial[i][0]);
+            self.__monomial_derivatives[monomial] = result;
+        return self.__monomial_derivatives[monomial];
+        
+    def __derivative_gen(self, index):
+        '''
+            Method that returns (with a cache) the derivative of a generator of self given by its index.
+        '''
+        if(not index in self.__gen_derivatives):
+            if(self.__derivative_ids[index] is None):
+                derivative = self.__last_derivatives[index];
+            else:
+                derivative = self.__gen[self.__derivative_ids[index]];
+            self.__gen_derivatives[index] = self.poly_ring()(self(derivative).poly());
+        return self.__gen_derivatives[index];
+        
+    def __finite_ids(self, parent):
+        '''
+            Method that returns (with a cache) the indices of the generators of a finite polynomial ring.
+        '''
+        if(not parent in self.__parent_ids):
+            self.__parent_ids[parent] = [self.variable_key(g) for g in parent.gens()];
+        return self.__parent_ids[parent];
+        
     def __pullup_vector(self, vector, constant, current):
         if(self.__r_graph.in_degree(current) == 0):
             return (vector, constant, current);
@@ -737,18 +897,80 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
             for i in range(order):
                 print("** Adding a new variable (%d)" %self.__used);
                 self.__gens += [self.__gen[self.__used]];
-                self.__map_of_vars[str(self.__gens[-1])] = current;
+                self.__functions += [current];
+                self.__derivative_ids += [self.__used+1];
+                self.__inits += [[]];
                 self.__map_to_vars[current] = self.__used;
-                self.__map_of_derivatives[self.__gen[self.__used]] = self.__gen[self.__used+1];
                 self.__used += 1;
                 current = current.derivative();
+            self.__map_of_vars = None;
             
             trans = self.__trans[f];
-            self.__map_of_derivatives[self.__gen[before+order-1]] = sum([self.__gen[before+i]*trans[1][i][-1] for i in range(order)], trans[0]);
+            self.__derivative_ids[before+order-1] = None;
+            self.__last_derivatives[before+order-1] = sum([self.__gen[before+i]*trans[1][i][-1] for i in range(order)], trans[0]);
         
         return;
         
-    def __find_relation(self, g,f,d=None):
+    def __derivatives(self, f):
+        '''
+            Method that returns the derivatives of a node `f` of 'r_graph' that are used in the relations.
+        '''
+        return [f.derivative(times=i) for i in range(self.__trans[f][1].nrows())];
+        
+    def __fingerprint(self, f, terms=5):
+        '''
+            Method that computes an invariant of f under the transformations f -> cf+d (with c != 0).
+            
+            The fingerprint is the valuation of f-f(0) together with the next initial terms normalized 
+            by the leading one. Two functions with a linear relation (see method __find_linear_relation) 
+            always have the same fingerprint. If the fingerprint can not be computed (or `f` is a constant)
+            this method returns None. The valuation is only searched up to the bound given by the equation
+            of `f` (a non-constant `f` has a non-zero coefficient before that bound), so this method also 
+            returns None when that bound is reached.
+        '''
+        if(id(f) in self.__fingerprints and self.__fingerprints[id(f)][0] is f):
+            return self.__fingerprints[id(f)][1];
+        
+        result = None;
+        try:
+            if(not f.is_constant()):
+                bound = f.equation.get_jp_fo()+terms;
+                of = 1;
+                while(of <= bound and f.sequence(of) == 0): of += 1;
+                if(of <= bound):
+                    lead = f.sequence(of);
+                    result = (of,) + tuple(f.sequence(n)/lead for n in range(of+1, of+terms));
+        except Exception:
+            pass;
+        self.__fingerprints[id(f)] = (f, result);
+        return result;
+        
+    def __candidates(self, element, nodes):
+        '''
+            Method that returns the pairs (node, k) such that the k-th derivative of 'node' may have a linear
+            relation with 'element'.
+            
+            The pairs are sorted following the order of 'nodes'. The derivatives of the nodes are indexed by 
+            their fingerprint, so only the derivatives with the same fingerprint as 'element' are returned. 
+            If the fingerprint of 'element' can not be computed, all the pairs are returned.
+        '''
+        ## Indexing the new nodes
+        for node in nodes:
+            if(not (id(node) in self.__indexed and self.__indexed[id(node)] is node)):
+                self.__indexed[id(node)] = node;
+                for (k, der) in enumerate(self.__derivatives(node)):
+                    self.__index.setdefault(self.__fingerprint(der), []).append((node, k));
+        
+        fingerprint = self.__fingerprint(element);
+        if(fingerprint is None):
+            return [(node, k) for node in nodes for k in range(self.__trans[node][1].nrows())];
+            
+        position = {id(node) : i for (i, node) in enumerate(nodes)};
+        candidates = self.__index.get(fingerprint, []) + self.__index.get(None, []);
+        candidates = [(node, k) for (node, k) in candidates if id(node) in position];
+        return sorted(candidates, key=lambda p : (position[id(p[0])], p[1]));
+        
+    def __find_relation(self, g,f,d=None, filter=False):
         '''
             Method that get the relation between g and a f. If possible, it computes 
             the derivatives up to some order of f and check relations with them.
@@ -765,16 +987,27 @@ class LazyDDRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
                 - g: Function we want to see the relation
                 - f: Function or list of functions where we look for relations
                 - d: Optional parameter to limit
+                - filter: if True, only the functions with the same fingerprint as g are checked
         '''
         if(is_DDFunction(f)): # If f is a function, computing the derivatives
             f = [f.derivative(times=i) for i in range(f.order())];
         if(not(d is None)):
             f = f[:d]; # Limiting the list with the optional parameter d
         
+        fingerprint = self.__fingerprint(g) if filter else None;
         for k in range(len(f)):
+            if(not (fingerprint is None)):
+                other = self.__fingerprint(f[k]);
+                if((not (other is None)) and other != fingerprint):
+                    continue;
+            ## Checking the cache of negative results
+            key = (id(g), id(f[k]));
+            if(key in self.__no_relation and self.__no_relation[key][0] is g and self.__no_relation[key][1] is f[k]):
+                continue;
             res = self.__find_linear_relation(g,f[k]);
             if(not (res is None)):
                 return (k,res);
+            self.__no_relation[key] = (g, f[k]);
         
         return None;
     
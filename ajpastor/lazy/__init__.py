@@ -7,6 +7,7 @@ In this package the user may find the following subpackages:
 * lazyRing: conversion system based on a ring using the basics of lazyToPoly
 * lazyIDElements: the element class for lazyRing
 * lazyFracField: conversion system based on a Fraction Field using the basics of lazyToPoly
+* zero_oracle: probabilistic and memoized zero-testing for the polynomials of a conversion system
 
 TODO::
     * Review the import statements of this package
@@ -60,11 +60,25 @@ class ConversionSystem(object):
         
         self.__relations = None;
         self.__rel_ideal = None;
+        
+        self.__zero_oracle = None;
+        
+        self.__version = 0; # Number of times the relations changed
+        self.__normal_forms = {}; # Cache for the simplified polynomials
             
     ## Public getters
     def base(self):
         return self.__base;
         
+    def zero_oracle(self):
+        '''
+            Returns the :class:`~ajpastor.lazy.zero_oracle.ZeroOracle` used to decide if the polynomials of the conversion system are zero.
+        '''
+        if(self.__zero_oracle is None):
+            from .zero_oracle import ZeroOracle;
+            self.__zero_oracle = ZeroOracle(self);
+        return self.__zero_oracle;
+        
     def is_polynomial(self):
         '''
             Returns a Boolean value that show if there are variables in this conversion system.
@@ -92,19 +106,58 @@ class ConversionSystem(object):
         '''
         raise NotImplementedError("Abstract method not implemented 'map_of_vars()'");
         
+    def variable_key(self, variable):
+        '''
+            Returns the key that identifies a variable of `self.poly_ring()` (see `self.real_of_variable`).
+            
+            By default this key is the name of the variable. This method can be overwritten if the conversion
+            system has a more compact way of identifying its variables (like integer indices).
+        '''
+        return str(variable);
+        
+    def real_of_variable(self, key):
+        '''
+            Returns the element of `self.base()` represented by the variable with the given key (see `self.variable_key`).
+        '''
+        return self.map_of_vars()[key];
+        
+    def variable_sequence(self, key, n):
+        '''
+            Returns the first `n` elements of the sequence of the element represented by the variable with the given key.
+            
+            This method can be overwritten if the conversion system stores the initial values of its variables.
+        '''
+        real = self.real_of_variable(key);
+        try:
+            return real.sequence(n, True);
+        except AttributeError:
+            from ajpastor.misc.ring_w_sequence import sequence;
+            return [sequence(real, i) for i in range(n)];
+        
+    def relations_version(self):
+        '''
+            Returns a counter that increases every time the relations of the conversion system change.
+        '''
+        return self.__version;
+        
     ## Pulbic methods
     def add_relations(self, *relations):
         if(self.is_polynomial()):
             ## Adding the new relations
             self._relations(); # We make sure the relations are initialized
+            current = len(self.__relations);
                
             self.__add_relation(relations);
                 
-            ## Changing the ideal and computing a groebner basis
-            self.__relations = self._groebner_basis();
+            ## Changing the ideal and computing a groebner basis (only if something new was added)
+            if(len(self.__relations) > current):
+                ## The previous basis is used as starting point for the new basis
+                self.__relations = self._groebner_basis();
+                self.__relations_changed();
     
     def clean_relations(self):
         self.__relations = [];
+        self.__relations_changed();
         
     def _add_relation(self, poly):
         '''
@@ -139,7 +192,18 @@ class ConversionSystem(object):
             If the type is not valid, a TypeError exception will be risen. 
             If it is not possible to cast the element, a ValueError exception will be risen.
         '''
-        if(element in self.base()):
+        if(is_Matrix(element)):
+            rows = self.to_poly_rows(element);
+            R = self.poly_ring();
+            if(element.parent().base().is_field()):
+                R = self.poly_field();
+            return Matrix(R, rows);
+        elif(is_Vector(element)):
+            R = self.poly_ring();
+            if(element.parent().base().is_field()):
+                R = self.poly_field();
+            return vector(R, self.to_poly_rows([element])[_sage_const_0 ]);
+        elif(element in self.base()):
             return self._to_poly_element(element);
         elif(element in self.base().fraction_field()):
             n = self.to_poly(element.numerator());
@@ -155,16 +219,6 @@ class ConversionSystem(object):
                 return self.poly_field()(n/d);
             except AttributeError:
                 return self.to_poly(element.parent().to_real(poly));
-        elif(is_Matrix(element)):
-            R = self.poly_ring();
-            if(element.parent().base().is_field()):
-                R = self.poly_field();
-            return Matrix(R, [self.to_poly(row) for row in element]);
-        elif(is_Vector(element)):
-            R = self.poly_ring();
-            if(element.parent().base().is_field()):
-                R = self.poly_field();
-            return vector(R, [self.to_poly(el) for el in element]);
         elif(isinstance(element, list)):
             return [self.to_poly(el) for el in element];
         elif(isinstance(element, set)):
@@ -189,7 +243,17 @@ class ConversionSystem(object):
             
             If the type is not valid, a TypeError exception will be risen.
         '''
-        if(poly in self.poly_ring()):
+        if(is_Matrix(poly)):
+            R = self.base();
+            if(poly.parent().base().is_field()):
+                R = R.fraction_field();
+            return Matrix(R, self.to_real_rows(poly));
+        elif(is_Vector(poly)):
+            R = self.base();
+            if(poly.parent().base().is_field()):
+                R = R.fraction_field();
+            return vector(R, self.to_real_rows([poly])[_sage_const_0 ]);
+        elif(poly in self.poly_ring()):
             if(not self.is_polynomial()):
                 return self.base()(poly);
             try:
@@ -202,16 +266,6 @@ class ConversionSystem(object):
             n = self.to_real(poly.numerator());
             d = self.to_real(poly.denominator());
             return n/d;
-        elif(is_Matrix(poly)):
-            R = self.base();
-            if(poly.parent().base().is_field()):
-                R = R.fraction_field();
-            return Matrix(R, [self.to_real(row) for row in poly]);
-        elif(is_Vector(poly)):
-            R = self.base();
-            if(poly.parent().base().is_field()):
-                R = R.fraction_field();
-            return vector(R, [self.to_real(el) for el in poly]);
         elif(isinstance(poly, list)):
             return [self.to_real(el) for el in poly];
         elif(isinstance(poly, set)):
@@ -237,12 +291,12 @@ class ConversionSystem(object):
         if(element in self.poly_ring()):
             element = self.poly_ring()(element);
             try: # Weird case: fraction field fall in polynomial field
-                n = self._simplify(self.poly_ring()(element.numerator()));
-                d = self._simplify(self.poly_ring()(element.denominator()));
+                n = self.__normal_form(self.poly_ring()(element.numerator()));
+                d = self.__normal_form(self.poly_ring()(element.denominator()));
                 return n/d;
             except AttributeError:
                 try:
-                    return self._simplify(self.poly_ring()(element));
+                    return self.__normal_form(self.poly_ring()(element));
                 except AttributeError:
                     return element;
         elif(element in self.poly_field()):
@@ -260,17 +314,107 @@ class ConversionSystem(object):
             R = self.poly_ring();
             if(element.parent().base().is_field()):
                 R = self.poly_field();
-            return Matrix(R, [[self.simplify(el) for el in row] for row in element]);
+            return Matrix(R, self.simplify_rows(element));
         elif(is_Vector(element)):
             R = self.poly_ring();
             if(element.parent().base().is_field()):
                 R = self.poly_field();
-            return vector(R, [self.simplify(el) for el in element]);
+            return vector(R, self.simplify_rows([element])[_sage_const_0 ]);
         elif(element in self.base()):
             return self.to_real(self.simplify(self.to_poly(element)));
         else:
             return element;
         
+    ## Bulk conversion methods
+    def to_poly_rows(self, rows):
+        '''
+            Method that casts a matrix (or a list of rows) with elements in `self.base()` to polynomials in the conversion system.
+            
+            This method is equivalent to apply `self.to_poly` to each entry, but the membership of the entries to
+            `self.base()` is checked only once for each parent. Since the polynomial ring may grow during the conversion,
+            all the entries are returned in the final polynomial ring (or polynomial field if some entry is a fraction).
+            
+            Returns a list of lists of polynomials.
+        '''
+        kinds = {}; # parent -> whether it is part of `self.base()`
+        result = [];
+        for row in rows:
+            new_row = [];
+            for el in row:
+                if(self.__is_base_element(el, kinds)):
+                    new_row += [self._to_poly_element(el)];
+                else:
+                    new_row += [self.to_poly(el)];
+            result += [new_row];
+        
+        try:
+            R = self.poly_ring();
+            return [[R(el) for el in row] for row in result];
+        except (TypeError, ValueError):
+            R = self.poly_field();
+            return [[R(el) for el in row] for row in result];
+            
+    def to_real_rows(self, rows):
+        '''
+            Method that casts a matrix (or a list of rows) with polynomials in the conversion system to elements in `self.base()`.
+            
+            This method is equivalent to apply `self.to_real` to each entry, but the map of variables is read only once
+            and the powers of the variables and the monomials are evaluated only once for all the entries.
+            
+            Returns a list of lists of elements in `self.base()` (or its fraction field).
+        '''
+        if(not self.is_polynomial()):
+            return [[self.to_real(el) for el in row] for row in rows];
+            
+        R = self.poly_ring(); F = self.poly_field();
+        values = ({}, {}); # evaluated monomials and powers of the variables
+        result = [];
+        for row in rows:
+            new_row = [];
+            for el in row:
+                try:
+                    parent = el.parent();
+                except AttributeError:
+                    parent = None;
+                if(parent is R):
+                    new_row += [self.__evaluate(el, values)];
+                elif(parent is F):
+                    new_row += [self.__evaluate(R(el.numerator()), values)/self.__evaluate(R(el.denominator()), values)];
+                else:
+                    new_row += [self.to_real(el)];
+            result += [new_row];
+        return result;
+        
+    def simplify_rows(self, rows):
+        '''
+            Method that simplifies a matrix (or a list of rows) of polynomials using the relations of the conversion system.
+            
+            This method is equivalent to apply `self.simplify` to each entry, but the entries are reduced all together
+            with the same set of relations and the normal forms are shared among the entries.
+            
+            Returns a list of lists.
+        '''
+        if((not self.is_polynomial()) or (not self._relations())):
+            return [list(row) for row in rows];
+        
+        R = self.poly_ring(); F = self.poly_field();
+        result = [];
+        for row in rows:
+            new_row = [];
+            for el in row:
+                try:
+                    parent = el.parent();
+                except AttributeError:
+                    parent = None;
+                if(parent is R):
+                    new_row += [self.__normal_form(el)];
+                elif(parent is F):
+                    new_row += [self.__normal_form(R(el.numerator()))/self.__normal_form(R(el.denominator()))];
+                else:
+                    new_row += [self.simplify(el)];
+            result += [new_row];
+        return result;
+        
     def _simplify(self, poly):
         '''
             Auxiliar method that make the simplification of an element in self.poly_ring().
@@ -292,6 +436,7 @@ class ConversionSystem(object):
     ## Protected methods
     def _change_poly_ring(self, new_ring):
         if(not (self.poly_ring() is new_ring)):
+            self.__normal_forms = {};
             if(not(self.__relations is None)):
                 self.__relations = [new_ring(el) for el in self.__relations];
                 self.__rel_ideal = ideal(self.poly_ring(), []);
@@ -338,7 +483,8 @@ class ConversionSystem(object):
         if(len(variables) == 0):
             return self.base()(polynomial);
         try:
-            return sum([self.base()(coefficients[i])*prod([self.map_of_vars()[str(v)]**monomials[i].degree(v) for v in variables],self.base().one()) for i in range(len(monomials))],self.base().zero());
+            reals = [self.real_of_variable(self.variable_key(v)) for v in variables];
+            return sum([self.base()(coefficients[i])*prod([reals[j]**monomials[i].degree(variables[j]) for j in range(len(variables))],self.base().one()) for i in range(len(monomials))],self.base().zero());
         except Exception:
             multi = (len(variables) > _sage_const_1 );
             res = self.base().zero();
@@ -348,9 +494,9 @@ class ConversionSystem(object):
                 ## because the return of poly.dict() is different
                 if(multi):
                     for i in range(len(variables)):
-                        term *= (self.map_of_vars()[str(variables[i])]**k[i]);
+                        term *= (self.real_of_variable(self.variable_key(variables[i]))**k[i]);
                 else:
-                    term *= self.map_of_vars()[str(variables[_sage_const_0 ])]**k;
+                    term *= self.real_of_variable(self.variable_key(variables[_sage_const_0 ]))**k;
                     
                 res += term*self.base()(v);
                 
@@ -382,6 +528,80 @@ class ConversionSystem(object):
         raise NotImplementedError("Abstract method not implemented '_mix_conversion(conversion)'");
                 
     ## Private methods
+    def __is_base_element(self, element, kinds):
+        '''
+            Method that checks if an element can be converted with `self._to_poly_element`.
+            
+            The result is computed once for each parent and stored in the dictionary `kinds`.
+        '''
+        try:
+            parent = element.parent();
+        except AttributeError:
+            return False;
+        try:
+            return kinds[parent];
+        except KeyError:
+            result = (parent is self) or (parent is self.base()) or (self.base().has_coerce_map_from(parent));
+            kinds[parent] = result;
+            return result;
+        except TypeError: # the parent is not hashable
+            return False;
+        
+    def __evaluate(self, polynomial, values):
+        '''
+            Method that plugs the real values of the variables into a polynomial (see `self._to_real_element`).
+            
+            The argument `values` is a pair of dictionaries where the values of the monomials and of the
+            powers of the variables are stored, so they can be reused for several polynomials.
+        '''
+        variables = polynomial.variables();
+        if(len(variables) == _sage_const_0 ):
+            return self.base()(polynomial);
+        
+        (monomials, powers) = values;
+        try:
+            res = self.base().zero();
+            for (c, m) in zip(polynomial.coefficients(), polynomial.monomials()):
+                value = monomials.get(m, None);
+                if(value is None):
+                    value = self.base().one();
+                    for v in variables:
+                        e = m.degree(v);
+                        if(e > _sage_const_0 ):
+                            key = (self.variable_key(v), e);
+                            if(not key in powers):
+                                powers[key] = self.real_of_variable(key[_sage_const_0 ])**e;
+                            value *= powers[key];
+                    monomials[m] = value;
+                res += self.base()(c)*value;
+            return res;
+        except Exception:
+            return self._to_real_element(polynomial);
+        
+    def __relations_changed(self):
+        '''
+            Method that updates the version of the relations and removes the cached normal forms.
+        '''
+        self.__version += 1;
+        self.__normal_forms = {};
+        
+    def __normal_form(self, poly):
+        '''
+            Method that returns the simplification of a polynomial (see method `_simplify`) using a cache.
+            
+            The cache is cleaned every time the relations of the conversion system change.
+        '''
+        if(not self.__relations): # no relations: nothing to simplify
+            return poly;
+        try:
+            return self.__normal_forms[poly];
+        except KeyError:
+            result = self._simplify(poly);
+            self.__normal_forms[poly] = result;
+            return result;
+        except TypeError: # the polynomial is not hashable
+            return self._simplify(poly);
+        
     def __add_relation(self, relation):
         '''
         General method for adding relations that accepts any kind of argument posible.
@@ -408,7 +628,7 @@ class ConversionSystem(object):
     ## Magic Python methods
     def __repr__(self):
         if(self.is_polynomial()):
-            return "Conversion system with %d variables" %self.poly_ring().ngens();
+            return "Conversion system with %d variables" %len(self.map_of_vars());
         else:
             return "(Empty) Conversion system";
     
@@ -419,8 +639,8 @@ class ConversionSystem(object):
             out += "\tFrom: %s\n" %self.base();
             out += "\tTo  : %s\n" %self.poly_ring();
             out += "Map of the variables:\n";
-            for gen in self.poly_ring().gens():
-                out += "%s\t->\t%s\n" %(gen, repr(self.map_of_vars()[str(gen)]));
+            for (gen, real) in self.map_of_vars().items():
+                out += "%s\t->\t%s\n" %(gen, repr(real));
         return out;
         
 
@@ -3,6 +3,12 @@ Python file for a Lazy Fraction Field
 
 This module implements a conversion system based on a Fraction Field. This requires a Lazy Integral Domain.
 
+The fractions are not normalized after each arithmetic operation: the gcd between the numerator and the 
+denominator is only computed when the size of the fraction exceeds a threshold (see the attribute
+``_Normalization_Size`` of :class:`LazyFracField`) or when the numerator or the denominator are requested.
+Lists of fractions (like the rows of a matrix) can be normalized all together with one common denominator
+and only one gcd computation (see :func:`LazyFracField.normalize_row`).
+
 EXAMPLES::
 
     sage: from ajpastor.lazy.lazyFracField import *
@@ -42,6 +48,28 @@ from sage.categories.pushout import ConstructionFunctor;
 # risc.ajpastor imports
 from .lazyIDElements import *;
 
+def _lazy_size(element, bound=None, visited=None):
+    '''
+    Method that computes the number of different nodes in the structure of a lazy element.
+    
+    The shared nodes (see the interning of lazy elements) are counted only once. If `bound` is given,
+    the count stops as soon as it exceeds `bound`. The set `visited` (with the ids of the nodes already
+    counted) can be shared among several calls.
+    '''
+    if(visited is None):
+        visited = set();
+    pending = [element]; size = 0;
+    while(len(pending) > 0):
+        node = pending.pop();
+        if(id(node) in visited):
+            continue;
+        visited.add(id(node)); size += 1;
+        if((not (bound is None)) and size > bound):
+            break;
+        if(not isinstance(node, SimpleLIDElement)):
+            pending += list(node.__struct__());
+    return size;
+
 #####################################################
 ### Class for Lazy Fraction Field Elements
 #####################################################
@@ -73,14 +101,39 @@ class LazyFFElement(FieldElement):
             
         self.__n = n;
         self.__d = d;
+        self.__normalized = False;
         FieldElement.__init__(self,parent);
         
     def numerator(self):
+        self.simplify();
         return self.__n;
         
     def denominator(self):
+        self.simplify();
         return self.__d;
         
+    def _pair(self):
+        '''
+        Method that returns the numerator and denominator of `self` without normalizing them.
+        '''
+        return (self.__n, self.__d);
+        
+    def _set_normalized(self):
+        self.__normalized = True;
+        return self;
+        
+    def __deferred(self):
+        '''
+        Method that normalizes `self` only if the size of the fraction exceeds the threshold of the parent.
+        '''
+        bound = self.parent()._Normalization_Size; visited = set();
+        size = _lazy_size(self.__n, bound, visited);
+        if(size <= bound):
+            size += _lazy_size(self.__d, bound-size, visited);
+        if(size > bound):
+            self.simplify();
+        return self;
+        
     def _repr_(self):
         return "(%s):(%s)"%(repr(self.numerator()),repr(self.denominator()));
         
@@ -93,9 +146,12 @@ class LazyFFElement(FieldElement):
         if(not isinstance(other, LazyFFElement)):
             other = self.parent()(other);
             
-        N = self.numerator()*other.denominator()+self.denominator()*other.numerator();
-        D = self.denominator()*other.denominator();
-        return LazyFFElement(self.parent(), N, D).simplify();
+        (n1, d1) = self._pair(); (n2, d2) = other._pair();
+        if(d1 is d2):
+            N = n1+n2; D = d1;
+        else:
+            N = n1*d2+d1*n2; D = d1*d2;
+        return LazyFFElement(self.parent(), N, D).__deferred();
         
     def _sub_(self, other):
         if(not(other in self.parent())):
@@ -103,12 +159,18 @@ class LazyFFElement(FieldElement):
         if(not isinstance(other, LazyFFElement)):
             other = self.parent()(other);
             
-        N = self.numerator()*other.denominator()-self.denominator()*other.numerator();
-        D = self.denominator()*other.denominator();
-        return LazyFFElement(self.parent(), N, D).simplify();
+        (n1, d1) = self._pair(); (n2, d2) = other._pair();
+        if(d1 is d2):
+            N = n1-n2; D = d1;
+        else:
+            N = n1*d2-d1*n2; D = d1*d2;
+        return LazyFFElement(self.parent(), N, D).__deferred();
         
     def _neg_(self):
-        return LazyFFElement(self.parent(), -self.numerator(), self.denominator());
+        result = LazyFFElement(self.parent(), -self.__n, self.__d);
+        if(self.__normalized):
+            result._set_normalized();
+        return result;
         
     def _mul_(self, other):
         if(not(other in self.parent())):
@@ -116,9 +178,12 @@ class LazyFFElement(FieldElement):
         if(not isinstance(other, LazyFFElement)):
             other = self.parent()(other);
             
-        N = self.numerator()*other.numerator();
-        D = self.denominator()*other.denominator();
-        return LazyFFElement(self.parent(), N, D).simplify();
+        (n1, d1) = self._pair(); (n2, d2) = other._pair();
+        if(d1 is n2): # cross cancellation
+            return LazyFFElement(self.parent(), n1, d2).__deferred();
+        elif(n1 is d2):
+            return LazyFFElement(self.parent(), n2, d1).__deferred();
+        return LazyFFElement(self.parent(), n1*n2, d1*d2).__deferred();
         
     def _div_(self, other):
         if(not(other in self.parent())):
@@ -126,18 +191,25 @@ class LazyFFElement(FieldElement):
         if(not isinstance(other, LazyFFElement)):
             other = self.parent()(other);
             
-        N = self.numerator()*other.denominator();
-        D = self.denominator()*other.numerator();
-        return LazyFFElement(self.parent(), N, D).simplify();
+        (n1, d1) = self._pair(); (n2, d2) = other._pair();
+        if(n2 is self.parent().base().zero()):
+            raise ZeroDivisionError("The denominator can not be zero");
+        if(d1 is d2):
+            return LazyFFElement(self.parent(), n1, n2).__deferred();
+        elif(n1 is n2):
+            return LazyFFElement(self.parent(), d2, d1).__deferred();
+        return LazyFFElement(self.parent(), n1*d2, d1*n2).__deferred();
         
     ###############################
     ### Equality methods
     ############################### 
     def __eq__(self, other):
-        self.simplify();
+        if(other is self):
+            return True;
         try:
             if(isinstance(other, LazyFFElement)):
-                other.simplify();
+                if((self.__n is other.__n) and (self.__d is other.__d)):
+                    return True;
                 return (self.numerator() == other.numerator()) and (self.denominator() == other.denominator());
             elif(isinstance(other, LazyIDElement)):
                 other = other.simplify();
@@ -151,26 +223,28 @@ class LazyFFElement(FieldElement):
     ### Other methods
     ############################### 
     def raw(self):
-        self.simplify();
         if(self.denominator().raw() == _sage_const_1 ):
             return self.numerator().raw();
         raise ValueError("Impossible to compute an element within the domain: non 1 denominator");
     
     def simplify(self):
-        n = self.numerator().simplify();
-        d = self.denominator().simplify();
+        if(self.__normalized):
+            return self;
+        
+        n = self.__n.simplify();
+        d = self.__d.simplify();
         
         ## Special case: numerator is zero --> Return the zero element
         if(n == self.parent().base().zero()):
             self.__n = self.parent().base().zero();
             self.__d = self.parent().base().one();
-            return self;
+            return self._set_normalized();
             
         ## Special case: numerator and denominator are the same --> Return the one element
         if(n == d):
             self.__n = self.parent().base().one();
             self.__d = self.parent().base().one();
-            return self;
+            return self._set_normalized();
             
         ## Generic algorithm: compute gcd of numerator and denominator and divide by it
         num_divisor = n.max_divisor();
@@ -195,28 +269,31 @@ class LazyFFElement(FieldElement):
                 
         self.__n = n;
         self.__d = d;
-        return self;
+        return self._set_normalized();
         
     def reduce(self):
         return self.simplify();
         
     def derivative(self, *input):
         try:
-            N = self.numerator().derivative(*input)*self.denominator()-self.denominator().derivative(*input)*self.numerator();
-            D = self.denominator()**_sage_const_2 ;
+            (n, d) = self._pair();
+            N = n.derivative(*input)*d-d.derivative(*input)*n;
+            D = d**_sage_const_2 ;
             
-            return LazyFFElement(self.parent(), N, D).simplify();
+            return LazyFFElement(self.parent(), N, D).__deferred();
         except AttributeError:
             raise AttributeError("Impossible derivate elements of %s" %(self.parent().base()));
             
     def get_basic_elements(self):
-        return self.numerator().get_basic_elements().union(self.denominator().get_basic_elements());
+        return self.__n.get_basic_elements().union(self.__d.get_basic_elements());
         
 #####################################################
 ### Class for Lazy Fraction Fields
 #####################################################
 class LazyFracField(UniqueRepresentation, Field):
     Element = LazyFFElement;
+    
+    _Normalization_Size = 40; # Maximal size of a fraction before computing the gcd of numerator and denominator
 
     def __init__(self, base):
         if base not in IntegralDomains():
@@ -312,6 +389,45 @@ class LazyFracField(UniqueRepresentation, Field):
     def element(self, n,d = None):
         return LazyFFElement(self, n,d);
         
+    def normalize_row(self, row):
+        '''
+        Method that normalizes a list of elements of `self` (for example, a row of a matrix) all together.
+        
+        The elements are written with one common denominator (the lcm of the different denominators)
+        and only one gcd between this denominator and all the numerators is computed, instead of one gcd
+        for each element. The resulting elements are not marked as normalized: each of them may still
+        be reduced on its own when its numerator or denominator are requested.
+
+        If the common denominator can not be computed, each element is normalized independently.
+        '''
+        row = [el if isinstance(el, LazyFFElement) else self(el) for el in row];
+        if(len(row) == _sage_const_0 ):
+            return row;
+        
+        pairs = [el._pair() for el in row];
+        try:
+            ## Computing the common denominator
+            different = [];
+            for (_,d) in pairs:
+                if(not any(d is other for other in different)):
+                    different += [d];
+            D = different[_sage_const_0 ];
+            for d in different[_sage_const_1 :]:
+                D = D.lcm(d);
+            numerators = [n*D.divide(d) for (n,d) in pairs];
+                
+            ## Computing the common gcd
+            non_zero = [n for n in numerators if not n.is_zero()];
+            if(len(non_zero) > _sage_const_0 ):
+                common = D.gcd(*non_zero);
+                if(not common.is_one()):
+                    numerators = [n if n.is_zero() else n.divide(common) for n in numerators];
+                    D = D.divide(common);
+            
+            return [LazyFFElement(self, n, D) for n in numerators];
+        except (ValueError, TypeError, ArithmeticError, AttributeError):
+            return [el.simplify() for el in row];
+        
 ## Changes in LazyIntegralDomain
 
 LazyIntegralDomain.Fraction_Field = LazyFracField;
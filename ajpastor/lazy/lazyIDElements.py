@@ -5,9 +5,23 @@ This module provides the implementation of the Element class for LazyRings
 based on Integral Domains. It contains all the arithmetic functionality
 required to make it work with linear algebra algorithms.
 
+The elements are hash-consed: each :class:`LazyIntegralDomain` keeps a table with the
+elements that are alive, indexed by their structure (the raw value for simple elements
+and the children and their multiplicities for sums and products). Building an element
+that is structurally equal to an existing one returns the existing node, so the
+expression trees become DAGs where the raw values, maximal divisors and simplifications
+are computed only once, and equality of simple elements is a pointer comparison.
+
 EXAMPLES::
 
     sage: from ajpastor.lazy.lazyIDElements import *
+    sage: R = LazyDomain(QQ['x'])
+    sage: x = QQ['x'].gens()[0]
+    sage: a = SimpleLIDElement(R, x); b = SimpleLIDElement(R, x)
+    sage: a is b
+    True
+    sage: (a*b) is (b*a)
+    True
 
 TODO:
     * Do the examples section in this documentation
@@ -35,6 +49,9 @@ from sage.all_cmdline import *   # import sage library
 _sage_const_2 = Integer(2); _sage_const_1 = Integer(1); _sage_const_10 = Integer(10); _sage_const_0 = Integer(0); _sage_const_20 = Integer(20)
 
 # Some needed imports
+import weakref
+
+from sage.misc.classcall_metaclass import ClasscallMetaclass, typecall
 from sage.rings.ring import IntegralDomain
 from sage.structure.element import IntegralDomainElement
 from sage.categories.integral_domains import IntegralDomains
@@ -45,13 +62,23 @@ _MAX_INTEGER = Integer(_sage_const_2 **_sage_const_10 -_sage_const_1 )
 #####################################################
 ### Class for Lazy Integral Domain Elements
 #####################################################
-class LazyIDElement(IntegralDomainElement):
+class LazyIDElement(IntegralDomainElement, metaclass=ClasscallMetaclass):
+    @staticmethod
+    def __classcall__(cls, parent, *input):
+        '''
+        Method that builds a new element and returns the node of the parent that is structurally equal to it.
+        '''
+        element = typecall(cls, parent, *input)
+        return element.parent()._intern(element)
+
     def __init__(self, parent):
         if(not (isinstance(parent, LazyIntegralDomain))):
             parent = LazyDomain(parent)
 
         self.__raw = None
         self.__max_divisor = None
+        self.__key = None
+        self.__shared = False
 
         IntegralDomainElement.__init__(self, parent)
 
@@ -144,15 +171,41 @@ class LazyIDElement(IntegralDomainElement):
         raise AttributeError("Method not implemented")
 
     def is_zero(self):
+        if(self is self.parent().zero()):
+            return True
         if(self.__raw is None):
             return self.__inner_is_zero__()
         return self.raw() == self.base().zero()
 
     def is_one(self):
+        if(self is self.parent().one()):
+            return True
         if(self.__raw is None):
             return self.__inner_is_one__()
         return self.raw() == self.base().one()
 
+    ###############################
+    ### Hash-consing methods
+    ###############################
+    def _intern_key(self):
+        '''
+        Method that returns the key of `self` in the table of nodes of its parent.
+        '''
+        if(self.__key is None):
+            self.__key = (self.__class__, self.__struct_key__())
+        return self.__key
+
+    def _set_shared(self, shared):
+        self.__shared = shared
+        if(not shared):
+            self.__key = None
+
+    def _is_shared(self):
+        '''
+        Method that returns whether `self` is the node stored in the table of its parent.
+        '''
+        return self.__shared
+
     ###############################
     ### Arithmetic methods
     ###############################
@@ -227,6 +280,9 @@ class LazyIDElement(IntegralDomainElement):
     def __struct__(self):
         raise NotImplementedError("This method has not been implemented for this type of LazyElement")
 
+    def __struct_key__(self):
+        raise NotImplementedError("This method has not been implemented for this type of LazyElement")
+
     def __inner_is_multiple__(self, element):
         raise NotImplementedError("This method has not been implemented for this type of LazyElement")
 
@@ -300,6 +356,15 @@ class SimpleLIDElement(LazyIDElement):
     def __struct__(self):
         return self.raw()
 
+    def __struct_key__(self):
+        ## DDFunctions are keyed by identity: their hash computes several initial values
+        ## and the equality test may require a closure property
+        from ajpastor.dd_functions.ddFunction import is_DDFunction
+        raw = self.raw()
+        if(is_DDFunction(raw)):
+            return _IdentityKey(raw)
+        return raw
+
     def __inner_is_multiple__(self, element):
         return False
 
@@ -355,10 +420,17 @@ class SimpleLIDElement(LazyIDElement):
     ### Equality methods
     ###############################
     def __eq__(self, other):
+        if(other is self):
+            return True
         if(self._is_pure_in_base(other)):
             other = self.parent()(other)
         if(isinstance(other, LazyIDElement)):
             if(isinstance(other, SimpleLIDElement)):
+                ## Two shared simple elements with the same raw value are the same node
+                ## (only when the node is keyed by structure, not by identity)
+                if(other.parent() is self.parent() and self._is_shared() and other._is_shared()
+                        and not isinstance(self.__struct_key__(), _IdentityKey)):
+                    return other is self
                 return self.raw() == other.raw()
             else:
                 return other.__eq__(self)
@@ -442,6 +514,7 @@ class ProductLIDElement(LazyIDElement):
                 current = current_dic[key]
                 s_key = key.simplify()
                 if(s_key.is_zero()):
+                    self.parent()._release(self)
                     self.__factors = {self.parent().zero():_sage_const_1 }
                     return self.parent().zero()
                 if((not (s_key.is_one())) and (current > _sage_const_0 )):
@@ -451,6 +524,8 @@ class ProductLIDElement(LazyIDElement):
             if(mone in new_dic):
                 new_dic[mone] = new_dic[mone]%_sage_const_2 
 
+            if(new_dic != current_dic):
+                self.parent()._release(self)
             self.__factors = new_dic
 
         if(len(self.__factors) == _sage_const_0 ):
@@ -522,6 +597,9 @@ class ProductLIDElement(LazyIDElement):
     def __struct__(self):
         return self.__factors
 
+    def __struct_key__(self):
+        return frozenset((id(key), value) for (key, value) in self.__factors.items())
+
     def __inner_is_multiple__(self, element):
         if(self._is_pure_in_base(element)):
             element = self.parent()(element)
@@ -624,6 +702,8 @@ class ProductLIDElement(LazyIDElement):
     ### Equality methods
     ###############################
     def __eq__(self, other):
+        if(other is self):
+            return True
         if(self._is_pure_in_base(other)):
             other = self.parent()(other)
 
@@ -757,6 +837,8 @@ class SumLIDElement(LazyIDElement):
                 if((not (s_key.is_zero())) and (not(current == _sage_const_0 ))):
                     new_dic[s_key] = new_dic.get(s_key,_sage_const_0 ) + current
 
+            if(new_dic != current_dic):
+                self.parent()._release(self)
             self.__summands = new_dic
 
         if(len(self.__summands) == _sage_const_0 ):
@@ -816,6 +898,9 @@ class SumLIDElement(LazyIDElement):
     def __struct__(self):
         return self.__summands
 
+    def __struct_key__(self):
+        return frozenset((id(key), value) for (key, value) in self.__summands.items())
+
     def __inner_is_multiple__(self, element):
         max_divisor = self.max_divisor()
         inner = max_divisor.__struct__().keys()[_sage_const_0 ]
@@ -905,6 +990,8 @@ class SumLIDElement(LazyIDElement):
     ### Equality methods
     ###############################
     def __eq__(self, other):
+        if(other is self):
+            return True
         if(self._is_pure_in_base(other)):
             other = self.parent()(other)
 
@@ -962,12 +1049,49 @@ class LazyIntegralDomain(UniqueRepresentation, IntegralDomain):
             raise ValueError("%s is no integral domain" % base)
         IntegralDomain.__init__(self, base, category=IntegralDomains())
 
+        ## Table of the living nodes (it must exist before building any element)
+        self.__nodes = weakref.WeakValueDictionary()
+
         self._zero_element = SimpleLIDElement(self, base.zero())
         self._one_element = SimpleLIDElement(self, base.one())
 
         self.base().register_conversion(LIDSimpleMorphism(self, self.base()))
 
 
+    ### Hash-consing methods
+    def _intern(self, element):
+        '''
+        Method that returns the node of `self` structurally equal to `element`.
+
+        If there is no such node, `element` is stored in the table of nodes and returned. Elements
+        whose structure can not be hashed are returned without being stored.
+        '''
+        try:
+            key = element._intern_key()
+            node = self.__nodes.get(key, None)
+            if(node is None):
+                self.__nodes[key] = element
+                element._set_shared(True)
+                return element
+            return node
+        except TypeError: # the structure is not hashable
+            element._set_shared(False)
+            return element
+
+    def _release(self, element):
+        '''
+        Method that removes `element` from the table of nodes. It must be called before changing the
+        structure of a node (see the methods `simplify`), since its key is no longer valid.
+        '''
+        if(element._is_shared()):
+            try:
+                key = element._intern_key()
+                if(self.__nodes.get(key, None) is element):
+                    del self.__nodes[key]
+            except (TypeError, KeyError):
+                pass
+            element._set_shared(False)
+
     def fraction_field(self):
         if(not(LazyIntegralDomain.Fraction_Field is None)):
             return LazyIntegralDomain.Fraction_Field(self)
@@ -1098,6 +1222,24 @@ class LIDSimpleMorphism (sage.categories.map.Map):
     def _call_(self, p):
         return self.codomain()(p.raw())
 
+#####################################################
+### Auxiliary class for the keys of the nodes
+#####################################################
+class _IdentityKey(object):
+    '''
+    Key that compares (and hashes) an object by its identity.
+    '''
+    __slots__ = ("__object",)
+
+    def __init__(self, obj):
+        self.__object = obj
+
+    def __hash__(self):
+        return id(self.__object)
+
+    def __eq__(self, other):
+        return isinstance(other, _IdentityKey) and other.__object is self.__object
+
 #####################################################
 ### Global and static elements
 #####################################################
@@ -30,7 +30,7 @@ AUTHORS:
 # (at your option) any later version.
 #                  https://www.gnu.org/licenses/
 # ****************************************************************************
-from sage.all import (QQ, gcd, lcm, UniqueRepresentation, var, PolynomialRing, 
+from sage.all import (QQ, gcd, lcm, UniqueRepresentation, PolynomialRing, 
                         IntegralDomains, Fields, IntegralDomain, IntegralDomainElement)
 from sage.categories.map import Map #pylint: disable=no-name-in-module
 from sage.categories.pushout import ConstructionFunctor
@@ -239,29 +239,14 @@ class _LazyElement(IntegralDomainElement):
 
     def is_zero(self):
         result = (self.poly() == 0 )
-        if((not result) and (self(**{repr(self.parent().base().variables()[0]):0}) == 0)):
-            if(not (self.__raw is None)):
-                result = self.raw() == 0
+        if(not result):
+            pol = None
+            if(self.poly() in self.parent().poly_ring()):
+                pol = self.parent().poly_ring()(self.poly())
             else:
-                pol = None
-                if(self.poly() in self.parent().poly_ring()):
-                    pol = self.parent().poly_ring()(self.poly())
-                else:
-                    pol = self.parent().poly_ring()(self.poly().numerator())
-
-                factors = None
-                try:
-                    try:
-                        factors = pol.factor(proof=True)
-                    except NotImplementedError:
-                        factors = pol.factor(proof=False)
-                except:
-                    factors = [(pol,1 )]
-                for factor in factors:
-                    result = (self.parent().to_real(factor[0 ]) == 0 )
-                    if(result):
-                        self.parent().add_relations(factor[0 ])
-                        break
+                pol = self.parent().poly_ring()(self.poly().numerator())
+
+            result = self.parent().zero_oracle().is_zero(pol, self.__raw)
 
         return result
 
@@ -295,6 +280,8 @@ class LazyRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
 
     Element = _LazyElement
 
+    _Initial_Capacity = 4 # Number of generators of the first polynomial ring used
+
     def __init__(self, base, constants=QQ, category=None):
         ## Checking the arguments
         if(not (constants in _Fields)):
@@ -310,10 +297,14 @@ class LazyRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         self.__constants = constants
 
         self.__poly_ring = None
+        self.__capacity = 0 # Number of generators in the polynomial ring (used or not)
         self._change_poly_ring(constants)
 
-        ## Initializing the map of variables (if there is enough)
-        self.__map_of_vars = {}
+        ## Initializing the tables of variables (indexed by order of creation)
+        self.__functions = [] # index -> element of 'base' represented by the variable
+        self.__names = [] # index -> name of the variable
+        self.__ids = {} # variable -> index
+        self.__map_of_vars = None # Map from names to elements of 'base' (only for display)
 
         ## Initializing the map of derivatives
         self.__map_of_derivatives = {}
@@ -336,10 +327,26 @@ class LazyRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         return self.__poly_field
 
     def map_of_vars(self):
+        if(self.__map_of_vars is None):
+            self.__map_of_vars = {self.__names[i] : self.__functions[i] for i in range(len(self.__functions))}
         return self.__map_of_vars
 
     def variables(self):
-        return tuple(self.poly_ring()(key) for key in self.map_of_vars().keys())
+        return tuple(self.poly_ring()(name) for name in self.__names)
+
+    def variable_key(self, variable):
+        '''
+            Returns the index of a variable of ``self.poly_ring()`` (the position in which it was created).
+        '''
+        try:
+            return self.__ids[variable]
+        except KeyError:
+            key = self.__names.index(str(variable))
+            self.__ids[variable] = key
+            return key
+
+    def real_of_variable(self, key):
+        return self.__functions[key]
 
     def _change_poly_ring(self, new_ring):
         super(LazyRing, self)._change_poly_ring(new_ring)
@@ -380,36 +387,34 @@ class LazyRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         ## Otherwise we look for a linear relation between the element and the variables
         var_found = None
         rel = None
-        for key in self.map_of_vars().keys():
-            rel = self.__find_relation(element, self.map_of_vars()[key])
+        for key in range(len(self.__functions)):
+            rel = self.__find_relation(element, self.__functions[key])
             if(not (rel is None)):
                 var_found = key
                 break
 
         ## If we find no relation, we add a new variable
         if(rel is None):
-            new_var = None
-            if(self.poly_ring() is self.__constants):
-                new_var = var("%s0" %self.__var_name)
-                self._change_poly_ring(PolynomialRing(self.__constants,new_var, order="lex"))
-                self.__map_of_vars[str(new_var)] = element
-            else:
-                new_var = var("%s%d" %(self.__var_name,self.poly_ring().ngens()))
-                self._change_poly_ring(PolynomialRing(self.__constants, [new_var]+list(self.poly_ring().gens()), order="lex"))
-                self.__map_of_vars[str(new_var)] = element
+            index = len(self.__functions)
+            if(index >= self.__capacity):
+                self.__grow_pool()
+            self.__functions += [element]
+            self.__names += [self.__pool[index]]
+            self.__map_of_vars = None
 
-            return new_var
+            return self.poly_ring()(self.__pool[index])
 
         ## We try to keep the real representations small
         try:
             new_elem = (element-rel[1 ])/rel[0 ]
-            if(new_elem.size() < self.map_of_vars()[var_found].size()):
-                self.__map_of_vars[var_found] = new_elem
+            if(new_elem.size() < self.__functions[var_found].size()):
+                self.__functions[var_found] = new_elem
+                self.__map_of_vars = None
         except:
             pass
 
         ## Otherwise, we return the polynomial computed
-        return self.poly_ring()(rel[0 ]*self.poly_ring()(var_found) + rel[1 ])
+        return self.poly_ring()(rel[0 ]*self.poly_ring()(self.__names[var_found]) + rel[1 ])
 
     ################################################################################################
     ### Other Methods for LazyRing
@@ -426,13 +431,20 @@ class LazyRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
 
         ## Return to the basic constant field
         self._change_poly_ring(self.__constants)
+        self.__capacity = 0
 
         ## Deleting the variables created
-        self.__map_of_vars = {}
+        self.__functions = []
+        self.__names = []
+        self.__ids = {}
+        self.__map_of_vars = None
 
         ## Deleting the map of derivatives
         self.__map_of_derivatives = {}
 
+        ## The variables may change their meaning
+        self.zero_oracle().clear()
+
         self.__version += 1
 
     def change_variable_name(self, new_name):
@@ -451,7 +463,7 @@ class LazyRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
             try:
                 el = self.poly_ring()(el)
                 if(el in self.poly_ring().gens()):
-                    new_poly = self.to_poly(self.map_of_vars()[str(el)].derivative())
+                    new_poly = self.to_poly(self.__functions[self.variable_key(el)].derivative())
                     self.__map_of_derivatives[el] = new_poly
                     return new_poly
             except:
@@ -534,7 +546,7 @@ class LazyRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
                 ## For each variable in X.poly(), we get the new polynomial
                 translate = {}
                 for var in X.variables():
-                    translate[str(var)] = self.to_poly(other.map_of_vars()[str(var)])
+                    translate[str(var)] = self.to_poly(other.real_of_variable(other.variable_key(var)))
 
                 ## We now plugin the expressions
                 return _LazyElement(self, pol(**translate))
@@ -561,8 +573,8 @@ class LazyRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         return "Lazy Ring over (%s)" %(repr(self.base()))
 
     def __str__(self):
-        final = "%s with %d variables\n{\n" %(self.__repr__(),len(self.__map_of_vars.keys()))
-        for k,v in self.__map_of_vars.items():
+        final = "%s with %d variables\n{\n" %(self.__repr__(),len(self.__functions))
+        for k,v in self.map_of_vars().items():
             final += "\t%s : %s,\n" %(k, repr(v))
         final += "}"
         return final
@@ -570,6 +582,22 @@ class LazyRing (UniqueRepresentation, ConversionSystem, IntegralDomain):
         ################################################################################################
     ### Private methods
     ################################################################################################
+    def __grow_pool(self):
+        '''
+            Method that doubles the number of generators of the polynomial ring of ``self``.
+
+            The generators are allocated from a pool, so the polynomial ring only changes (and the
+            polynomials and relations are converted) when all its generators are already in use.
+            The newest generators are always the biggest in the lexicographic order.
+        '''
+        capacity = max(LazyRing._Initial_Capacity, 2*self.__capacity)
+        old = [] if (self.__capacity == 0) else [str(g) for g in self.poly_ring().gens()]
+        new = ["%s%d" %(self.__var_name, i) for i in range(capacity-1, self.__capacity-1, -1)]
+        self._change_poly_ring(PolynomialRing(self.__constants, new + old, order="lex"))
+
+        self.__pool = list(reversed(new + old)) # index -> name of the generator
+        self.__capacity = capacity
+
     def __create_poly_field(self):
         if(isUniPolynomial(self.__poly_ring) or (isMPolynomial(self.__poly_ring))):
             self.__poly_field = self.__poly_ring.fraction_field()
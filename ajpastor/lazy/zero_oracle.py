@@ -0,0 +1,217 @@
+r"""
+Python file for a zero-testing oracle for conversion systems.
+
+When working lazily with a :class:`~ajpastor.lazy.conversion.ConversionSystem`, we need to decide whether
+a polynomial in the variables of the conversion system represents the zero element or not. Proving that an
+element is zero is usually very expensive (it requires building the real element and performing a closure
+computation), but most of the times the element is not zero and this can be checked easily looking
+to its sequence of coefficients.
+
+This module offers the class :class:`ZeroOracle` that combines three steps:
+
+* A fast probabilistic filter: the first coefficients of the polynomial (evaluated on the power series
+  of the variables) are computed modulo several random primes. If any of them is not zero, the polynomial
+  is not zero. The number of coefficients is taken from the orders of the equations of the variables
+  and the degree of the polynomial.
+* A memo table with the result of each (normalized) polynomial already checked. The relations proven
+  are added to the conversion system the first time they are requested, even if the proof was memoized
+  before.
+* The exact proof, that is performed only when the filter can not show the element is not zero.
+
+EXAMPLES::
+
+    sage: from ajpastor.dd_functions import *
+    sage: from ajpastor.dd_functions.lazyDDRing import LazyDDRing
+    sage: R = LazyDDRing(DFinite)
+    sage: s = R(Sin(x)); c = R(Cos(x))
+    sage: (s^2 + c^2 - 1).is_zero()
+    True
+    sage: (s^2 - c^2).is_zero()
+    False
+
+AUTHORS:
+
+    - Antonio Jimenez-Pastor (2016-10-01): initial version
+
+"""
+
+# ****************************************************************************
+#  Copyright (C) 2019 Antonio Jimenez-Pastor <ajpastor@risc.uni-linz.ac.at>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#                  https://www.gnu.org/licenses/
+# ****************************************************************************
+
+from sage.all import GF, PowerSeriesRing, random_prime, binomial, prod
+from sage.rings.polynomial.infinite_polynomial_element import InfinitePolynomial
+
+class ZeroOracle(object):
+    r'''
+        Class for a zero-testing oracle over a conversion system.
+
+        INPUT:
+            * ``conversion``: the :class:`~ajpastor.lazy.conversion.ConversionSystem` where the polynomials live.
+            * ``trials``: number of random primes used in the probabilistic filter.
+            * ``max_terms``: maximal number of coefficients checked in the probabilistic filter.
+    '''
+    def __init__(self, conversion, trials=3, max_terms=50):
+        self.__conversion = conversion
+        self.__trials = trials
+        self.__max_terms = max_terms
+
+        self.__memo = {} # normalized polynomial -> factor proven to be zero (or False)
+        self.__related = set() # normalized polynomials whose zero factor was added as a relation
+        self.__sequences = {} # key of a variable -> known coefficients of its real value
+
+    def clear(self):
+        r'''
+            Method to remove all the cached data of the oracle.
+
+            This method must be called if the meaning of the variables of the conversion system changes.
+        '''
+        self.__memo = {}
+        self.__related = set()
+        self.__sequences = {}
+
+    def is_zero(self, pol, real=None, add_relations=True):
+        r'''
+            Method to check whether a polynomial represents the zero element or not.
+
+            INPUT:
+                * ``pol``: a polynomial in the variables of the conversion system.
+                * ``real``: the real element represented by ``pol`` (if known). If given, the exact proof
+                  is done comparing it with zero. Otherwise, the polynomial is factored and the real element
+                  of each factor is compared with zero.
+                * ``add_relations``: if ``True``, the polynomials that are proven to be zero are added as
+                  relations to the conversion system.
+        '''
+        if(pol == 0):
+            return True
+        key = self.__key(pol)
+        if(not key in self.__memo):
+            result = False
+            if(self.probably_zero(pol) != False): # we need the exact proof
+                if(not (real is None)):
+                    if(real == 0):
+                        result = pol
+                else:
+                    for factor in self.__factors(pol):
+                        if(self.__is_zero_factor(factor, add_relations)):
+                            result = factor
+                            break
+            self.__memo[key] = result
+        return self.__check_relation(key, add_relations)
+
+    def probably_zero(self, pol):
+        r'''
+            Method that runs the probabilistic filter over a polynomial.
+
+            This method computes the first coefficients of the element represented by ``pol`` modulo
+            several random primes.
+
+            OUTPUT:
+
+            ``False`` if the polynomial is not zero for sure, ``True`` if it is probably zero and ``None`` if
+            the filter could not be applied.
+        '''
+        if(isinstance(pol, InfinitePolynomial)):
+            pol = pol.polynomial()
+        variables = pol.variables()
+        if(len(variables) == 0):
+            return pol == 0
+
+        ## Computing the number of terms and the coefficients of the variables
+        n = self.__terms(pol, variables)
+        keys = [self.__conversion.variable_key(g) if g in variables else None for g in pol.parent().gens()]
+        try:
+            sequences = {key : self.__sequence(key, n) for key in keys if not (key is None)}
+        except Exception: # not enough data to compute the sequences
+            return None
+
+        result = None
+        for _ in range(self.__trials):
+            F = GF(random_prime(2**30, lbound=2**20))
+            try:
+                S = PowerSeriesRing(F, 't', default_prec=n)
+                values = [S.zero() if key is None else S([F(c) for c in sequences[key]], prec=n) for key in keys]
+                value = pol.change_ring(F)(*values)
+            except (TypeError, ValueError, ArithmeticError): # the reduction modulo this prime is not possible
+                continue
+            if(any(c != 0 for c in value.list())):
+                return False
+            result = True
+        return result
+
+    #################################################
+    ### Private methods
+    #################################################
+    def __key(self, pol):
+        try:
+            return pol/pol.lc()
+        except (AttributeError, TypeError, ArithmeticError):
+            return pol
+
+    def __check_relation(self, key, add_relations):
+        r'''
+            Returns the memoized result for ``key`` adding its zero factor as a relation if requested
+            and not done before (the result may have been memoized with ``add_relations=False``).
+        '''
+        relation = self.__memo[key]
+        if(relation is False):
+            return False
+        if(add_relations and not key in self.__related):
+            self.__conversion.add_relations(relation)
+            self.__related.add(key)
+        return True
+
+    def __factors(self, pol):
+        try:
+            try:
+                return [factor[0] for factor in pol.factor(proof=True)]
+            except NotImplementedError:
+                return [factor[0] for factor in pol.factor(proof=False)]
+        except Exception:
+            return [pol]
+
+    def __is_zero_factor(self, factor, add_relations):
+        key = self.__key(factor)
+        if(not key in self.__memo):
+            result = False
+            if(self.probably_zero(factor) != False and self.__real(factor) == 0):
+                result = factor
+            self.__memo[key] = result
+        return self.__check_relation(key, add_relations)
+
+    def __real(self, pol):
+        real = self.__conversion.to_real(pol)
+        try:
+            return real.raw()
+        except AttributeError:
+            return real
+
+    def __terms(self, pol, variables):
+        r'''
+            Bound for the number of terms checked in the filter.
+
+            Each monomial `\prod v_i^{e_i}` satisfies a linear equation of order at most `\prod \binom{r_i+e_i-1}{e_i}`
+            where `r_i` is the order of `v_i`. We add these bounds for all the monomials and the degree of ``pol``.
+        '''
+        orders = []
+        for v in variables:
+            try:
+                orders += [self.__conversion.real_of_variable(self.__conversion.variable_key(v)).order()]
+            except (AttributeError, TypeError):
+                orders += [1]
+        bound = 0
+        for m in pol.monomials():
+            bound += prod([binomial(orders[i]+m.degree(variables[i])-1, m.degree(variables[i])) for i in range(len(variables)) if m.degree(variables[i]) > 0], 1)
+        return min(self.__max_terms, bound + pol.degree() + 1)
+
+    def __sequence(self, key, n):
+        if(len(self.__sequences.get(key, [])) < n):
+            self.__sequences[key] = self.__conversion.variable_sequence(key, n)
+        return self.__sequences[key][:n]
+
@@ -9,10 +9,14 @@ In this package the user may find the following subpackages:
       inhomogeneous liner systems within an Euclidean domain. 
     * :mod:`~ajpastor.misc.bareiss`: linear solver that uses Bareiss' algorithm to perform elimination. Useful to get
       nullspaces in Integral domains.
+    * :mod:`~ajpastor.misc.solver_dispatcher`: automatic selection of the linear solver for a system, learning 
+      from the timings of previous computations.
 
 * :mod:`~ajpastor.misc.cached_property`: implementation of a decorator to declared derived attributes of objects
 * :mod:`~ajpastor.misc.dynamic_string`: implementation of an enhanced string where it can be built from different pieces
 * :mod:`~ajpastor.misc.exceptions`: basic Exceptions for general use
+* :mod:`~ajpastor.misc.import_benchmark`: measurement of the import time of the packages
+* :mod:`~ajpastor.misc.memory_benchmark`: measurement of the memory used by objects
 * :mod:`~ajpastor.misc.matrix`: basic operations and utilities with matrices and differential linear algebra
 * :mod:`~ajpastor.misc.ring_w_sequence`: implementation of a Ring class where their elements define a sequence
 * :mod:`~ajpastor.misc.sequence_manipulation`: module with method to manipulate sequences in black-box format
@@ -22,7 +22,7 @@ AUTHORS:
 
 # Sage imports
 from sage.all import (Matrix, Permutations, ideal, gcd, cached_method, vector, lcm, prod,
-                        identity_matrix, diagonal_matrix)
+                        diagonal_matrix)
 from sage.rings.polynomial.polynomial_ring import is_PolynomialRing as isUniPolynomial
 from sage.rings.polynomial.multi_polynomial_ring import is_MPolynomialRing as isMPolynomial
 
@@ -56,6 +56,9 @@ class BareissAlgorithm(LinearSystemSolver):
             * ``method``: method for the membership problem for the ideal `I`.
             * ``relations``: list of relation known for the variables of ``parent``. This, together with ``method`` is use to 
               check the membership to the ideal `I`.
+            * ``pivoting``: strategy to choose the pivots. If ``"first"`` (default), we take the first valid entry
+              in the column. If ``"size"``, we ask first the membership problem for the smallest entries (with respect to
+              number of terms and degree).
 
         EXAMPLES::
 
@@ -144,15 +147,33 @@ class BareissAlgorithm(LinearSystemSolver):
             [0 0 0]
             sage: BA.relations()
             [a^2 + b^2]
+
+        The pivots can be chosen using the size of the entries. This is useful when the method ``is_zero`` is
+        expensive, since it is called first over the simplest entries::
+
+            sage: M = Matrix([[a^2, b], [-b, 1]])
+            sage: BA = BareissAlgorithm(R, M, lambda p : p.reduce([a^2+b^2]) == 0, pivoting="size")
+            sage: BA.echelon_form()
+            [-b 1]
+            [ 0 0]
+            sage: BA.rank()
+            1
+            sage: BA.relations()
+            [a^2 + b^2]
     '''
     ### Initialization method
-    def __init__(self, parent, matrix, is_zero=lambda p : False, relations = []):
+    def __init__(self, parent, matrix, is_zero=lambda p : False, relations = [], pivoting = "first"):
         ## Checking the parent parameter
         if(parent.is_field()):
             parent = parent.base()
         if(not (isUniPolynomial(parent) or isMPolynomial(parent))):
             raise TypeError("The parent for this algorithm must be a polynomial ring.\n\t Got: %s" %parent)
 
+        ## Checking the pivoting strategy
+        if(not pivoting in ("first", "size")):
+            raise ValueError("The pivoting strategy must be 'first' or 'size'.\n\t Got: %s" %pivoting)
+        self.__pivoting = pivoting
+
         ## Checking the matrix input
         matrix = Matrix(parent, matrix)
         super().__init__(parent, matrix, vector(parent, matrix.ncols()*[0]), is_zero, relations)
@@ -161,40 +182,57 @@ class BareissAlgorithm(LinearSystemSolver):
     ### Linear algebra methods
     #################################################
     def _compute_echelon(self):
-        A = Matrix(self.parent(), self.A.rows()) # we create a copy of the matrix
-        U = identity_matrix(self.parent(), A.nrows())
+        nrows = self.A.nrows(); ncols = self.A.ncols()
+        ## We work with lists of rows that are updated in place
+        A = self.simplify([list(row) for row in self.A.rows()])
+        U = [[self.parent().one() if i == j else self.parent().zero() for j in range(nrows)] for i in range(nrows)]
 
-        if(self.have_ideal): # we do simplifications
-            A = self.simplify(A)
+        zeros = [dict() for _ in range(nrows)] # zero-tests already done on each row
+        dirty = set() # rows modified since their last simplification
+        version = self.relations_version()
 
         ## Step 1: initialize
         r = 0; c = 0 # we look from the position (r,c)
-        while(r < A.nrows() and c < A.ncols()):
-            ir = self.__find_pivot(A, r, c)
-            A = self.simplify(A); U = self.simplify(U) # we simplify in case relations pop up
+        while(r < nrows and c < ncols):
+            ir = self.__find_pivot(A, zeros, r, c)
+
+            ## We simplify in case relations pop up: only the modified rows need it unless new relations appeared
+            if(version != self.relations_version()):
+                version = self.relations_version()
+                dirty = range(nrows)
+            for i in dirty:
+                A[i] = self.simplify(A[i]); U[i] = self.simplify(U[i])
+            dirty = set()
             
             if(ir != None): # we found a pivot
                 # We do the swapping (if needed)
                 if(ir != r):
-                    A.swap_rows(r, ir); U.swap_rows(r, ir)
+                    A[r], A[ir] = A[ir], A[r]; U[r], U[ir] = U[ir], U[r]; zeros[r], zeros[ir] = zeros[ir], zeros[r]
 
                 # We do the bareiss step
-                Arc = A[r][c]
-                Arows = A.rows(); Urows = U.rows()
-                for i in range(r): # we create zeros on top of the pivot
-                    Aic = A[i][c]
-                    A.set_row(i, Arc*Arows[i] - Aic*Arows[r]); U.set_row(i, Arc*Urows[i] - Aic*Urows[r])
-
-                # We then leave the row r without change
-                for i in range(r+1, A.nrows()): # we create zeros below the pivot
-                    Aic = A[i][c]
-                    A.set_row(i, Aic*Arows[r] - Arc*Arows[i]); U.set_row(i, Aic*Urows[r] - Arc*Urows[i])
+                Ar = A[r]; Ur = U[r]; Arc = Ar[c]
+                for i in range(nrows):
+                    if(i == r): # we leave the row r without change
+                        continue
+                    Ai = A[i]; Ui = U[i]; Aic = Ai[c]
+                    if(i < r): # we create zeros on top of the pivot
+                        for k in range(ncols):
+                            Ai[k] = Arc*Ai[k] - Aic*Ar[k]
+                        for k in range(nrows):
+                            Ui[k] = Arc*Ui[k] - Aic*Ur[k]
+                    else: # we create zeros below the pivot
+                        for k in range(ncols):
+                            Ai[k] = Aic*Ar[k] - Arc*Ai[k]
+                        for k in range(nrows):
+                            Ui[k] = Aic*Ur[k] - Arc*Ui[k]
+                    zeros[i] = dict(); dirty.add(i)
                 
                 r +=1; c+=1
 
             else: # no pivot then only advance in column
                 c+=1
 
+        A = Matrix(self.parent(), A); U = Matrix(self.parent(), U)
         # We finish simplifying the gcds in each row
         gcds = [gcd(row) for row in A]
         T = diagonal_matrix([1/el if el != 0 else 1 for el in gcds])
@@ -226,19 +264,43 @@ class BareissAlgorithm(LinearSystemSolver):
     #################################################
     ### Private methods for Bareiss Algorithm 
     #################################################
-    def __find_pivot(self, A, r, c):
+    def __find_pivot(self, A, zeros, r, c):
         r'''
-        Method to find the next valid pivot.
+            Method to find the next valid pivot.
 
-        TODO:
-            * Fill documentation
-            * Add example
-    '''
-        for i in range(r, A.nrows()):
-            if(not self.is_zero(A[i][c])):
+            This method looks for a row `i \geq r` such that the entry `A_{i,c}` is not zero. The 
+            entries that are trivially zero are discarded before calling the method :func:`is_zero` and, 
+            if the pivoting strategy is ``"size"``, the candidates are sorted by their size. The 
+            results of the zero-tests are stored in ``zeros`` (one dictionary per row).
+
+            INPUT:
+                * ``A``: list of rows of the matrix.
+                * ``zeros``: list of dictionaries with the results of previous zero-tests.
+                * ``r``: first row to consider.
+                * ``c``: column where we look for the pivot.
+
+            OUTPUT:
+
+            The index of the row for the pivot or ``None`` if there is no valid pivot.
+        '''
+        candidates = [i for i in range(r, len(A)) if A[i][c] != 0]
+        if(self.__pivoting == "size"):
+            candidates.sort(key=lambda i : self.__size(A[i][c]))
+        for i in candidates:
+            if(not c in zeros[i]):
+                zeros[i][c] = self.is_zero(A[i][c])
+            if(not zeros[i][c]):
                 return i
         return None
-        
+
+    def __size(self, el):
+        r'''
+            Auxiliary method to measure (cheaply) the size of a polynomial.
+        '''
+        try:
+            return (el.number_of_terms(), el.degree())
+        except AttributeError:
+            return (0, 0)
         
     def __get_lcm(self, input):
         r'''
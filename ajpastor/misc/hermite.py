@@ -12,6 +12,10 @@ The main differences with the algorithm described in that paper is that we do a
 that we do not force the diagonal to have 1. Moreover, we do not need to have maximal rank, obtaining zero
 rows in the end of the matrix.
 
+In order to control the growth of the coefficients, the rows are added one by one to the echelon form 
+(following the ordering of Kannan and Bachem, see `this paper <https://doi.org/10.1137/0208040>`_) and the entries
+above the pivots are reduced after every modification of a row.
+
 Given a matrix `M` with `n` rows and `m` columns, a Hermite normal form (or HNF) is a matrix `H` equivalent
 to `M` (i.e., there is a unimodular matrix `U` such that `UM = H`, also called *transformation matrix*)
 such that every element below the main diagonal is zero. This is similar to computing the echelon
@@ -35,6 +39,7 @@ AUTHORS:
 # ****************************************************************************
 
 from sage.all import identity_matrix, Matrix, vector, xgcd
+import sage.structure.element as SAGE_element
 
 from ajpastor.misc.linear_solver import LinearSystemSolver, NoSolutionError
 
@@ -184,8 +189,42 @@ class HermiteSolver(LinearSystemSolver):
             sage: hs.transformation_matrix()
             [      0       1]
             [     -1 2*x + 2]
+
+        When we add new columns to the system (see method :func:`extend`), the computations of the Hermite 
+        normal form can be reused::
+
+            sage: M.<x> = GF(7)[]
+            sage: A = matrix(M, 2, 2, [x, 1, x, 1+x]); v = vector([2*x, 2])
+            sage: hs = HermiteSolver(M, A, v)
+            sage: hs.solution()
+            Traceback (most recent call last):
+            ...
+            NoSolutionError: There is no solution to ...
+            sage: hs2 = hs.extend(v, vector([x, 1+x]))
+            sage: hs2.A == matrix(M, 2, 3, [x, 1, 2*x, x, 1+x, 2])
+            True
+            sage: hs2.echelon_form() == HermiteSolver(M, hs2.A, hs2.b).echelon_form()
+            True
+            sage: hs2.U*hs2.A == hs2.H
+            True
+            sage: hs2.A*hs2.solution() == hs2.b
+            True
+
+        The old rows keep their pivots when the new columns are added::
+
+            sage: B = matrix(ZZ, 3, 2, [2, 4, 0, 3, 0, 0]); hs = HermiteSolver(ZZ, B, vector([0,0,0]))
+            sage: C = matrix(ZZ, 3, 2, [1, 5, 7, 2, 3, 6])
+            sage: hs3 = hs.extend(C, vector([1,2,3]))
+            sage: hs3.echelon_form() == HermiteSolver(ZZ, B.augment(C), vector([1,2,3])).echelon_form()
+            True
+            sage: hs3.U*hs3.A == hs3.H
+            True
     '''
     def __init__(self, parent, matrix, inhomogeneous, euclidean=lambda p,q: (p//q, p%q), xgcd = xgcd):
+        ## Saving the input for extending the system
+        self.__input = (parent, euclidean, xgcd)
+        self.__start = None
+
         if(type(parent) is tuple):
             base,g,d = parent
             if(not base.is_euclidean_domain()):
@@ -228,39 +267,77 @@ class HermiteSolver(LinearSystemSolver):
 
         super().__init__(parent, matrix, inhomogeneous)
 
+    def extend(self, columns, inhomogeneous):
+        r'''
+            Method to build the solver for a system with more columns.
+
+            This method creates a new :class:`HermiteSolver` for the system `(A | C)\alpha = \mathbf{c}`
+            where `A` is the matrix of ``self``. The computation of the Hermite normal form of this new 
+            system starts from the Hermite normal form of `A` and its transformation matrix, so only
+            the new columns need to be reduced.
+
+            INPUT:
+                * ``columns``: a matrix `C` with the new columns or a vector for only one column.
+                * ``inhomogeneous``: the inhomogeneous vector `\mathbf{c}` for the new system.
+
+            OUTPUT:
+
+            A new :class:`HermiteSolver` for the extended system.
+        '''
+        if(SAGE_element.is_Vector(columns) or isinstance(columns, (list, tuple))):
+            columns = Matrix(self.solution_parent(), [columns]).transpose()
+        if(columns.nrows() != self.A.nrows()):
+            raise TypeError("The new columns must have %d rows" %self.A.nrows())
+        matrix = Matrix(self.solution_parent(), [list(self.A.row(i)) + list(columns.row(i)) for i in range(self.A.nrows())])
+
+        parent, euclidean, xgcd = self.__input
+        result = HermiteSolver(parent, matrix, inhomogeneous, euclidean, xgcd)
+        result.__start = (self.echelon_form(), self.transformation_matrix(), self.A.ncols())
+        return result
+
     def _compute_echelon(self):
-        A = Matrix(self.solution_parent(), self.A.rows()) # we create a copy
-        U = identity_matrix(self.solution_parent(), A.nrows())
-        ## Step 1: initialize
-        r = 0; c = 0 # we are looking from (r,c)
-        while(r < A.nrows() and c < A.ncols()):
-            ir = self.__find_pivot(A, r,c)
-            if(ir != None): # we found a pivot
-                if(ir != r): # swapping rows
-                    A.swap_rows(r, ir); U.swap_rows(r,ir)
-                
-                # We reduce the next rows
-                for m in range(r+1, A.nrows()):
-                    if(A[m][c] != 0):
-                        g, t, s = self.__xgcd(A[r][c], A[m][c])
-                        p,_ = self.__euclidean(A[r][c],g); q,_ = self.__euclidean(A[m][c],g)
-
-                        Ar = A.row(r); Am = A.row(m)
-                        Ur = U.row(r); Um = U.row(m)
-
-                        A.set_row(r,t*Ar + s*Am); U.set_row(r,t*Ur + s*Um)
-                        A.set_row(m,p*Am - q*Ar); U.set_row(m,p*Um - q*Ur)
-                # We reduce previous rows with the new gcd
-                for m in range(r):
-                    if(A[m][c] != 0):
-                        q,_ = self.__euclidean(A[m][c], A[r][c])
-                        Ar = A.row(r); Am = A.row(m)
-                        Ur = U.row(r); Um = U.row(m)
-
-                        A.set_row(m, Am - q*Ar); U.set_row(m, Um-q*Ur)
-                r += 1
-            c+= 1
-        return A, U
+        nrows = self.A.nrows()
+        parent = self.solution_parent()
+        if(self.__start is None): # we create a copy
+            A = [[parent(el) for el in row] for row in self.A.rows()]
+            U = [[parent.one() if i == j else parent.zero() for j in range(nrows)] for i in range(nrows)]
+            pivots = {} # pivots[c] = r means row r has its pivot in column c
+            to_process = range(nrows)
+        else: # we start from a previous Hermite normal form
+            H, U, n = self.__start
+            extra = U*Matrix(parent, [row[n:] for row in self.A.rows()])
+            A = [list(H.row(i)) + list(extra.row(i)) for i in range(nrows)]
+            U = [list(row) for row in U.rows()]
+            pivots = {}; to_process = []
+            for i in range(nrows): # the rows of H with a pivot keep it in the old columns
+                c = self.__first_non_zero(A[i][:n])
+                if(c is None):
+                    to_process += [i]
+                else:
+                    pivots[c] = i
+
+        ## We add the rows one by one (Kannan-Bachem ordering)
+        for m in to_process:
+            c = self.__first_non_zero(A[m])
+            while(not (c is None)):
+                if(not c in pivots): # new pivot found
+                    pivots[c] = m
+                    self.__reduce_above(A, U, pivots, c)
+                    break
+                ## We eliminate the entry (m,c) with the pivot in column c
+                r = pivots[c]
+                g, t, s = self.__xgcd(A[r][c], A[m][c])
+                p,_ = self.__euclidean(A[r][c],g); q,_ = self.__euclidean(A[m][c],g)
+                A[r], A[m] = self.__combine(A[r], A[m], t, s, p, q)
+                U[r], U[m] = self.__combine(U[r], U[m], t, s, p, q)
+                self.__reduce_above(A, U, pivots, c)
+
+                c = self.__first_non_zero(A[m], c+1)
+
+        ## We sort the rows: first the pivots by column, then the zero rows
+        order = [pivots[c] for c in sorted(pivots)]
+        order += [i for i in range(nrows) if not i in order]
+        return Matrix(parent, [A[i] for i in order]), Matrix(parent, [U[i] for i in order])
 
     def _compute_solution(self):
         
@@ -275,15 +352,12 @@ class HermiteSolver(LinearSystemSolver):
         solution = vector(self.solution_parent(), self.A.ncols()*[0])
         syzygy = identity_matrix(self.solution_parent(), self.A.ncols())
         while(r >= 0):
-            M = Matrix(self.solution_parent(),[A.row(r)]).transpose()
-            hs = HermiteSolver(self.solution_parent(), M, vector([b[r]]), self.__euclidean, self.__xgcd)
             ## We check the condition for having a solution
-            g = hs.echelon_form()[0][0]
+            g, U = self.__column_hermite(A.row(r))
             quo,rem = self.__euclidean(b[r],g)
             if(rem != 0):
-                raise NoSolutionError("There is no solution to equation %s = %s" %(M.transpose(), b[r]))
+                raise NoSolutionError("There is no solution to equation %s = %s" %(Matrix(self.solution_parent(), [A.row(r)]), b[r]))
             
-            U = hs.transformation_matrix()
             ## Solution to the particular equation (alpha + S*beta)
             alpha = quo*U.row(0)
             S = Matrix(self.solution_parent(), U.rows()[1:]).transpose()
@@ -313,12 +387,64 @@ class HermiteSolver(LinearSystemSolver):
     ### Private method
     ###
     #########################################################
-    def __find_pivot(self, A, r, c):
-        for i in range(r, A.nrows()):
-            if(not self.is_zero(A[i][c])):
-                return i
+    def __first_non_zero(self, row, start=0):
+        for c in range(start, len(row)):
+            if(not self.is_zero(row[c])):
+                return c
         return None
 
+    def __combine(self, Rr, Rm, t, s, p, q):
+        r'''
+            Method that computes the unimodular combination of two rows given by the extended gcd.
+        '''
+        return [t*a + s*b for (a,b) in zip(Rr, Rm)], [p*b - q*a for (a,b) in zip(Rr, Rm)]
+
+    def __reduce_above(self, A, U, pivots, c):
+        r'''
+            Method that reduces the entries above the pivots after modifying the pivot in column ``c``.
+
+            The row of the pivot in column ``c`` and all the rows with a pivot in a previous column are 
+            reduced (using the euclidean division) with respect to the pivots in the following columns. This
+            keeps the size of the entries bounded during the computation.
+        '''
+        columns = sorted(pivots)
+        for c1 in columns:
+            if(c1 > c):
+                break
+            r = pivots[c1]
+            for c2 in columns:
+                if(c2 <= c1):
+                    continue
+                k = pivots[c2]
+                if(A[r][c2] != 0):
+                    q,_ = self.__euclidean(A[r][c2], A[k][c2])
+                    if(q != 0):
+                        A[r] = [a - q*b for (a,b) in zip(A[r], A[k])]
+                        U[r] = [a - q*b for (a,b) in zip(U[r], U[k])]
+
+    def __column_hermite(self, column):
+        r'''
+            Method to compute the Hermite normal form of a column.
+
+            This method computes the gcd `g` of the elements in ``column`` together with the 
+            unimodular matrix `U` such that `U\cdot column = (g, 0, \ldots, 0)^T`.
+        '''
+        H = list(column); n = len(H); parent = self.solution_parent()
+        U = [[parent.one() if i == j else parent.zero() for j in range(n)] for i in range(n)]
+
+        i = self.__first_non_zero(H)
+        if(i is None):
+            return parent.zero(), Matrix(parent, U)
+        if(i != 0): # swapping rows
+            H[0], H[i] = H[i], H[0]; U[0], U[i] = U[i], U[0]
+        for m in range(1, n):
+            if(H[m] != 0):
+                g, t, s = self.__xgcd(H[0], H[m])
+                p,_ = self.__euclidean(H[0],g); q,_ = self.__euclidean(H[m],g)
+                U[0], U[m] = self.__combine(U[0], U[m], t, s, p, q)
+                H[0], H[m] = t*H[0] + s*H[m], p*H[m] - q*H[0]
+        return H[0], Matrix(parent, U)
+
     def __reduce_solution(self, solution, syzygy):
         r'''
             Method to compute the "smallest" solution of the system.
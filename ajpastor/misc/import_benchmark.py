@@ -0,0 +1,117 @@
+r"""
+Python file for measuring import times
+
+This module measures the time needed to import a module in a fresh Python interpreter, so the cost of
+loading the packages (for example, in worker processes that are spawned repeatedly) can be controlled.
+Since the submodules of :mod:`ajpastor.dd_functions` are loaded lazily, the budget is checked both for the
+import of the package and for a realistic first use of it (see :data:`FIRST_USE`). The first use loads the
+Sage library, whose import time depends on the machine and is out of our control, so the budget is checked
+against the overhead over a bare import of Sage (see :data:`BASELINE` and :func:`import_overhead`). It can be
+run as a script to check :mod:`ajpastor.dd_functions` against a target budget::
+
+    sage -python -m ajpastor.misc.import_benchmark [budget]
+
+EXAMPLES::
+
+    sage: from ajpastor.misc.import_benchmark import *
+    sage: import_time("ajpastor.dd_functions") < IMPORT_BUDGET # long time
+    True
+    sage: import_overhead("ajpastor.dd_functions", FIRST_USE) < IMPORT_BUDGET # long time
+    True
+    sage: check_import_budget() # long time
+    True
+
+AUTHORS:
+
+    - Antonio Jimenez-Pastor (2021-02-09): initial version
+
+"""
+
+# ****************************************************************************
+#  Copyright (C) 2021 Antonio Jimenez-Pastor <ajpastor@risc.uni-linz.ac.at>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#                  https://www.gnu.org/licenses/
+# ****************************************************************************
+
+import subprocess
+import sys
+
+IMPORT_BUDGET = 1.0 # target time (in seconds) for importing ajpastor.dd_functions on top of BASELINE
+BASELINE = "sage.all" # module imported anyway by any use of ajpastor.dd_functions
+FIRST_USE = "from ajpastor.dd_functions import *; DFinite" # statement for the first use of ajpastor.dd_functions
+
+__SCRIPT = "from time import perf_counter as t; s = t(); import %s; %s; print(t()-s)"
+
+def import_time(module, statement="pass", repeat=3):
+    r'''
+        Method that computes the time needed to import a module in a new interpreter.
+
+        INPUT:
+            * ``module``: the name of the module to import.
+            * ``statement``: a statement executed after the import and included in the timing (for example,
+              the access to an object created lazily).
+            * ``repeat``: number of interpreters launched. The minimal time is returned.
+
+        OUTPUT:
+
+        The minimal time (in seconds) among all the repetitions.
+    '''
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", __SCRIPT %(module, statement)],
+                                capture_output=True, text=True, check=True).stdout
+        times.append(float(output.strip().split("\n")[-1]))
+    return min(times)
+
+def import_overhead(module, statement="pass", baseline=BASELINE, repeat=3):
+    r'''
+        Method that computes the time needed to import a module on top of the import of ``baseline``.
+
+        INPUT:
+            * ``module``: the name of the module to import.
+            * ``statement``: a statement executed after the import (see :func:`import_time`).
+            * ``baseline``: the name of the module whose import time is discounted (:data:`BASELINE` by default).
+            * ``repeat``: number of measurements (see :func:`import_time`).
+
+        OUTPUT:
+
+        The difference (at least zero) between the import times of ``module`` and ``baseline``.
+    '''
+    return max(0.0, import_time(module, statement, repeat) - import_time(baseline, "pass", repeat))
+
+def check_import_budget(budget=None, module="ajpastor.dd_functions", repeat=3, first_use=FIRST_USE, baseline=BASELINE):
+    r'''
+        Method that checks whether the import of a module is within a time budget.
+
+        Both the import of the module and the import followed by ``first_use`` are checked, since
+        a package with lazy submodules does almost nothing when it is imported. The import of ``baseline``
+        is discounted from both times (see :func:`import_overhead`).
+
+        INPUT:
+            * ``budget``: the maximal time allowed. If ``None``, :data:`IMPORT_BUDGET` is used.
+            * ``module``: the module to be imported.
+            * ``repeat``: number of measurements (see :func:`import_time`).
+            * ``first_use``: statement for the first use of the module (:data:`FIRST_USE` by default).
+            * ``baseline``: module whose import time is discounted (:data:`BASELINE` by default).
+    '''
+    budget = IMPORT_BUDGET if budget is None else budget
+    base = import_time(baseline, "pass", repeat)
+    return all(import_time(module, statement, repeat) - base <= budget for statement in ("pass", first_use))
+
+__all__ = ["IMPORT_BUDGET", "BASELINE", "FIRST_USE", "import_time", "import_overhead", "check_import_budget"]
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else IMPORT_BUDGET
+    base = import_time(BASELINE)
+    elapsed = max(0.0, import_time("ajpastor.dd_functions") - base)
+    first_use = max(0.0, import_time("ajpastor.dd_functions", FIRST_USE) - base)
+    print("import %s (baseline): %.3fs" %(BASELINE, base))
+    print("import ajpastor.dd_functions: +%.3fs (budget %.3fs)" %(elapsed, budget))
+    print("first use (%s): +%.3fs (budget %.3fs)" %(FIRST_USE, first_use, budget))
+    for name in ("DFinite", "DDFinite", "DFiniteP", "DFiniteI"):
+        print("   + access to %s: %.3fs" %(name, import_time("ajpastor.dd_functions", "ajpastor.dd_functions.%s" %name)))
+    sys.exit(0 if max(elapsed, first_use) <= budget else 1)
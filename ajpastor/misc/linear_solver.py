@@ -24,6 +24,7 @@ AUTHORS:
 #                  https://www.gnu.org/licenses/
 # ****************************************************************************
 from sage.all import identity_matrix, Matrix, vector, ideal, cached_method
+from time import time
 import sage.structure.element as SAGE_element
 from sage.categories.pushout import pushout
 
@@ -95,6 +96,7 @@ class LinearSystemSolver():
                 self.__gb = [0]
 
         self.__is_zero = is_zero
+        self.__relations_version = 0
 
         ## Creating the variables for the echelon form
         self.__echelon = None
@@ -104,6 +106,10 @@ class LinearSystemSolver():
         self.__solution = None
         self.__syzygy = None
 
+        ## Creating the variables for the timings
+        self.__time = 0
+        self.__observers = []
+
     def parent(self):
         r'''
             Method that returns the ring `R` where the system is defined.
@@ -158,6 +164,16 @@ class LinearSystemSolver():
         '''
         return self.__gb
 
+    def relations_version(self):
+        r'''
+            Method to know how many times the relations have been updated.
+
+            This method returns a counter that increases every time a new relation is found
+            (see method :func:`~LinearSystemSolver.is_zero`). Algorithms may use this value to
+            know if some previously simplified object need to be simplified again.
+        '''
+        return self.__relations_version
+
     def have_ideal(self):
         r'''
             Auxiliary method to know if some relation have been already found.
@@ -178,7 +194,7 @@ class LinearSystemSolver():
             and it can be upper-triangular, lower-triangular, diagonal, etc.
         '''
         if(self.__echelon is None):
-            self.__echelon, self.__transformation = self._compute_echelon()
+            self.__compute_echelon()
         return self.__echelon
 
     def transformation_matrix(self):
@@ -196,7 +212,7 @@ class LinearSystemSolver():
             This matrix is computed simultaneously to the echelon form of the system.
         '''
         if(self.__transformation is None):
-            self.__echelon, self.__transformation = self._compute_echelon()
+            self.__compute_echelon()
         return self.__transformation
         
     @cached_method
@@ -233,7 +249,7 @@ class LinearSystemSolver():
             by :func:`LinearSystemSolver.solution_parent`. 
         '''
         if(self.__solution is None):
-            self.__solution, self.__syzygy = self._compute_solution()
+            self.__compute_solution()
         return self.__solution
 
     def syzygy(self):
@@ -257,7 +273,7 @@ class LinearSystemSolver():
             and `\beta` is any vector with entries in the parent for the solutions.
         '''
         if(self.__solution is None):
-            self.__solution, self.__syzygy = self._compute_solution()
+            self.__compute_solution()
         return self.__syzygy
 
     @cached_method
@@ -277,6 +293,7 @@ class LinearSystemSolver():
 
         if(self.__is_zero(el)): ## If it is zero, we update the relations
             self.__relations += [el]
+            self.__relations_version += 1
             try:
                 self.__gb = ideal(self.parent(), self.__relations).groebner_basis()
             except AttributeError:
@@ -309,6 +326,23 @@ class LinearSystemSolver():
         elif(self.have_ideal()):
             return obj.reduce(self.__gb)
         return obj
+
+    def computation_time(self):
+        r'''
+            Method that returns the time (in seconds) spent computing the echelon form and the solutions.
+        '''
+        return self.__time
+
+    def add_observer(self, observer):
+        r'''
+            Method to add an observer to the computation of the solutions.
+
+            An observer is a callable that receives the solver and the total computation time
+            (see :func:`computation_time`). It is called once the solutions are computed, or when 
+            we find that the system has no solutions.
+        '''
+        self.__observers.append(observer)
+
     ## Alias properties
     @property
     def A(self):
@@ -352,6 +386,23 @@ class LinearSystemSolver():
         raise NotImplementedError("Abstract method not implemented in %s" %self.__class__)
 
     ## PRIVATE METHODS
+    def __compute_echelon(self):
+        start = time()
+        try:
+            self.__echelon, self.__transformation = self._compute_echelon()
+        finally:
+            self.__time += time()-start
+
+    def __compute_solution(self):
+        start = time(); previous = self.__time # the echelon form may be computed in between
+        try:
+            self.__solution, self.__syzygy = self._compute_solution()
+        finally:
+            self.__time = previous + time()-start
+            observers = self.__observers; self.__observers = []
+            for observer in observers:
+                observer(self, self.__time)
+
 class SageSolver(LinearSystemSolver):
     r'''
         Toy implementation of a :class:`LinearSystemSolver`.
@@ -998,6 +998,10 @@ def simplify_matrix(M):
         error. It just simply assumes that there is no simplification and return 
         the original matrix.
 
+        If the parent of the entries provides a method ``normalize_row`` (see 
+        :func:`~ajpastor.lazy.lazyFracField.LazyFracField.normalize_row`), the rows
+        are simplified all together using it.
+
         INPUT:
             * ``M``: a matrix that will be simplified.
 
@@ -1005,6 +1009,8 @@ def simplify_matrix(M):
             A matrix `\tilde{M}` such that is equal to `M`.
     '''
     try:
+        if(hasattr(M.parent().base(), "normalize_row")):
+            return Matrix(M.parent().base(), [M.parent().base().normalize_row(list(row)) for row in M])
         return Matrix(M.parent().base(), [[el.simplify() for el in row] for row in M])
     except AttributeError:
         return M
@@ -1083,7 +1089,229 @@ def kronecker_sum(M,N):
     
     n1 = M.nrows(); n2 = N.nrows()
     return M.tensor_product(identity_matrix(n2)) + identity_matrix(n1).tensor_product(N)
-    
+
+####################################################################################
+###
+### STRUCTURED MATRICES
+###
+### In this section we include some classes to represent matrices with a known
+###     structure (companion matrices, direct and Kronecker sums) without building
+###     the dense matrix. They only provide the matrix-vector product, which is
+###     the only operation needed for the differential movements below.
+###
+####################################################################################
+class StructuredMatrix(object):
+    r'''
+        Abstract class for square matrices with a known structure.
+
+        This class represents a square matrix where we do not store all the entries but some
+        structural information. Objects of this class can be used as a matrix in the methods
+        :func:`vector_derivative` and :func:`matrix_of_dMovement` since they only require
+        the matrix-vector product.
+
+        Subclasses must implement the method :func:`_apply`, which computes the product of
+        the matrix with a list of elements.
+
+        INPUT:
+            * ``parent``: the ring where the entries of the matrix belong.
+            * ``size``: number of rows (and columns) of the matrix.
+    '''
+    def __init__(self, parent, size):
+        self.__base_ring = parent
+        self.__size = size
+
+    def base_ring(self):
+        return self.__base_ring
+
+    def parent(self):
+        r'''
+            Method that returns the space of dense matrices where ``self`` belongs.
+        '''
+        return MatrixSpace(self.base_ring(), self.nrows(), self.ncols())
+
+    def nrows(self):
+        return self.__size
+
+    def ncols(self):
+        return self.__size
+
+    def is_square(self):
+        return True
+
+    def dense(self):
+        r'''
+            Method that builds the dense matrix represented by ``self``.
+        '''
+        return Matrix(self.base_ring(), [self._apply([kronecker_delta(i,j) for i in range(self.ncols())]) for j in range(self.ncols())]).transpose()
+
+    def __mul__(self, other):
+        from sage.categories.pushout import pushout
+        try:
+            parent = pushout(self.base_ring(), other.parent().base())
+        except AttributeError:
+            return NotImplemented
+        if(len(other) != self.ncols()):
+            raise SizeMatrixError("The vector has not the proper size -- expected %d, got %d" %(self.ncols(), len(other)))
+        return vector(parent, self._apply(list(other)))
+
+    def __repr__(self):
+        return "%s of size %d over %s" %(self.__class__.__name__, self.nrows(), self.base_ring())
+
+    def _apply(self, v):
+        r'''
+            Method that computes the product of ``self`` with the list ``v``.
+        '''
+        raise NotImplementedError("Abstract method not implemented in %s" %self.__class__)
+
+class CompanionMatrix(StructuredMatrix):
+    r'''
+        Class for representing a companion matrix.
+
+        A companion matrix of size `d` is a matrix with ones in the subdiagonal, a last
+        column `(c_0,\ldots,c_{d-1})^T` and zeros in any other entry. The product of such
+        matrix with a vector can be computed with only `2d` operations.
+
+        INPUT:
+            * ``parent``: the ring where the entries of the matrix belong.
+            * ``column``: the list of elements in the last column of the matrix.
+
+        EXAMPLES::
+
+            sage: from ajpastor.misc.matrix import *
+            sage: C = CompanionMatrix(QQ, [1,2,3]); C.dense()
+            [0 0 1]
+            [1 0 2]
+            [0 1 3]
+            sage: C*vector([1,1,1]) == C.dense()*vector([1,1,1])
+            True
+            sage: C == CompanionMatrix.from_matrix(C.dense())
+            True
+    '''
+    def __init__(self, parent, column):
+        super(CompanionMatrix, self).__init__(parent, len(column))
+        self.__column = [parent(el) for el in column]
+
+    @staticmethod
+    def from_matrix(M):
+        r'''
+            Method to build a :class:`CompanionMatrix` from a dense companion matrix.
+
+            This method does not check the structure of ``M``: it only takes its last column.
+        '''
+        return CompanionMatrix(M.parent().base(), M.column(-1))
+
+    def column(self):
+        return self.__column
+
+    def _apply(self, v):
+        last = v[-1]
+        return [self.__column[0]*last] + [v[i-1] + self.__column[i]*last for i in range(1, len(v))]
+
+    def __eq__(self, other):
+        return isinstance(other, CompanionMatrix) and self.column() == other.column()
+
+    def __hash__(self):
+        return hash(tuple(self.column()))
+
+class DirectSumMatrix(StructuredMatrix):
+    r'''
+        Class for representing the direct sum of several square matrices.
+
+        The direct sum of several matrices is a block diagonal matrix (see method :func:`direct_sum`).
+        This class only keeps the blocks (that can also be a :class:`StructuredMatrix`).
+
+        INPUT:
+            * ``parent``: the ring where the entries of the matrix belong.
+            * ``blocks``: the list of matrices in the diagonal.
+
+        EXAMPLES::
+
+            sage: from ajpastor.misc.matrix import *
+            sage: M = Matrix(QQ, [[1,2],[3,4]]); C = CompanionMatrix(QQ, [5,6,7])
+            sage: D = DirectSumMatrix(QQ, [M, C]); D.dense() == direct_sum(M, C.dense())
+            True
+            sage: D*vector([1,2,3,4,5]) == D.dense()*vector([1,2,3,4,5])
+            True
+    '''
+    def __init__(self, parent, blocks):
+        if(any(not block.is_square() for block in blocks)):
+            raise TypeError("Only square matrices for the direct sum")
+        super(DirectSumMatrix, self).__init__(parent, sum(block.nrows() for block in blocks))
+        self.__blocks = blocks
+
+    def blocks(self):
+        return self.__blocks
+
+    def _apply(self, v):
+        result = []; i = 0
+        for block in self.__blocks:
+            result += _apply_matrix(block, v[i:i+block.nrows()])
+            i += block.nrows()
+        return result
+
+class KroneckerSumMatrix(StructuredMatrix):
+    r'''
+        Class for representing the Kronecker sum of two square matrices.
+
+        The Kronecker sum `M \boxplus N` of two matrices of sizes `m` and `n` is a matrix of size `mn`
+        (see method :func:`kronecker_sum`). This class only keeps the two operands (that can also be
+        a :class:`StructuredMatrix`) and computes the product with a vector `v` seeing it as a
+        `m\times n` matrix `V`:
+
+        .. MATH::
+
+            (M \boxplus N)v = MV + VN^T.
+
+        INPUT:
+            * ``parent``: the ring where the entries of the matrix belong.
+            * ``M``: first operand of the Kronecker sum.
+            * ``N``: second operand of the Kronecker sum.
+
+        EXAMPLES::
+
+            sage: from ajpastor.misc.matrix import *
+            sage: M = Matrix([[1,2],[3,4]]); N = Matrix([[1,0,2],[0,3,0],[4,0,5]])
+            sage: K = KroneckerSumMatrix(QQ, M, N); K.dense() == kronecker_sum(M,N)
+            True
+            sage: C = CompanionMatrix(QQ, [1,2]); D = CompanionMatrix(QQ, [3,4,5])
+            sage: K = KroneckerSumMatrix(QQ, C, D); K.dense() == kronecker_sum(C.dense(), D.dense())
+            True
+            sage: K*vector(range(6)) == K.dense()*vector(range(6))
+            True
+    '''
+    def __init__(self, parent, M, N):
+        if(not (M.is_square() and N.is_square())):
+            raise TypeError("Only square matrices for the Kronecker sum")
+        super(KroneckerSumMatrix, self).__init__(parent, M.nrows()*N.nrows())
+        self.__M = M; self.__N = N
+
+    def operands(self):
+        return (self.__M, self.__N)
+
+    def _apply(self, v):
+        m = self.__M.nrows(); n = self.__N.nrows()
+        result = [0 for _ in range(m*n)]
+        for j in range(n): # product M*V
+            column = _apply_matrix(self.__M, [v[k*n+j] for k in range(m)])
+            for i in range(m):
+                result[i*n+j] += column[i]
+        for i in range(m): # product V*N^T
+            row = _apply_matrix(self.__N, v[i*n:(i+1)*n])
+            for j in range(n):
+                result[i*n+j] += row[j]
+        return result
+
+def _apply_matrix(M, v):
+    r'''
+        Auxiliary method to compute the product of a matrix with a list.
+
+        If ``M`` is a :class:`StructuredMatrix`, this uses its structure. Otherwise
+        we compute the usual dense product.
+    '''
+    if(isinstance(M, StructuredMatrix)):
+        return M._apply(v)
+    return [sum(row[k]*v[k] for k in range(len(v))) for row in M.rows()]
+
 ####################################################################################
 ###
 ### MATRICIAL D-MOVE
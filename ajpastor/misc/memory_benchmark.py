@@ -0,0 +1,91 @@
+r"""
+Python file for measuring the memory used by objects
+
+This module measures the memory allocated by a family of objects (for example, intermediate
+:class:`~ajpastor.dd_functions.ddFunction.DDFunction` in a batch computation) using the module
+:mod:`tracemalloc`. It can be run as a script to get the bytes per function for some
+basic constructions of :class:`~ajpastor.dd_functions.ddFunction.DDFunction`::
+
+    sage -python -m ajpastor.misc.memory_benchmark [number]
+
+EXAMPLES::
+
+    sage: from ajpastor.misc.memory_benchmark import *
+    sage: bytes_per_object(lambda i : [i]*10, 100) > 0
+    True
+
+AUTHORS:
+
+    - Antonio Jimenez-Pastor (2021-02-09): initial version
+
+"""
+
+# ****************************************************************************
+#  Copyright (C) 2021 Antonio Jimenez-Pastor <ajpastor@risc.uni-linz.ac.at>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#                  https://www.gnu.org/licenses/
+# ****************************************************************************
+
+import gc
+import sys
+import tracemalloc
+
+def bytes_per_object(builder, number=1000):
+    r'''
+        Method that computes the average memory allocated by the objects built with a method.
+
+        All the objects built are kept alive until the measure is taken, so the result includes
+        the memory of the objects and all the data they store.
+
+        INPUT:
+            * ``builder``: a method that receives an integer `i` and returns a new object.
+            * ``number``: number of objects to build.
+
+        OUTPUT:
+
+        The average number of bytes allocated for each object.
+    '''
+    builder(0) # warming up the caches of the builder
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.take_snapshot()
+        objects = [builder(i) for i in range(number)]
+        gc.collect()
+        end = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in end.compare_to(start, "filename"))
+    del objects
+    return allocated/number
+
+def dd_function_benchmark(number=1000):
+    r'''
+        Method that computes the bytes per function for several constructions of
+        :class:`~ajpastor.dd_functions.ddFunction.DDFunction`.
+
+        OUTPUT:
+
+        A dictionary with the average bytes per function for each construction.
+    '''
+    from ajpastor.dd_functions import DFinite
+    from sage.all import QQ
+
+    exp = DFinite.element([-1,1],[1])
+    return {
+        "element" : bytes_per_object(lambda i : DFinite.element([-1,1],[QQ(i)]), number),
+        "scalar product" : bytes_per_object(lambda i : QQ(i+1)*exp, number),
+        "addition" : bytes_per_object(lambda i : exp + QQ(i), number),
+        "derivative" : bytes_per_object(lambda i : DFinite.element([-1,1],[QQ(i)]).derivative(), number),
+    }
+
+__all__ = ["bytes_per_object", "dd_function_benchmark"]
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    for (name, size) in dd_function_benchmark(number).items():
+        print("%s: %.1f bytes per function" %(name, size))
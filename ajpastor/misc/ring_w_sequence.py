@@ -28,9 +28,15 @@ AUTHORS:
 #                  https://www.gnu.org/licenses/
 # ****************************************************************************
 
+# Python imports
+from collections import OrderedDict
+
 # Sage imports
 # from sage.all import *   # import sage library
 from sage.all import (UniqueRepresentation, Ring, derivative, factorial, SR)
+from sage.rings.fraction_field import is_FractionField
+from sage.rings.polynomial.polynomial_ring import is_PolynomialRing
+from sage.rings.polynomial.multi_polynomial_ring import is_MPolynomialRing
 
 
 class Ring_w_Sequence (UniqueRepresentation, Ring):
@@ -47,8 +53,11 @@ class Ring_w_Sequence (UniqueRepresentation, Ring):
         raise TypeError("Can not compute a sequence for an element which is not in the ring")
         
 class Wrap_w_Sequence_Ring (Ring_w_Sequence):
+    _Series_Cache_Size = 256 # maximal number of rational functions with cached expansions
+
     def __init__(self, base, method = None):
         super().__init__(base, method=method, category=base.category())
+        self.__series = OrderedDict() # rational function -> computed coefficients of its power series
 
     def _coerce_map_from_(self, S):
         return self.base()._coerce_map_from_(S)
@@ -96,6 +105,28 @@ class Wrap_w_Sequence_Ring (Ring_w_Sequence):
         return "(SR)" + str(self.base())
 
     def sequence(self, el, n, list=False):
+        r'''
+            Method to get the `n`-th coefficient of the power series of ``el`` (or the first `n`
+            coefficients if ``list`` is ``True``).
+
+            For polynomials, the coefficients are read directly. For rational functions, the power series
+            is expanded once (and cached in ``self``) using the recurrence given by the denominator. 
+            Otherwise, the coefficients are computed with derivatives.
+
+            EXAMPLES::
+
+                sage: from ajpastor.misc.ring_w_sequence import *
+                sage: R = Wrap_w_Sequence_Ring(PolynomialRing(QQ, 'x'))
+                sage: R.sequence(R.base()('3*x^2+1'), 2)
+                3
+                sage: F = Wrap_w_Sequence_Ring(PolynomialRing(QQ, 'x').fraction_field())
+                sage: F.sequence(F.base()('1/(1-x)^2'), 5, True)
+                [1, 2, 3, 4, 5]
+        '''
+        if(n >= 0 or list):
+            coefficients = self.__fast_sequence(el, max(n, 0) if list else n+1)
+            if(not coefficients is None):
+                return coefficients if list else coefficients[n]
         if(list):
             return [self.sequence(el, i) for i in range(n)]
         self_gen = 'x'
@@ -128,6 +159,73 @@ class Wrap_w_Sequence_Ring (Ring_w_Sequence):
                 return res/factorial(n)
         else:
             raise TypeError("Element not in `self` to compute the sequence.")
+
+    #################################################
+    ### Private methods
+    #################################################
+    def __fast_sequence(self, el, n):
+        r'''
+            Method that computes the first `n` coefficients of polynomials and rational functions.
+
+            It returns ``None`` if ``el`` is not of these types (or its power series does not exist).
+        '''
+        base = self.base()
+        try:
+            self_gen = base.gens()[-1]
+            if(is_PolynomialRing(base) or is_MPolynomialRing(base)):
+                return _pol_coefficients(base(el), self_gen, n)
+            elif(is_FractionField(base) and (is_PolynomialRing(base.ring()) or is_MPolynomialRing(base.ring()))):
+                el = base(el)
+                try:
+                    known = self.__series.get(el, None)
+                    cache = True
+                except TypeError: # not hashable elements
+                    known = None; cache = False
+                if(known is None or len(known) < n):
+                    known = _rational_coefficients(el.numerator(), el.denominator(), base.ring()(self_gen), n, known)
+                    if(cache):
+                        self.__series[el] = known
+                        while(len(self.__series) > self._Series_Cache_Size):
+                            self.__series.popitem(last=False)
+                if(cache):
+                    self.__series.move_to_end(el)
+                return [base(c) for c in known[:n]] if is_MPolynomialRing(base.ring()) else known[:n]
+        except (AttributeError, IndexError, TypeError, ZeroDivisionError):
+            pass
+        return None
+
+def _pol_coefficients(pol, gen, n):
+    r'''
+        Method that returns the first `n` coefficients of ``pol`` w.r.t. ``gen``.
+    '''
+    parent = pol.parent()
+    if(is_PolynomialRing(parent)):
+        if(parent.gen() != gen):
+            raise TypeError("Not the variable of the polynomial ring")
+        coeffs = pol.list()
+        zero = parent.base().zero()
+    else:
+        coeffs = [parent(c) for c in pol.polynomial(gen).list()]
+        zero = parent.zero()
+    return coeffs[:n] + [zero]*(n-len(coeffs))
+
+def _rational_coefficients(num, den, gen, n, known=None):
+    r'''
+        Method that computes the first `n` coefficients of the power series of ``num/den``.
+
+        If `q_0 \neq 0` is the constant coefficient of ``den``, then the coefficients satisfy
+        `f_m = (p_m - q_1f_{m-1} - \ldots - q_kf_{m-k})/q_0`. The argument ``known`` can contain
+        the first coefficients already computed.
+    '''
+    q = _pol_coefficients(den, gen, den.degree(gen)+1)
+    if(q[0] == 0):
+        raise ZeroDivisionError("The rational function has no power series expansion")
+    p = _pol_coefficients(num, gen, n)
+    result = [] if known is None else [el for el in known]
+    for m in range(len(result), n):
+        value = p[m] - sum(q[k]*result[m-k] for k in range(1, min(m, len(q)-1)+1))
+        result.append(value/q[0])
+    return result
 #####################################################################
 
 def sequence(el, n, list=False, x_required=True):
@@ -143,6 +241,16 @@ def sequence(el, n, list=False, x_required=True):
                 return 0
             else:
                 return el
+        try: # computing the Taylor polynomial only once
+            bound = n-1 if list else n
+            if(bound < 0):
+                return [] if list else 0
+            taylor = el.taylor(variable, 0, bound)
+            if(list):
+                return [taylor.coefficient(variable, i) for i in range(n)]
+            return taylor.coefficient(variable, n)
+        except (TypeError, ValueError, NotImplementedError, RuntimeError):
+            pass
         if(list):
             return [el.derivative(variable,i)(**{str(variable):0})/factorial(i) for i in range(n)]
         else:
@@ -150,5 +258,5 @@ def sequence(el, n, list=False, x_required=True):
     if(not isinstance(R, Ring_w_Sequence)):
         R = Wrap_w_Sequence_Ring(R)
         
-    return R.sequence(el,n)
+    return R.sequence(el,n,list)
 
@@ -31,7 +31,7 @@ AUTHORS:
 # ****************************************************************************
 
 #Sage imports
-from sage.all import (factorial, bell_polynomial, falling_factorial, cached_function)
+from sage.all import (factorial, bell_polynomial, falling_factorial, rising_factorial, cached_function, prod, ZZ)
 
 ################################################################################
 ################################################################################
@@ -138,6 +138,97 @@ def Richardson(f,order):
     '''
     return lambda n : (2**order*f(2*n)-f(n))/(2**order-1)
 
+################################################################################
+################################################################################
+################################################################################
+## Closed form sequences
+class HypergeometricSequence(object):
+    r'''
+        Class for sequences given by interlaced hypergeometric terms.
+
+        These sequences satisfy `c_n = 0` for `n < m` (the *start* of the sequence) and, for `n \geq m`,
+        a recurrence with step `s`:
+
+        .. MATH::
+
+            c_{n+s} = C \frac{\prod_i (n+\alpha_i)}{\prod_j (n+\beta_j)} c_n.
+
+        Hence, any element can be computed directly from `c_m,\ldots,c_{m+s-1}` using rising factorials 
+        (where `p` and `q` are the number of `\alpha_i` and `\beta_j`):
+
+        .. MATH::
+
+            c_{r+ks} = c_r C^k s^{k(p-q)} \frac{\prod_i ((r+\alpha_i)/s)_k}{\prod_j ((r+\beta_j)/s)_k}.
+
+        The objects of this class can be called to get one element of the sequence and provide the
+        method :func:`block` to compute consecutive elements using the recurrence.
+
+        INPUT:
+            * ``initial``: list with the values `c_m,\ldots,c_{m+s-1}` (the length defines the step `s`).
+            * ``numerator``: list with the values `\alpha_i`.
+            * ``denominator``: list with the values `\beta_j`.
+            * ``constant``: the constant `C`.
+            * ``start``: the value for `m`.
+
+        EXAMPLES::
+
+            sage: from ajpastor.misc.sequence_manipulation import HypergeometricSequence
+            sage: catalan = HypergeometricSequence([1], [1/2], [2], 4)
+            sage: [catalan(n) for n in range(8)]
+            [1, 1, 2, 5, 14, 42, 132, 429]
+            sage: catalan.block(5, 8)
+            [42, 132, 429]
+            sage: J1 = HypergeometricSequence([1/2, 0], [], [1, 3], -1, 1) # Bessel function J_1(x)
+            sage: J1.block(0, 8) == [bessel_J(1,x).derivative(i)(x=0)/factorial(i) for i in range(8)]
+            True
+            sage: J1(101) == J1.block(101, 102)[0]
+            True
+    '''
+    def __init__(self, initial, numerator=[], denominator=[], constant=1, start=0):
+        self.__initial = list(initial)
+        self.__step = len(self.__initial)
+        self.__numerator = list(numerator)
+        self.__denominator = list(denominator)
+        self.__constant = constant
+        self.__start = start
+        
+        if(self.__step == 0):
+            raise ValueError("At least one initial value is required")
+
+    def ratio(self, n):
+        r'''
+            Method that returns the quotient `c_{n+s}/c_n` given by the recurrence.
+        '''
+        return self.__constant*prod((n+a for a in self.__numerator), ZZ(1))/prod((n+b for b in self.__denominator), ZZ(1))
+
+    def __call__(self, n):
+        if(n < self.__start):
+            return 0
+        k, i = divmod(n-self.__start, self.__step)
+        c = self.__initial[i]
+        if(k == 0 or c == 0):
+            return c
+        
+        r = self.__start + i; s = ZZ(self.__step)
+        num = prod((rising_factorial((r+a)/s, k) for a in self.__numerator), ZZ(1))
+        den = prod((rising_factorial((r+b)/s, k) for b in self.__denominator), ZZ(1))
+        return c*self.__constant**k*s**(k*(len(self.__numerator)-len(self.__denominator)))*num/den
+
+    def block(self, start, stop):
+        r'''
+            Method that computes the elements `c_{start},\ldots,c_{stop-1}`.
+
+            Only the first `s` elements are computed with rising factorials. The rest are obtained
+            with the recurrence.
+        '''
+        result = []
+        for n in range(start, stop):
+            if(n-self.__step >= max(start, self.__start)):
+                result += [result[n-self.__step-start]*self.ratio(n-self.__step)]
+            else:
+                result += [self(n)]
+        return result
+
 ################################################################################
 ################################################################################
 ################################################################################
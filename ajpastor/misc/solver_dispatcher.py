@@ -0,0 +1,481 @@
+r"""
+Python file for the automatic selection of linear solvers.
+
+This module offers a dispatcher that chooses, for a given linear system, one of the implementations
+of :class:`~ajpastor.misc.linear_solver.LinearSystemSolver` available in this package:
+
+* ``"sage"``: the class :class:`~ajpastor.misc.linear_solver.SageSolver`.
+* ``"bareiss"``: the class :class:`~ajpastor.misc.bareiss.BareissAlgorithm`.
+* ``"hermite"``: the class :class:`~ajpastor.misc.hermite.HermiteSolver`.
+
+The choice is based on a *signature* of the system: the type of the ring (univariate or multivariate
+polynomials, localizations, fields, etc.), whether there are relations among the variables or not,
+whether the system is homogeneous, the shape of the matrix and the size of its entries. For each signature,
+the dispatcher keeps the timings of the solvers in a :class:`SolverProfile`, that can be stored in a local
+file. When all the possible solvers have been timed for a signature, the fastest on average is chosen. Otherwise,
+a default solver is chosen following the same rules that the operators used before.
+
+The dispatcher can also capture the systems it solves, so they can be replayed later with all the possible
+solvers (see :func:`LinearSolverDispatcher.benchmark`) in order to fill the profile.
+
+EXAMPLES::
+
+    sage: from ajpastor.misc.solver_dispatcher import *
+    sage: dispatcher = LinearSolverDispatcher()
+    sage: R.<x> = QQ[]
+    sage: M = Matrix(R, [[x, 1, x^2], [1, x, 0]])
+    sage: dispatcher.candidates(R, M)
+    ['bareiss', 'hermite', 'sage']
+    sage: dispatcher.choose(R, M)
+    'bareiss'
+    sage: dispatcher.choose(R, M, vector(R, [1, x]))
+    'hermite'
+
+Once the timings of all solvers are known, the dispatcher takes the fastest::
+
+    sage: signature = dispatcher.signature(R, M)
+    sage: dispatcher.profile().record(signature, "bareiss", 1.0)
+    sage: dispatcher.profile().record(signature, "hermite", 1.0)
+    sage: dispatcher.choose(R, M)
+    'bareiss'
+    sage: dispatcher.profile().record(signature, "sage", 0.1)
+    sage: dispatcher.choose(R, M)
+    'sage'
+    sage: filename = tmp_filename(ext=".json")
+    sage: dispatcher.profile().save(filename)
+    sage: SolverProfile(filename).timed(signature)
+    ['bareiss', 'hermite', 'sage']
+    sage: solver = dispatcher.solver(R, M)
+    sage: solver.__class__.__name__
+    'SageSolver'
+    sage: M*solver.syzygy() == 0
+    True
+
+We can capture the systems that appear during some computation and replay them with all the solvers::
+
+    sage: dispatcher = LinearSolverDispatcher()
+    sage: dispatcher.start_capture()
+    sage: dispatcher.solver(R, M).syzygy().ncols()
+    1
+    sage: systems = dispatcher.stop_capture()
+    sage: len(systems)
+    1
+    sage: sorted(dispatcher.benchmark(systems)[0])
+    ['bareiss', 'hermite', 'sage']
+    sage: dispatcher.profile().timed(dispatcher.signature(R, M))
+    ['bareiss', 'hermite', 'sage']
+
+AUTHORS:
+
+    - Antonio Jimenez-Pastor (2021-02-09): initial version
+
+"""
+
+# ****************************************************************************
+#  Copyright (C) 2021 Antonio Jimenez-Pastor <ajpastor@risc.uni-linz.ac.at>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#                  https://www.gnu.org/licenses/
+# ****************************************************************************
+import atexit, json, os, tempfile
+
+from sage.all import Matrix, vector, EuclideanDomains, save, load
+from sage.rings.polynomial.polynomial_ring import is_PolynomialRing as isUniPolynomial
+from sage.rings.polynomial.multi_polynomial_ring import is_MPolynomialRing as isMPolynomial
+
+from ajpastor.misc.linear_solver import SageSolver, NoSolutionError
+from ajpastor.misc.ring_w_sequence import Wrap_w_Sequence_Ring
+
+class SolverProfile():
+    r'''
+        Class for storing the timings of the linear solvers.
+
+        This class stores, for each signature of a linear system (see :func:`LinearSolverDispatcher.signature`),
+        the number of times each solver has been used and the total time spent. These timings can be
+        stored in a JSON file, so they are available in later sessions.
+
+        INPUT:
+            * ``filename``: the file where the profile is stored. If ``None``, the profile is only kept in memory.
+              If the file exists, the profile is loaded from it.
+            * ``autosave``: if ``True``, the profile is stored in the file every ``save_every`` new timings
+              and when the interpreter exits.
+            * ``save_every``: number of new timings between two automatic saves.
+
+        The file is written atomically (see :func:`save`), so an interrupted save or several processes
+        sharing the file never leave it corrupted (the last process saving the profile wins).
+    '''
+    def __init__(self, filename=None, autosave=False, save_every=100):
+        self.__filename = filename
+        self.__autosave = autosave and (not filename is None)
+        self.__save_every = save_every
+        self.__unsaved = 0 # timings recorded since the last save
+        self.__timings = {}
+
+        if((not filename is None) and os.path.exists(filename)):
+            with open(filename, "r") as file:
+                self.__timings = {signature : {name : list(data) for (name, data) in solvers.items()}
+                    for (signature, solvers) in json.load(file).items()}
+        if(self.__autosave):
+            atexit.register(self.__save_unsaved)
+
+    def filename(self):
+        r'''
+            Method to get the file where the profile is stored.
+        '''
+        return self.__filename
+
+    def record(self, signature, name, time):
+        r'''
+            Method to add a new timing for a solver.
+
+            INPUT:
+                * ``signature``: the signature of the linear system.
+                * ``name``: the name of the solver.
+                * ``time``: time (in seconds) spent by the solver.
+        '''
+        data = self.__timings.setdefault(signature, {}).setdefault(name, [0, 0.])
+        data[0] += 1; data[1] += time
+        self.__unsaved += 1
+        if(self.__autosave and self.__unsaved >= self.__save_every):
+            self.save()
+
+    def timed(self, signature):
+        r'''
+            Method that returns the list of solvers with some timing for a signature.
+        '''
+        return sorted(self.__timings.get(signature, {}))
+
+    def average(self, signature, name):
+        r'''
+            Method that returns the average time of a solver for a signature (or ``None`` if there is no timing).
+        '''
+        data = self.__timings.get(signature, {}).get(name, None)
+        if(data is None or data[0] == 0):
+            return None
+        return data[1]/data[0]
+
+    def save(self, filename=None):
+        r'''
+            Method to store the profile in a JSON file.
+
+            If ``filename`` is not given, the file given in the creation of the profile is used. The
+            profile is written in a temporary file in the same folder that then replaces ``filename``.
+        '''
+        if(filename is None):
+            filename = self.__filename
+        if(filename is None):
+            raise ValueError("No file was given to store the profile")
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)), suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w") as file:
+                json.dump(self.__timings, file, indent=1, sort_keys=True)
+            os.replace(temporary, filename)
+        except BaseException:
+            os.remove(temporary)
+            raise
+        if(filename == self.__filename):
+            self.__unsaved = 0
+
+    def __save_unsaved(self):
+        if(self.__unsaved > 0):
+            self.save()
+
+    def __repr__(self):
+        return "Profile of linear solvers (%d signatures)" %len(self.__timings)
+
+class LinearSolverDispatcher():
+    r'''
+        Class for choosing the linear solver for a system.
+
+        See the documentation of the module :mod:`~ajpastor.misc.solver_dispatcher` for further information.
+
+        INPUT:
+            * ``profile``: a :class:`SolverProfile` to store the timings. If ``None``, a new profile is created
+              in memory.
+    '''
+    def __init__(self, profile=None):
+        if(profile is None):
+            profile = SolverProfile()
+        self.__profile = profile
+        self.__captured = None
+
+    def profile(self):
+        r'''
+            Method to get the :class:`SolverProfile` of the dispatcher.
+        '''
+        return self.__profile
+
+    #################################################
+    ### Choosing methods
+    #################################################
+    def signature(self, parent, matrix, inhomogeneous=None, is_zero=None, relations=None):
+        r'''
+            Method to compute the signature of a linear system.
+
+            The signature is a string with the type of ring, whether there are relations or not,
+            whether the system is homogeneous and the size (in a logarithmic scale) of the matrix and
+            of its entries.
+        '''
+        size = [0,0]
+        for row in Matrix(matrix).rows() + ([] if inhomogeneous is None else [inhomogeneous]):
+            for el in row:
+                degree, terms = _entry_size(el)
+                size[0] = max(size[0], degree); size[1] = max(size[1], terms)
+
+        return "%s|%s|%s|r%d|c%d|d%d|t%d" %(_ring_kind(parent),
+            "relations" if _has_relations(is_zero, relations) else "free",
+            "homogeneous" if inhomogeneous is None else "inhomogeneous",
+            _bucket(matrix.nrows()), _bucket(matrix.ncols()), _bucket(size[0]), _bucket(size[1]))
+
+    def candidates(self, parent, matrix, inhomogeneous=None, is_zero=None, relations=None):
+        r'''
+            Method that returns the names of the solvers that can solve a linear system.
+
+            If ``inhomogeneous`` is ``None``, the system is considered homogeneous. The solvers
+            ``"sage"`` and ``"hermite"`` do not allow relations among the variables, while ``"bareiss"``
+            only solves homogeneous systems with polynomial coefficients.
+        '''
+        result = []
+        if(isinstance(parent, Wrap_w_Sequence_Ring)):
+            parent = parent.base()
+        localized = isinstance(parent, tuple)
+        has_relations = _has_relations(is_zero, relations)
+
+        if(inhomogeneous is None and (not localized)):
+            polynomial = parent.base() if parent.is_field() else parent
+            if(isUniPolynomial(polynomial) or isMPolynomial(polynomial)):
+                result += ["bareiss"]
+        if((not has_relations) and (localized or parent in EuclideanDomains())):
+            result += ["hermite"]
+        if((not has_relations) and (not localized) and (inhomogeneous is None or parent.is_field())):
+            result += ["sage"]
+
+        if(len(result) == 0 and (not has_relations)): # we try with the generic Euclidean algorithm
+            result += ["hermite"]
+        if(len(result) == 0):
+            raise TypeError("No linear solver available for systems over %s" %(parent,))
+        return result
+
+    def choose(self, parent, matrix, inhomogeneous=None, is_zero=None, relations=None, signature=None):
+        r'''
+            Method that returns the name of the solver chosen for a linear system.
+
+            If all the possible solvers have been timed for the signature of the system, the fastest
+            (on average) is returned. Otherwise, we take the default solver: ``"bareiss"`` for
+            homogeneous systems and ``"hermite"`` for inhomogeneous systems (if possible). Only if
+            the default solver has been timed, we compare it with the other timed solvers.
+
+            The argument ``signature`` can be given to avoid computing the signature of the system
+            again (see :func:`signature`).
+        '''
+        candidates = self.candidates(parent, matrix, inhomogeneous, is_zero, relations)
+        if(inhomogeneous is None):
+            default = candidates[0]
+        else:
+            default = "hermite" if "hermite" in candidates else candidates[0]
+
+        if(signature is None):
+            signature = self.signature(parent, matrix, inhomogeneous, is_zero, relations)
+        timings = {name : self.__profile.average(signature, name) for name in candidates}
+        if(timings[default] is None):
+            return default
+        return min([name for name in candidates if not timings[name] is None], key=lambda name : timings[name])
+
+    def solver(self, parent, matrix, inhomogeneous=None, is_zero=None, relations=None, name=None, **options):
+        r'''
+            Method that builds the solver for a linear system.
+
+            This method chooses a solver (see :func:`choose`), unless ``name`` is given, and builds it. The
+            time spent by the solver computing the solutions is recorded in the profile of the dispatcher.
+
+            INPUT:
+                * ``parent``: the ring where the solutions are searched (see
+                  :class:`~ajpastor.misc.linear_solver.LinearSystemSolver`).
+                * ``matrix``: matrix of the system.
+                * ``inhomogeneous``: inhomogeneous vector of the system. If ``None``, the system is homogeneous.
+                * ``is_zero``: method to check membership in the ideal of relations (see
+                  :class:`~ajpastor.misc.bareiss.BareissAlgorithm`).
+                * ``relations``: list of known relations among the variables.
+                * ``name``: name of the solver to use.
+                * ``options``: other options for the builder of the solver (for example, ``pivoting`` for
+                  :class:`~ajpastor.misc.bareiss.BareissAlgorithm`). Each solver only receives the options
+                  it accepts (see ``_SOLVER_OPTIONS``).
+        '''
+        matrix = Matrix(matrix)
+        signature = self.signature(parent, matrix, inhomogeneous, is_zero, relations)
+        if(name is None):
+            name = self.choose(parent, matrix, inhomogeneous, is_zero, relations, signature)
+        solver = self.__build(name, parent, matrix, inhomogeneous, is_zero, relations, **options)
+
+        captured = self.__captured
+        def observer(solver, time):
+            self.__profile.record(signature, name, time)
+            if(not captured is None):
+                captured.append({"parent" : parent, "matrix" : matrix, "inhomogeneous" : inhomogeneous,
+                    "relations" : [el for el in solver.relations() if el != 0], "options" : options})
+        solver.add_observer(observer)
+        return solver
+
+    #################################################
+    ### Benchmark methods
+    #################################################
+    def start_capture(self):
+        r'''
+            Method to start capturing the linear systems solved with this dispatcher.
+
+            Once the capture is started, each system built with :func:`solver` is stored when its
+            solutions are computed. The relations found by the solver are stored with the system.
+        '''
+        self.__captured = []
+
+    def stop_capture(self):
+        r'''
+            Method to stop capturing linear systems. It returns the list of captured systems.
+        '''
+        captured = self.__captured
+        self.__captured = None
+        return [] if captured is None else captured
+
+    def benchmark(self, systems, names=None, repeat=1):
+        r'''
+            Method to replay a list of captured systems with all the possible solvers.
+
+            For each system in ``systems`` (see :func:`stop_capture`), this method solves the system
+            ``repeat`` times with each possible solver (or the solvers in ``names``) and records
+            the timings in the profile.
+
+            OUTPUT:
+
+            A list with a dictionary for each system with the average time of each solver. If a solver
+            fails for one system, its time is ``None``.
+        '''
+        results = []
+        for system in systems:
+            parent, matrix, inhomogeneous = system["parent"], system["matrix"], system["inhomogeneous"]
+            relations = system["relations"]; options = system.get("options", {})
+            signature = self.signature(parent, matrix, inhomogeneous, None, relations)
+            timings = {}
+            for name in self.candidates(parent, matrix, inhomogeneous, None, relations):
+                if((not names is None) and (not name in names)):
+                    continue
+                total = 0
+                try:
+                    for _ in range(repeat):
+                        solver = self.__build(name, parent, matrix, inhomogeneous, None, relations, **options)
+                        try:
+                            solver.solution()
+                        except NoSolutionError:
+                            pass
+                        total += solver.computation_time()
+                        self.__profile.record(signature, name, solver.computation_time())
+                    timings[name] = total/repeat
+                except (TypeError, ValueError, ArithmeticError):
+                    timings[name] = None
+            results.append(timings)
+        return results
+
+    #################################################
+    ### Private methods
+    #################################################
+    def __build(self, name, parent, matrix, inhomogeneous, is_zero, relations, **options):
+        if(not name in _SOLVER_OPTIONS):
+            raise ValueError("Unknown linear solver: %s" %name)
+        options = {key : value for (key, value) in options.items() if key in _SOLVER_OPTIONS[name]}
+        if(name == "bareiss"):
+            from ajpastor.misc.bareiss import BareissAlgorithm
+            if(is_zero is None):
+                is_zero = lambda p : False
+            return BareissAlgorithm(parent, matrix, is_zero, [] if relations is None else relations, **options)
+
+        if(inhomogeneous is None):
+            inhomogeneous = vector(matrix.parent().base(), matrix.nrows()*[0])
+        if(name == "hermite"):
+            from ajpastor.misc.hermite import HermiteSolver
+            return HermiteSolver(parent, matrix, inhomogeneous, **options)
+        return SageSolver(parent, matrix, inhomogeneous, **options)
+
+def save_systems(systems, filename):
+    r'''
+        Method to store a list of captured systems (see :func:`LinearSolverDispatcher.stop_capture`) in a file.
+    '''
+    save(systems, filename)
+
+def load_systems(filename):
+    r'''
+        Method to load a list of captured systems stored with :func:`save_systems`.
+    '''
+    return load(filename)
+
+#################################################
+### Default dispatcher
+#################################################
+__DEFAULT_DISPATCHER = None
+
+def default_dispatcher():
+    r'''
+        Method that returns the dispatcher used by the operators.
+
+        The profile of this dispatcher is stored in the file given by the environment variable
+        ``AJPASTOR_SOLVER_PROFILE`` (if set). In that case, the timings are saved periodically and when the
+        interpreter exits, so the dispatcher learns across sessions (see :class:`SolverProfile`).
+    '''
+    global __DEFAULT_DISPATCHER
+    if(__DEFAULT_DISPATCHER is None):
+        filename = os.environ.get("AJPASTOR_SOLVER_PROFILE", None)
+        __DEFAULT_DISPATCHER = LinearSolverDispatcher(SolverProfile(filename, not filename is None))
+    return __DEFAULT_DISPATCHER
+
+def linear_solver(parent, matrix, inhomogeneous=None, is_zero=None, relations=None, **options):
+    r'''
+        Method to build a linear solver using the default dispatcher (see :func:`default_dispatcher`).
+    '''
+    return default_dispatcher().solver(parent, matrix, inhomogeneous, is_zero, relations, **options)
+
+#################################################
+### Private functions
+#################################################
+_SOLVER_OPTIONS = {"bareiss" : ("pivoting",), "hermite" : ("euclidean", "xgcd"), "sage" : ()} # options of each builder
+
+def _has_relations(is_zero, relations):
+    return (not is_zero is None) or (not relations is None and any(el != 0 for el in relations))
+
+def _ring_kind(parent):
+    if(isinstance(parent, tuple)):
+        return "localized"
+    if(isinstance(parent, Wrap_w_Sequence_Ring)):
+        parent = parent.base()
+    prefix = ""
+    if(parent.is_field()):
+        if(not (isUniPolynomial(parent.base()) or isMPolynomial(parent.base()))):
+            return "field"
+        prefix = "fraction-"; parent = parent.base()
+    if(isUniPolynomial(parent)):
+        return prefix + "univariate"
+    elif(isMPolynomial(parent)):
+        return prefix + "multivariate"
+    elif(parent in EuclideanDomains()):
+        return "euclidean"
+    return "other"
+
+def _entry_size(el):
+    r'''
+        Returns the degree and number of terms of an element (or the bit size for integers).
+    '''
+    try:
+        parts = [el.numerator(), el.denominator()]
+    except (AttributeError, TypeError, ValueError):
+        parts = [el]
+    degree = 0; terms = 0
+    for part in parts:
+        if(hasattr(part, "number_of_terms")):
+            degree = max(degree, part.degree()); terms = max(terms, part.number_of_terms())
+        elif(hasattr(part, "nbits")):
+            degree = max(degree, part.nbits()); terms = max(terms, 1)
+    return degree, terms
+
+def _bucket(n):
+    return 0 if n <= 0 else int(n).bit_length()
+
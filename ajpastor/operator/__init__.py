@@ -3,6 +3,7 @@ Package operator
 
 In this package the user may find the following subpackages:
 * operator: basic class for linear differential operators
+* recursionMatrix: banded representation of the recursion matrices of the operators
 * listOperator: abstract class of operator based on a list structure
 * oreOperator: class of operator wrapping the operators in ore_alebra
 * twoStepsOperator: abstract class of listOperator that performed operations in two steps
@@ -10,6 +11,7 @@ In this package the user may find the following subpackages:
 * lazyStepOperator: implementation of twoStepsOperator (to review)
 * fullLazyOperator: implementation of twoStepsOperator with all operations lazily performed
 * polynomialLazyOperator: implementation of twoStepsOperator (to review)
+* adaptiveOperator: implementation of listOperator that chooses the best operator for each operation
 
 AUTHORS:
 
@@ -34,6 +36,7 @@ except ImportError:
     print("Package ore_algebra not available")
 from .directStepOperator import DirectStepOperator
 from .polynomialLazyOperator import PolynomialLazyOperator
+from .adaptiveOperator import AdaptiveOperator
 
 from pkgutil import extend_path
 __path__ = extend_path(__path__, __name__)
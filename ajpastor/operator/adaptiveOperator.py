@@ -0,0 +1,311 @@
+r"""
+Python file for adaptiveOperator
+
+This module offers an implementation of a ListOperator that does not compute the closure properties by itself.
+Instead, for each operation it estimates the cost of the computation (using the orders of the operators, the
+size of their coefficients and the depth of the coefficient ring) and dispatches the computation to one of the
+concrete implementations of operators:
+
+* ``"ore"``: the class :class:`~ajpastor.operator.oreOperator.w_OreOperator` (only for polynomial coefficients).
+* ``"direct"``: the class :class:`~ajpastor.operator.directStepOperator.DirectStepOperator`.
+* ``"lazy"``: the class :class:`~ajpastor.operator.lazyStepOperator.LazyStepOperator`.
+* ``"polynomial"``: the class :class:`~ajpastor.operator.polynomialLazyOperator.PolynomialLazyOperator`.
+* ``"full"``: the class :class:`~ajpastor.operator.fullLazyOperator.FullLazyOperator`.
+
+Each operator built by this class remembers which strategy computed it and the time it took (see
+:func:`AdaptiveOperator.strategy`). The class also keeps a trace with all the computations performed
+(see :func:`AdaptiveOperator.traces`) and, optionally, records the timings in a
+:class:`~ajpastor.misc.solver_dispatcher.SolverProfile`, so the thresholds can be tuned from real
+computations (see :func:`AdaptiveOperator.set_thresholds`).
+
+EXAMPLES::
+
+    sage: from ajpastor.operator.adaptiveOperator import *
+    sage: R.<x> = QQ[]
+    sage: op1 = AdaptiveOperator(R, [1, 0, 1]); op2 = AdaptiveOperator(R, [-1, 1])
+    sage: op1.cost("add", op2)
+    3
+    sage: op1.choose("add", op2) in ("ore", "direct")
+    True
+    sage: op = op1.add_solution(op2)
+    sage: op.order()
+    3
+    sage: op.strategy()[0]
+    'add'
+
+AUTHORS:
+
+    - Antonio Jimenez-Pastor (2021-02-09): initial version
+
+"""
+
+# ****************************************************************************
+#  Copyright (C) 2021 Antonio Jimenez-Pastor <ajpastor@risc.uni-linz.ac.at>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#                  https://www.gnu.org/licenses/
+# ****************************************************************************
+
+import logging
+from time import time
+
+# Local imports
+from .listOperator import ListOperator
+from .operator import foo_derivative
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveOperator(ListOperator):
+    r'''
+        Class for operators that choose the implementation of each closure property.
+
+        The cost of an operation is the expected order of the result (the sum of the orders for additions,
+        the product for products and the order itself for derivatives and compositions) multiplied
+        by the weight of the coefficients (the maximal degree of the polynomial coefficients or the
+        maximal order of the non-constant coefficients, plus one).
+
+        With polynomial coefficients, the strategy ``"ore"`` is chosen if the package ``ore_algebra`` is available
+        and ``"direct"`` otherwise. For deeper coefficients, the thresholds (see :func:`set_thresholds`) are checked
+        in the order ``"direct"``, ``"lazy"`` and ``"polynomial"`` (this last only for depth one), taking the first
+        one whose threshold is not smaller than the cost. If none is valid, ``"full"`` is chosen.
+
+        INPUT:
+            * ``base``: the structure where the coefficients of the operator will be.
+            * ``input``: the input data for the operator (see :class:`~ajpastor.operator.listOperator.ListOperator`).
+            * ``derivate``: the derivation on ``base``.
+    '''
+    ### Static parameters
+    _op_preference = 6
+
+    _thresholds = {"direct" : 6, "lazy" : 0, "polynomial" : 20} # a threshold 0 disables the strategy
+    _fallback = ("direct", "full") # strategies used when the chosen one fails (polynomial and deep coefficients)
+    _traces = []
+    _max_traces = 1000
+    _profile = None
+
+    #######################################################
+    ### INIT METHOD AND GETTERS
+    #######################################################
+    def __init__(self, base, input, derivate = foo_derivative):
+        super(AdaptiveOperator, self).__init__(base, input, derivate)
+
+        self.__strategy = None
+
+    def strategy(self):
+        r'''
+            Method that returns how ``self`` was computed.
+
+            OUTPUT:
+
+            A tuple ``(operation, strategy, cost, time)`` or ``None`` if ``self`` was not
+            computed as a closure property.
+        '''
+        return self.__strategy
+
+    #######################################################
+    ### STATIC METHODS FOR TUNING
+    #######################################################
+    @staticmethod
+    def set_thresholds(**thresholds):
+        r'''
+            Method to change the thresholds for choosing the strategies.
+
+            INPUT:
+                * ``thresholds``: the new maximal cost for the strategies ``"direct"``, ``"lazy"`` or ``"polynomial"``.
+        '''
+        for name in thresholds:
+            if(not name in AdaptiveOperator._thresholds):
+                raise ValueError("There is no threshold for the strategy %s" %name)
+            AdaptiveOperator._thresholds[name] = thresholds[name]
+
+    @staticmethod
+    def thresholds():
+        r'''
+            Method that returns the current thresholds for choosing the strategies.
+        '''
+        return dict(AdaptiveOperator._thresholds)
+
+    @staticmethod
+    def set_profile(profile):
+        r'''
+            Method to set a :class:`~ajpastor.misc.solver_dispatcher.SolverProfile` where the timings are recorded.
+
+            The signature used in the profile is ``"operation|depth|cost"``. Use ``None`` to stop recording.
+        '''
+        AdaptiveOperator._profile = profile
+
+    @staticmethod
+    def traces():
+        r'''
+            Method that returns the list of the last computations as tuples
+            ``(operation, strategy, cost, depth, time)``.
+        '''
+        return list(AdaptiveOperator._traces)
+
+    @staticmethod
+    def clear_traces():
+        r'''
+            Method that removes the stored traces.
+        '''
+        AdaptiveOperator._traces = []
+
+    #######################################################
+    ### COST ESTIMATION
+    #######################################################
+    def depth(self):
+        r'''
+            Method that returns the depth of the coefficient ring of ``self`` (`0` for polynomial coefficients).
+        '''
+        from ajpastor.dd_functions.ddFunction import is_DDRing
+        if(is_DDRing(self.base())):
+            return self.base().depth()
+        return 0
+
+    def weight(self):
+        r'''
+            Method that returns the weight of the coefficients of ``self``.
+
+            For coefficients in a differentially definable ring, this is the maximal order of the non-constant
+            coefficients plus one. Otherwise, it is the maximal degree of the coefficients plus one.
+        '''
+        result = 0
+        for coeff in self.coefficients():
+            try:
+                if(self.depth() > 0):
+                    if(not coeff.is_constant()):
+                        result = max(result, coeff.order())
+                else:
+                    result = max(result, coeff.degree())
+            except (AttributeError, TypeError):
+                pass
+        return result + 1
+
+    def cost(self, operation, *others):
+        r'''
+            Method that estimates the cost of a closure property.
+
+            INPUT:
+                * ``operation``: one of ``"add"``, ``"add_many"``, ``"mult"``, ``"derivative"`` or ``"compose"``.
+                * ``others``: the other operators involved in the operation.
+        '''
+        others = [other if isinstance(other, AdaptiveOperator) else AdaptiveOperator(self.base(), other, self.derivate()) for other in others]
+        orders = [self.order()] + [other.order() for other in others]
+        if(operation in ("add", "add_many")):
+            size = sum(orders)
+        elif(operation == "mult"):
+            size = 1
+            for order in orders:
+                size *= order
+        else:
+            size = orders[0]
+
+        return size*max([self.weight()] + [other.weight() for other in others])
+
+    def choose(self, operation, *others):
+        r'''
+            Method that returns the name of the strategy for a closure property (see :func:`cost`).
+        '''
+        depth = self.depth()
+        if(depth == 0):
+            if(self.__strategy_class("ore") is None):
+                return "direct"
+            return "ore"
+
+        cost = self.cost(operation, *others)
+        thresholds = AdaptiveOperator._thresholds
+        if(cost <= thresholds["direct"]):
+            return "direct"
+        elif(cost <= thresholds["lazy"]):
+            return "lazy"
+        elif(depth == 1 and cost <= thresholds["polynomial"]):
+            return "polynomial"
+        return "full"
+
+    #######################################################
+    ### SOLUTION ARITHMETHIC METHODS
+    #######################################################
+    def _compute_add_solution(self, other):
+        return self.__dispatch("add", [other], lambda op, others : op._compute_add_solution(others[0]))
+
+    def _compute_add_many_solution(self, others):
+        return self.__dispatch("add_many", others, lambda op, others : op._compute_add_many_solution(others))
+
+    def _compute_mult_solution(self, other):
+        return self.__dispatch("mult", [other], lambda op, others : op._compute_mult_solution(others[0]))
+
+    def _compute_derivative_solution(self):
+        return self.__dispatch("derivative", [], lambda op, _ : op._compute_derivative_solution())
+
+    def _compute_compose_solution(self, other):
+        return self.__dispatch("compose", [], lambda op, _ : op._compute_compose_solution(other))
+
+    def _compute_simple_add_solution(self, other, bound = 5):
+        return self.__dispatch("add", [other], lambda op, others : op._compute_simple_add_solution(others[0], bound))
+
+    def _compute_simple_mult_solution(self, other, bound = 5):
+        return self.__dispatch("mult", [other], lambda op, others : op._compute_simple_mult_solution(others[0], bound))
+
+    def _compute_simple_derivative_solution(self, bound = 5):
+        return self.__dispatch("derivative", [], lambda op, _ : op._compute_simple_derivative_solution(bound))
+    #######################################################
+
+    #######################################################
+    ### PRIVATE METHODS
+    #######################################################
+    def __strategy_class(self, name):
+        if(name == "ore"):
+            try:
+                from .oreOperator import w_OreOperator
+                return w_OreOperator
+            except ImportError:
+                return None
+        elif(name == "direct"):
+            from .directStepOperator import DirectStepOperator
+            return DirectStepOperator
+        elif(name == "lazy"):
+            from .lazyStepOperator import LazyStepOperator
+            return LazyStepOperator
+        elif(name == "polynomial"):
+            from .polynomialLazyOperator import PolynomialLazyOperator
+            return PolynomialLazyOperator
+        elif(name == "full"):
+            from .fullLazyOperator import FullLazyOperator
+            return FullLazyOperator
+        raise ValueError("Unknown strategy %s" %name)
+
+    def __run(self, name, others, method):
+        cls = self.__strategy_class(name)
+        op = cls(self.base(), self, self.derivate())
+        others = [cls(self.base(), other, self.derivate()) for other in others]
+        return method(op, others)
+
+    def __dispatch(self, operation, others, method):
+        depth = self.depth()
+        name = self.choose(operation, *others)
+        cost = self.cost(operation, *others)
+
+        start = time()
+        try:
+            result = self.__run(name, others, method)
+        except (NotImplementedError, TypeError, ValueError, ArithmeticError):
+            fallback = AdaptiveOperator._fallback[0 if depth == 0 else 1]
+            if(name == fallback):
+                raise
+            logger.debug("Strategy %s failed for %s; using %s" %(name, operation, fallback), exc_info=True)
+            name = fallback
+            result = self.__run(name, others, method)
+        elapsed = time()-start
+
+        ## Storing the trace of the computation
+        AdaptiveOperator._traces.append((operation, name, cost, depth, elapsed))
+        if(len(AdaptiveOperator._traces) > AdaptiveOperator._max_traces):
+            del AdaptiveOperator._traces[0]
+        if(not AdaptiveOperator._profile is None):
+            AdaptiveOperator._profile.record("%s|%d|%d" %(operation, depth, cost), name, elapsed)
+
+        result = AdaptiveOperator(self.base(), result, self.derivate())
+        result.__strategy = (operation, name, cost, elapsed)
+        return result
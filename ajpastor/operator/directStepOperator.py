@@ -71,7 +71,7 @@ class DirectStepOperator(TwoStepsOperator):
     ### SOLVING MATRICES METHOD
     ####################################################### 
     def _get_element_nullspace(self, M):
-        from ajpastor.misc.bareiss import BareissAlgorithm
+        from ajpastor.misc.solver_dispatcher import linear_solver
         ## We take the domain where our elements will lie
         parent = M.parent().base().base()
         
@@ -79,9 +79,9 @@ class DirectStepOperator(TwoStepsOperator):
         try:
             lcms = [lcm([el.denominator() for el in row]) for row in M]
             N = Matrix(parent, [[el*lcms[i] for el in M[i]] for i in range(M.nrows())])
-            ba = BareissAlgorithm(parent, N, lambda p : False)
+            solver = linear_solver(parent, N)
             
-            ker = ba.syzygy().transpose()
+            ker = solver.syzygy().transpose()
         except Exception as e:
             print(e)
             ker = M.right_kernel_matrix()
@@ -114,8 +114,17 @@ class DirectStepOperator(TwoStepsOperator):
     
     
     def _solve_linear_system(self, A, b, ring):
+        return self._get_linear_solver(A, b, ring).solution()
+
+    def _get_linear_solver(self, A, b, ring, previous=None):
         from ajpastor.misc.hermite import HermiteSolver
-        return HermiteSolver(ring, A, b).solution()
+        from ajpastor.misc.solver_dispatcher import linear_solver
+        ## If the new system only adds columns, we reuse the previous Hermite normal form
+        if(isinstance(previous, HermiteSolver) and previous.A.nrows() == A.nrows() and previous.A.ncols() < A.ncols()):
+            n = previous.A.ncols()
+            if(A.matrix_from_columns(range(n)) == previous.A):
+                return previous.extend(A.matrix_from_columns(range(n, A.ncols())), b)
+        return linear_solver(ring, A, b)
     ####################################################### 
     
 
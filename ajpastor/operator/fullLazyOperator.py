@@ -58,7 +58,7 @@ from .operator import foo_derivative
 
 from ajpastor.lazy.lazyRing import LazyRing
 
-from ajpastor.misc.bareiss import BareissAlgorithm
+from ajpastor.misc.solver_dispatcher import linear_solver
 
 class FullLazyOperator(TwoStepsOperator):
     ### Static parameters
@@ -125,7 +125,7 @@ class FullLazyOperator(TwoStepsOperator):
         R = self.__conversion
         
         ## We assume the matrix is in the correct space
-        M = Matrix(R.poly_field(), [[R.simplify(el.poly()) for el in row] for row in M])
+        M = Matrix(R.poly_field(), R.simplify_rows([[el.poly() for el in row] for row in M]))
         
         ## We clean denominators to lie in the polynomial ring
         lcms = [self.__get_lcm([el.denominator() for el in row]) for row in M]
@@ -138,10 +138,10 @@ class FullLazyOperator(TwoStepsOperator):
 
         ## Computing the kernell of the matrix
         if(len(R.map_of_vars()) > 0):
-            bareiss_algorithm = BareissAlgorithm(R.poly_ring(),M,f,R._ConversionSystem__relations)
-            ker = bareiss_algorithm.syzygy().transpose()
+            solver = linear_solver(R.poly_ring(), M, is_zero=f, relations=R._ConversionSystem__relations, pivoting="size")
+            ker = solver.syzygy().transpose()
             ## If some relations are found during this process, we add it to the conversion system
-            R.add_relations(bareiss_algorithm.relations())
+            R.add_relations(solver.relations())
         else:
             ker = [v for v in M.right_kernel_matrix()]
                 
@@ -166,16 +166,16 @@ class FullLazyOperator(TwoStepsOperator):
             
         ## When exiting the loop, aux has just one vector
         sol = aux[0]
-        sol = [R.simplify(a) for a in sol]
+        sol = R.simplify_rows([sol])[0]
         
         ## Just to be sure everything is as simple as possible, we divide again by the gcd of all our
         ## coefficients and simplify them using the relations known.
         fin_gcd = gcd(sol)
         finalSolution = [a/fin_gcd for a in sol]
-        finalSolution = [R.simplify(a) for a in finalSolution]
+        finalSolution = R.simplify_rows([finalSolution])[0]
         
         ## We transform our polynomial into elements of our destiny domain
-        realSolution = [R.to_real(a) for a in finalSolution]
+        realSolution = R.to_real_rows([finalSolution])[0]
         for i in range(len(realSolution)):
             try:
                 realSolution[i].built = ("polynomial", (finalSolution[i], {str(key): R.map_of_vars()[str(key)] for key in finalSolution[i].variables()}))
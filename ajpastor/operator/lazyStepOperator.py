@@ -83,10 +83,9 @@ class LazyStepOperator(TwoStepsOperator):
             
         ## We divide by the leading coefficient
         coefficients = [-(coefficients[i]/coefficients[-1]) for i in range(len(coefficients)-1)]
-        ## Trying to reduce the elements
+        ## Trying to reduce the elements (all of them share the same denominator)
         try:
-            for i in range(len(coefficients)):
-                coefficients[i].reduce()
+            coefficients = field.normalize_row(coefficients)
         except AttributeError:
             pass
         except ArithmeticError:
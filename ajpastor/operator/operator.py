@@ -68,12 +68,16 @@ from sage.all_cmdline import x
 ### Updated (21-08-2017)
 ###     - Changed name parent to base
 ###
+### Updated (09-02-2021)
+###     - The recursion matrices are banded and their rows are cached (see recursionMatrix)
+###
 ####################################################################################################
 ####################################################################################################
 
 from ajpastor.misc.cached_property import derived_property
 from ajpastor.misc.ring_w_sequence import Ring_w_Sequence
 from ajpastor.misc.ring_w_sequence import Wrap_w_Sequence_Ring
+from ajpastor.operator.recursionMatrix import RecursionRows, RecursionMatrix
 
 from sage.rings.polynomial.polynomial_ring import is_PolynomialRing
 from sage.rings.polynomial.multi_polynomial_ring import is_MPolynomialRing
@@ -118,6 +122,7 @@ def _tower_variables(parent):
 class Operator(object):
     ### Static parameters
     _op_preference = 0
+    __recursion_rows = None # cache for the rows of the recursion matrix (see get_recursion_matrix)
 
     #######################################################
     ### INIT METHOD AND GETTERS
@@ -303,6 +308,22 @@ class Operator(object):
         return sum([self.base().sequence(self.coefficient(l), l+n)*falling_factorial(var-n, l) for l in range(0,self.order()+1)])
         
     def get_recursion_row(self,i):
+        '''
+            Method to get the i-th row of the recursion matrix of this operator.
+
+            The rows are computed only once (see method get_recursion_matrix).
+
+            OUTPUT:
+                A list with i+self.order()+1 elements.
+        '''
+        return self.__recursion().dense_row(i, i+self.order()+1)
+
+    def __recursion(self):
+        if(self.__recursion_rows is None):
+            self.__recursion_rows = RecursionRows(self, self.__polynomialRing.base(), self.__compute_recursion_row)
+        return self.__recursion_rows
+
+    def __compute_recursion_row(self,i):
         r = self.coefficients()
         d = self.order()
         row = []
@@ -337,16 +358,18 @@ class Operator(object):
         return row
         
     def get_recursion_matrix(self, n):
-        nrows = n+1
-        ncols = n+self.forward_order+1
-        rows = []
-        
-        for i in range(nrows):
-            row = self.get_recursion_row(i)
-            
-            rows += [[row[i] for i in range(min(len(row),ncols))] + [0 for i in range(ncols-len(row))]]
-            
-        return Matrix(self.__polynomialRing.base(), rows)
+        '''
+            Method to get the recursion matrix of this operator with n+1 rows.
+
+            The matrix is banded, so it is not built as a dense matrix (see the module
+            ajpastor.operator.recursionMatrix). The rows are cached in the operator and
+            they are shared among all the recursion matrices, so increasing n only computes
+            the new rows.
+
+            OUTPUT:
+                A RecursionMatrix with n+1 rows and n+self.forward_order+1 columns.
+        '''
+        return RecursionMatrix(self.__recursion(), n)
     #######################################################
         
     #######################################################
@@ -354,7 +377,7 @@ class Operator(object):
     #######################################################
     @derived_property
     def dimension(self):
-        return self.jp_matrix().right_kernel_matrix().nrows()
+        return self.jp_matrix().right_nullity()
     
     @derived_property
     def forward_order(self):
@@ -444,7 +467,39 @@ class Operator(object):
             other = self.__class__(self.base(), other, self.derivate())
             
         return self._compute_add_solution(other)
-                
+
+    def add_many_solution(self, *others):
+        '''
+        This method computes a new operator such any linear combination of solutions of 'self == 0' and of each of the
+        operators in 'others' must satisfy.
+
+        Instead of computing iteratively the operator for the additions of solutions (see method add_solution), this method
+        computes the annihilator of all the linear combinations at once.
+        '''
+        if(len(others) == 1 and type(others[0]) in (list, tuple)):
+            others = others[0]
+
+        ## Casting the inputs that are not operators
+        others = [other if isinstance(other, Operator) else self.__class__(self.base(), other, self.derivate()) for other in others]
+
+        ## If any of the operators has higher preference, we let it compute the annihilator
+        best = max([self] + others, key=lambda op : op._get_preference())
+        if(best._get_preference() > self._get_preference()):
+            return best.add_many_solution(*[op for op in [self] + others if not (op is best)])
+        others = [other if isinstance(other, self.__class__) else self.__class__(self.base(), other, self.derivate()) for other in others]
+
+        ## Removing repeated operators (they add nothing to the final module)
+        different = []
+        for other in others:
+            if(not any(other == op for op in [self] + different)):
+                different += [other]
+
+        if(len(different) == 0):
+            return self
+        elif(len(different) == 1):
+            return self._compute_add_solution(different[0])
+        return self._compute_add_many_solution(different)
+
     def mult_solution(self, other):
         '''
         This method computes a new operator such any solution of 'self == 0' multiplied by any solution of 'other == 0' must satisfy.
@@ -496,7 +551,19 @@ class Operator(object):
     
     def _compute_add_solution(self, other):
         raise NotImplementedError('Method not implemented. Class: %s' %self.__class__)
-        
+
+    def _compute_add_many_solution(self, others):
+        '''
+        This method computes a new operator such any linear combination of solutions of 'self == 0' and of the operators
+        in 'others' must satisfy. It assumes that all the operators in 'others' are exactly the same type as self.
+
+        By default, this method computes the operator iteratively using add_solution.
+        '''
+        result = self
+        for other in others:
+            result = result._compute_add_solution(other)
+        return result
+
     def _compute_mult_solution(self, other):
         '''
         This method computes a new operator such any solution of 'self == 0' multiplied by any solution of 'other == 0' must satisfy.
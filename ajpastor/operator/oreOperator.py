@@ -196,7 +196,13 @@ class w_OreOperator(Operator):
             return w_OreOperator(self.base(),self.operator.lclm(other.operator, algorithm="linalg"))
         except TypeError:
             return w_OreOperator(self.base(),self.operator.lclm(other.operator, algorithm="euclid"))
-        
+
+    def _compute_add_many_solution(self, others):
+        op1 = DirectStepOperator(self.base(), self, self.derivate())
+        others = [DirectStepOperator(self.base(), other, self.derivate()) for other in others]
+
+        return w_OreOperator(self.base(), op1._compute_add_many_solution(others), self.derivate())
+
     def _compute_mult_solution(self, other):
         return w_OreOperator(self.base(),self.operator.symmetric_product(other.operator))
         
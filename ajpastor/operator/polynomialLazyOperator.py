@@ -65,7 +65,7 @@ from .operator import foo_derivative
 from ajpastor.lazy.lazyIDElements import LazyIntegralDomain
 from ajpastor.lazy.lazyToPoly import LazyToPoly
 
-from ajpastor.misc.bareiss import BareissAlgorithm
+from ajpastor.misc.solver_dispatcher import linear_solver
 
 class PolynomialLazyOperator(TwoStepsOperator):
     ### Static parameters
@@ -162,10 +162,10 @@ class PolynomialLazyOperator(TwoStepsOperator):
         from sage.rings.polynomial.multi_polynomial_ring import is_MPolynomialRing as isMPolynomial
         ## Computing the kernell of the matrix
         if(isUniPolynomial(R) or isMPolynomial(R)):
-            bareiss_algorithm = BareissAlgorithm(R,M,f)
-            ker = bareiss_algorithm.syzygy().transpose()
+            solver = linear_solver(R, M, is_zero=f, pivoting="size")
+            ker = solver.syzygy().transpose()
             ## If some relations are found during this process, we add it to the conversion system
-            self.__conversion.add_relations(bareiss_algorithm.relations())
+            self.__conversion.add_relations(solver.relations())
         else:
             ker = [v for v in M.right_kernel_matrix()]
                 
@@ -212,10 +212,7 @@ class PolynomialLazyOperator(TwoStepsOperator):
     ####################################################### 
     
     def __smart_is_null(self, p):
-        try:
-            return any(self.__conversion.to_real(factor[0]).raw().is_null for factor in p.factor())
-        except AttributeError:
-            return self.__conversion.to_real(p).raw().is_null
+        return self.__conversion.zero_oracle().is_zero(p, add_relations=False)
             
 
 
@@ -0,0 +1,306 @@
+r"""
+Python file for the recursion matrices of linear differential operators
+
+The recursion matrix of a linear differential operator `L` of forward order `s` (see
+:func:`~ajpastor.operator.operator.Operator.forward_order`) is the matrix `M_n` whose `i`-th row contains the
+coefficients of the linear relation `L` imposes on the coefficients of the power series solutions (see
+:func:`~ajpastor.operator.operator.Operator.get_recursion_row`). The `i`-th row has no non-zero entry after the
+column `i+s`, and when the coefficients of `L` are polynomials the row has also no non-zero entry before
+some column `i-b`, so these matrices are banded.
+
+This module offers the class :class:`RecursionRows`, that stores the rows of the recursion matrix of an operator
+with only their non-zero band and computes them incrementally, and the class :class:`RecursionMatrix`, that
+represents the matrix `M_n` without building the dense matrix. The linear algebra (products, solving
+systems and computing the right kernel) is performed by forward substitution along the band: each row
+defines the coefficient in its last column, and only the rows where that entry vanishes (finitely many,
+see :func:`~ajpastor.operator.operator.Operator.jp_value`) impose conditions on the free coefficients.
+
+EXAMPLES::
+
+    sage: from ajpastor.dd_functions import *
+    sage: M = DFinite.element([1,0,1]).equation.get_recursion_matrix(10)
+    sage: M.nrows(), M.ncols()
+    (11, 13)
+    sage: M.right_nullity()
+    2
+    sage: Matrix(QQ, M).right_kernel_matrix() == M.right_kernel_matrix()
+    True
+
+AUTHORS:
+
+    - Antonio Jimenez-Pastor (2021-02-09): initial version
+
+"""
+
+# ****************************************************************************
+#  Copyright (C) 2021 Antonio Jimenez-Pastor <ajpastor@risc.uni-linz.ac.at>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#                  https://www.gnu.org/licenses/
+# ****************************************************************************
+
+from sage.all import Matrix, vector
+
+class RecursionRows(object):
+    r'''
+        Class for the incremental cache of the rows of the recursion matrix of an operator.
+
+        Each row `i` is stored as a pair ``(start, entries)`` where ``start`` is the first non-zero
+        column and ``entries`` the values from that column to the last non-zero column.
+
+        INPUT:
+            * ``operator``: the :class:`~ajpastor.operator.operator.Operator` for the recursion.
+            * ``field``: the field where the entries of the matrix live.
+            * ``compute_row``: method that computes the dense `i`-th row of the recursion matrix.
+    '''
+    def __init__(self, operator, field, compute_row):
+        self.__operator = operator
+        self.__field = field
+        self.__compute_row = compute_row
+        self.__rows = []
+        self.__banded = True # no row has non-zero elements after the pivot column
+
+    def field(self):
+        return self.__field
+
+    def forward_order(self):
+        return self.__operator.forward_order
+
+    def extend(self, n):
+        r'''
+            Method that computes the rows up to the `n`-th row (included).
+        '''
+        s = self.forward_order()
+        for i in range(len(self.__rows), n+1):
+            row = [self.__field(el) for el in self.__compute_row(i)]
+            start = 0
+            while(start < len(row) and row[start] == 0):
+                start += 1
+            end = len(row)
+            while(end > start and row[end-1] == 0):
+                end -= 1
+            if(end > i+s+1):
+                self.__banded = False
+            self.__rows.append((start, row[start:end]))
+
+    def is_banded(self):
+        r'''
+            Method that checks whether all the computed rows have their last non-zero element at most
+            in the pivot column (i.e., the column `i+s` for the row `i`).
+        '''
+        return self.__banded
+
+    def row(self, i):
+        r'''
+            Method that returns the `i`-th row in the format ``(start, entries)``.
+        '''
+        self.extend(i)
+        return self.__rows[i]
+
+    def dense_row(self, i, length):
+        r'''
+            Method that returns the `i`-th row as a list with ``length`` elements.
+        '''
+        start, entries = self.row(i)
+        row = [self.__field.zero()]*length
+        for j in range(start, min(length, start+len(entries))):
+            row[j] = entries[j-start]
+        return row
+
+    def bandwidth(self):
+        r'''
+            Method that returns the maximal distance from the first non-zero element to the pivot column
+            among the computed rows.
+        '''
+        s = self.forward_order()
+        return max([i+s-self.__rows[i][0] for i in range(len(self.__rows))], default=0)
+
+class RecursionMatrix(object):
+    r'''
+        Class for the recursion matrix `M_n` of an operator (see :func:`~ajpastor.operator.operator.Operator.get_recursion_matrix`).
+
+        This class represents the matrix with rows `0,\ldots,n` and columns `0,\ldots,n+s` where `s` is the forward
+        order of the operator. The rows are shared with all the recursion matrices of the same operator.
+
+        INPUT:
+            * ``rows``: the :class:`RecursionRows` of the operator.
+            * ``n``: index of the last row of the matrix.
+            * ``field``: field for the linear algebra operations. It must contain the field of ``rows``.
+              If ``None``, the field of ``rows`` is used.
+    '''
+    def __init__(self, rows, n, field=None):
+        self.__rows = rows
+        self.__n = n
+        self.__field = rows.field() if field is None else field
+        self.__solution = None # parametrization of the right kernel
+
+        rows.extend(n)
+
+    def base_ring(self):
+        return self.__field
+
+    def change_ring(self, field):
+        r'''
+            Method that returns the same recursion matrix over a bigger field.
+        '''
+        return RecursionMatrix(self.__rows, self.__n, field)
+
+    def nrows(self):
+        return self.__n+1
+
+    def ncols(self):
+        return self.__n+self.__rows.forward_order()+1
+
+    def dimensions(self):
+        return (self.nrows(), self.ncols())
+
+    def row(self, i):
+        r'''
+            Method that returns the `i`-th row of ``self`` as a vector.
+        '''
+        if(i < 0 or i > self.__n):
+            raise IndexError("row index out of range")
+        return vector(self.base_ring(), self.__rows.dense_row(i, self.ncols()))
+
+    def __getitem__(self, key):
+        if(isinstance(key, tuple)):
+            i,j = key
+            start, entries = self.__rows.row(i)
+            if(j < 0 or j >= self.ncols()):
+                raise IndexError("column index out of range")
+            return self.base_ring()(entries[j-start]) if (start <= j < start+len(entries)) else self.base_ring().zero()
+        return self.row(key)
+
+    def __repr__(self):
+        return "%d x %d recursion matrix over %s" %(self.nrows(), self.ncols(), self.base_ring())
+
+    def _matrix_(self, R=None):
+        r'''
+            Method that builds the dense matrix (used by ``Matrix(R, self)``).
+        '''
+        R = self.base_ring() if R is None else R
+        return Matrix(R, [self.__rows.dense_row(i, self.ncols()) for i in range(self.nrows())])
+
+    def __mul__(self, other):
+        r'''
+            Product of ``self`` with a vector with :func:`ncols` elements.
+        '''
+        if(len(other) != self.ncols()):
+            raise ArithmeticError("incompatible dimensions for the product: %s and %d" %(self.dimensions(), len(other)))
+        result = []
+        for i in range(self.nrows()):
+            start, entries = self.__rows.row(i)
+            result += [sum((entries[j]*other[start+j] for j in range(min(len(entries), self.ncols()-start))), self.base_ring().zero())]
+        return vector(self.base_ring(), result)
+
+    def solve_right(self, v):
+        r'''
+            Method that computes a vector `X` such that ``self*X == v``.
+
+            This method raises a ``ValueError`` if there is no solution.
+        '''
+        if(len(v) != self.nrows()):
+            raise ValueError("incompatible dimensions for the system: %s and %d" %(self.dimensions(), len(v)))
+        if(not self.__rows.is_banded()):
+            return self._matrix_().solve_right(vector(self.base_ring(), v))
+        values, conditions, params = self.__substitution(v)
+        A = self.__conditions_matrix(conditions, params)
+        b = vector(self.base_ring(), [-condition[0] for condition in conditions])
+        p = A.solve_right(b) # raises ValueError if no solution
+        return vector(self.base_ring(), [_evaluate(el, p) for el in values])
+
+    def right_kernel_matrix(self):
+        r'''
+            Method that computes a basis (in echelon form) of the right kernel of ``self``.
+        '''
+        if(not self.__rows.is_banded()):
+            return self._matrix_().right_kernel_matrix()
+        values, conditions, params = self.__kernel()
+        field = self.base_ring()
+        if(params == 0):
+            return Matrix(field, 0, self.ncols())
+        K = self.__conditions_matrix(conditions, params).right_kernel_matrix()
+        basis = [[_evaluate(el, k, False) for el in values] for k in K.rows()]
+        return Matrix(field, len(basis), self.ncols(), basis).echelon_form()
+
+    def right_nullity(self):
+        r'''
+            Method that computes the dimension of the right kernel of ``self``.
+        '''
+        if(not self.__rows.is_banded()):
+            return self._matrix_().right_nullity()
+        _, conditions, params = self.__kernel()
+        return params - self.__conditions_matrix(conditions, params).rank()
+
+    #################################################
+    ### Private methods
+    #################################################
+    def __conditions_matrix(self, conditions, params):
+        return Matrix(self.base_ring(), len(conditions), params, [_pad(condition, params+1)[1:] for condition in conditions])
+
+    def __kernel(self):
+        if(self.__solution is None):
+            self.__solution = self.__substitution([0]*self.nrows())
+        return self.__solution
+
+    def __substitution(self, v):
+        r'''
+            Forward substitution for the system ``self*X == v``.
+
+            Each unknown is represented by a list `[c_0, c_1, \ldots]` meaning `c_0 + c_1p_1 + \ldots` where
+            `p_j` are the free parameters. The first `s` unknowns are free and the `i`-th row defines the unknown
+            of column `i+s` unless its pivot is zero. In that case, that unknown is a new free parameter and
+            the row is a condition on the parameters.
+
+            OUTPUT:
+
+            A tuple with the representation of the unknowns, the list of conditions (represented in the 
+            same way, they must be zero) and the number of parameters.
+        '''
+        field = self.base_ring(); zero = field.zero()
+        s = self.__rows.forward_order()
+        values = [[zero]+[zero]*j+[field.one()] for j in range(s)]
+        params = s
+        conditions = []
+        for i in range(self.nrows()):
+            start, entries = self.__rows.row(i)
+            pivot = entries[i+s-start] if (start <= i+s < start+len(entries)) else zero
+            combination = [field(v[i])]
+            for j in range(start, min(i+s, start+len(entries))):
+                if(entries[j-start] != 0):
+                    combination = _axpy(-entries[j-start], values[j], combination)
+            if(pivot == 0):
+                params += 1
+                values.append([zero]*params+[field.one()])
+                conditions.append(combination)
+            else:
+                values.append([el/pivot for el in combination])
+        return values, conditions, params
+
+def _pad(lst, length):
+    return lst + [0]*(length-len(lst))
+
+def _axpy(a, x, y):
+    r'''
+        Computes `ax + y` for lists of different lengths.
+    '''
+    result = list(y) + [0]*(len(x)-len(y))
+    for i in range(len(x)):
+        if(x[i] != 0):
+            result[i] += a*x[i]
+    return result
+
+def _evaluate(value, params, affine=True):
+    r'''
+        Evaluates the representation of an unknown at the given parameters.
+    '''
+    result = value[0] if affine else 0
+    for i in range(1, len(value)):
+        if(value[i] != 0):
+            result += value[i]*params[i-1]
+    return result
+
+__all__ = ["RecursionRows", "RecursionMatrix"]
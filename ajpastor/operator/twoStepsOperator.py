@@ -59,6 +59,10 @@ from sage.all import (Matrix, vector)
 
 #sage imports
 from sage.all import cached_method, lcm
+from sage.categories.pushout import pushout
+
+# Python imports
+from functools import reduce
 
 # Local imports
 from .listOperator import ListOperator
@@ -82,6 +86,12 @@ class TwoStepsOperator(ListOperator):
         v = self._get_element_nullspace(M)
         
         return self.__class__(self.base(), [el for el in v], self.derivate())
+
+    def _compute_add_many_solution(self, others):
+        M = self._get_system_linear_combination(tuple(others), sum(op.order() for op in [self]+list(others))+1)
+        v = self._get_element_nullspace(M)
+
+        return self.__class__(self.base(), [el for el in v], self.derivate())
         
     def _compute_mult_solution(self, other):
         M = self._get_system_product(other,self.order()*other.order()+1, False)
@@ -102,11 +112,12 @@ class TwoStepsOperator(ListOperator):
     def _compute_simple_add_solution(self, other, bound=5):
         order = self.order()+other.order(); i = 0
         ring = self.noetherian_ring(other)
-        solution = None
+        solution = None; solver = None
         while((solution is None) and (i < bound)):
             A,b = self._get_system_addition(other, order+i, True)
             try:
-                solution = self._solve_linear_system(A,b,ring)
+                solver = self._get_linear_solver(A,b,ring,solver)
+                solution = solver.solution()
                 den_lcm = lcm([el.denominator() for el in solution])
                 solution = [(-el.numerator()*den_lcm)//el.denominator() for el in solution]
             except ValueError: # No solution to the system
@@ -117,11 +128,12 @@ class TwoStepsOperator(ListOperator):
     def _compute_simple_mult_solution(self, other, bound = 5):
         order = self.order()+other.order(); i = 0
         ring = self.noetherian_ring(other)
-        solution = None
+        solution = None; solver = None
         while((solution is None) and (i < bound)):
             A,b = self._get_system_product(other, order+i, True)
             try:
-                solution = self._solve_linear_system(A,b,ring)
+                solver = self._get_linear_solver(A,b,ring,solver)
+                solution = solver.solution()
                 den_lcm = lcm([el.denominator() for el in solution])
                 solution = [(-el.numerator()*den_lcm)//el.denominator() for el in solution]
             except ValueError: # No solution to the system
@@ -132,11 +144,12 @@ class TwoStepsOperator(ListOperator):
     def _compute_simple_derivative_solution(self, bound = 5):
         order = self.order(); i = 0
         ring = self.noetherian_ring()
-        solution = None
+        solution = None; solver = None
         while((solution is None) and (i < bound)):
             A,b = self._get_system_derivative(order+i, True)
             try:
-                solution = self._solve_linear_system(A,b,ring)
+                solver = self._get_linear_solver(A,b,ring,solver)
+                solution = solver.solution()
                 den_lcm = lcm([el.denominator() for el in solution])
                 solution = [(-el.numerator()*den_lcm)//el.denominator() for el in solution]
             except ValueError: # No solution to the system
@@ -167,9 +180,10 @@ class TwoStepsOperator(ListOperator):
 
             OUTPUT:
 
-            A derivation matrix of the module `M`.
+            A derivation matrix of the module `M` given as a :class:`~ajpastor.misc.matrix.CompanionMatrix`.
         '''
-        return self._pre_proc(self.companion())
+        from ajpastor.misc.matrix import CompanionMatrix
+        return CompanionMatrix.from_matrix(self._pre_proc(self.companion()))
 
     def _get_derivation_matrix_addition(self, other):
         r'''
@@ -194,16 +208,45 @@ class TwoStepsOperator(ListOperator):
 
             OUTPUT:
 
-            A derivation matrix of the module `M`.
+            A derivation matrix of the module `M` given as a :class:`~ajpastor.misc.matrix.DirectSumMatrix`.
         '''
-        from ajpastor.misc.matrix import diagonal_matrix as diagonal
+        from ajpastor.misc.matrix import CompanionMatrix, DirectSumMatrix
         Mf = self.companion()
         Mg = other.companion()
         
-        Mf, Mg, parent = self._mix_matrices(other, Mf, Mg)
+        Mf, Mg, _ = self._mix_matrices(other, Mf, Mg)
         
-        full_companion = diagonal(parent, [Mf,Mg])
-        return self._pre_proc(full_companion)
+        Cf = CompanionMatrix.from_matrix(self._pre_proc(Mf)); Cg = CompanionMatrix.from_matrix(self._pre_proc(Mg))
+        return DirectSumMatrix(pushout(Cf.base_ring(), Cg.base_ring()), [Cf, Cg])
+
+    def _get_derivation_matrix_linear_combination(self, others):
+        r'''
+            Method to get the derivation matrix of the addition module of several equations
+
+            This method computes a derivation matrix for the D-module generated by the solutions
+            of ``self`` and all the operators in ``others``. Namely, if `f_0(x)` is a solution to
+            ``self`` and `f_i(x)` is a solution to the `i`-th operator in ``others``, then we can 
+            consider the module:
+
+            .. MATH::
+
+                M = \langle f_0, \partial(f_0),\ldots\rangle + \ldots + \langle f_k, \partial(f_k),\ldots\rangle
+
+            which is a finitely generated module. Then the derivation matrix allows to compute 
+            derivatives within this module.
+
+            In particular, this derivation matrix is `\mathcal{C}_{f_0} \oplus \ldots \oplus \mathcal{C}_{f_k}`.
+
+            INPUT:
+                * ``others``: list of operators for the rest of operands.
+
+            OUTPUT:
+
+            A derivation matrix of the module `M` given as a :class:`~ajpastor.misc.matrix.DirectSumMatrix`.
+        '''
+        from ajpastor.misc.matrix import DirectSumMatrix
+        blocks = [op._get_derivation_matrix_self() for op in [self]+list(others)]
+        return DirectSumMatrix(reduce(pushout, [block.base_ring() for block in blocks]), blocks)
 
     def _get_derivation_matrix_product(self, other):
         r'''
@@ -229,16 +272,17 @@ class TwoStepsOperator(ListOperator):
 
             OUTPUT:
 
-            A derivation matrix of the module `M`.
+            A derivation matrix of the module `M` given as a :class:`~ajpastor.misc.matrix.KroneckerSumMatrix`.
         '''        
+        from ajpastor.misc.matrix import CompanionMatrix, KroneckerSumMatrix
         Mf = self.companion()
         Mg = other.companion()
         
-        Mf, Mg, parent = self._mix_matrices(other, Mf, Mg)
+        Mf, Mg, _ = self._mix_matrices(other, Mf, Mg)
         
-        ## Using tensor product for Kronecker sum
-        full_companion = Mf.tensor_product(Matrix.identity(parent, Mg.nrows())) + Matrix.identity(parent, Mf.nrows()).tensor_product(Mg)
-        return self._pre_proc(full_companion)
+        ## Using the structure of the Kronecker sum (no dense matrix is built)
+        Cf = CompanionMatrix.from_matrix(self._pre_proc(Mf)); Cg = CompanionMatrix.from_matrix(self._pre_proc(Mg))
+        return KroneckerSumMatrix(pushout(Cf.base_ring(), Cg.base_ring()), Cf, Cg)
 
     def _get_vector_addition(self, other):
         r'''
@@ -268,6 +312,24 @@ class TwoStepsOperator(ListOperator):
             ([1] + [0 for i in range(self.order()-1)])+
             ([1] + [0 for i in range(other.order()-1)])))
 
+    def _get_vector_linear_combination(self, others):
+        r'''
+            Method that return the addition of solutions represented in the D-module of ``self`` and ``others``.
+
+            This method computes a vector that represent the addition of solutions to ``self`` and
+            all the operators in ``others`` for the D-module generated by all their solutions (see
+            method :func:`_get_derivation_matrix_linear_combination`).
+
+            INPUT:
+                * ``others``: list of operators for the rest of operands.
+
+            OUTPUT:
+
+            The vector representing `f_0(x)+\ldots+f_k(x)` in the corresponding module.
+        '''
+        return self._pre_proc(vector(
+            sum([[1] + [0 for i in range(op.order()-1)] for op in [self]+list(others)], [])))
+
     def _get_vector_product(self, other):
         r'''
             Method that return the product represented in the D-module of ``self`` and ``other``.
@@ -446,6 +508,38 @@ class TwoStepsOperator(ListOperator):
         else:
             return self._post_proc(system)
         
+    @cached_method
+    def _get_system_linear_combination(self, others, ncols):
+        r'''
+            Method to compute an ansatz system for the addition of several functions.
+
+            This method computes an ansatz system for the addition of solutions to ``self`` and 
+            each of the operators in ``others``. Contrary to the method :func:`_get_system_addition`,
+            the system is built at once in the direct sum of all the modules (see method
+            :func:`_get_derivation_matrix_linear_combination`), so the linear relation
+            for `h(x) = f_0(x) + \ldots + f_k(x)` and its derivatives can be computed with only
+            one nullspace computation.
+
+            INPUT:
+                * ``others``: tuple of operators for the rest of operands.
+                * ``ncols``: size of the desired system (in number of columns)
+
+            OUTPUT:
+
+            The ansazt system for compute a linear relation with `\partial^{ncols-1}(h(x))` 
+            and its previous derivatives within the module.
+        '''
+        from ajpastor.misc.matrix import matrix_of_dMovement as move
+
+        ## Controlling the input ncols
+        if(ncols < 0):
+            raise ValueError("The number of columns must be a natural number")
+
+        d_matrix = self._get_derivation_matrix_linear_combination(others)
+        v = self._get_vector_linear_combination(others)
+
+        return self._post_proc(move(d_matrix, v, self.derivate(), ncols))
+        
     def _get_matrix_composition(self, other):
         from ajpastor.misc.matrix import matrix_of_dMovement as move
     
@@ -503,6 +597,19 @@ class TwoStepsOperator(ListOperator):
             ring `R[\alpha_1,\ldots,\alpha_n]_{\gamma_1,\ldots,\gamma_k}`.
         '''        
         raise NotImplementedError('Method not implemented. Class: %s' %self.__class__)
+
+    def _get_linear_solver(self, A, b, ring, previous=None):
+        r'''
+            Method that builds a :class:`~ajpastor.misc.linear_solver.LinearSystemSolver` for `A\alpha = \mathbf{b}`.
+
+            This method is used when looking for simple solutions (see :func:`_compute_simple_add_solution`),
+            where the systems grow with new columns if the previous system had no solution. 
+            The argument ``previous`` is the solver used for the previous (smaller) system or ``None``,
+            so its computations can be reused.
+
+            The argument ``ring`` has the same format as in :func:`_solve_linear_system`.
+        '''
+        raise NotImplementedError('Method not implemented. Class: %s' %self.__class__)
     ####################################################### 
     
 